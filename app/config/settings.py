@@ -13,4 +13,88 @@ class Settings:
     JWT_EXPIRE_MINUTES: int = int(os.getenv("JWT_EXPIRE_MINUTES", 2))
     REFRESH_EXPIRE_DAYS: int = int(os.getenv("REFRESH_TOKEN_EXPIRE_DAYS", 7))
 
+    # Connection pool
+    DB_POOL_SIZE: int = int(os.getenv("DB_POOL_SIZE", 5))
+    DB_MAX_OVERFLOW: int = int(os.getenv("DB_MAX_OVERFLOW", 10))
+    DB_POOL_TIMEOUT: int = int(os.getenv("DB_POOL_TIMEOUT", 30))
+    DB_POOL_RECYCLE: int = int(os.getenv("DB_POOL_RECYCLE", 1800))
+    DB_ASYNC_POOL_SIZE: int = int(os.getenv("DB_ASYNC_POOL_SIZE", 10))
+    DB_ASYNC_MAX_OVERFLOW: int = int(os.getenv("DB_ASYNC_MAX_OVERFLOW", 20))
+    DB_CONNECT_TIMEOUT: int = int(os.getenv("DB_CONNECT_TIMEOUT", 5))
+    # pre-ping costs one round-trip per checkout; off by default in favour of the idle ping below
+    DB_POOL_PRE_PING: bool = os.getenv("DB_POOL_PRE_PING", "false").lower() == "true"
+    # connections idle longer than this are pinged on checkout (0 disables)
+    DB_POOL_PING_IDLE_SECONDS: int = int(os.getenv("DB_POOL_PING_IDLE_SECONDS", 60))
+    # transaction pooling behind PgBouncer: no server-side prepared statements
+    DB_PGBOUNCER_MODE: bool = os.getenv("DB_PGBOUNCER_MODE", "false").lower() == "true"
+
+    # Auth caches
+    AUTH_TOKEN_CACHE_SIZE: int = int(os.getenv("AUTH_TOKEN_CACHE_SIZE", 10000))
+    AUTH_TOKEN_CACHE_TTL_SECONDS: int = int(os.getenv("AUTH_TOKEN_CACHE_TTL_SECONDS", 300))
+    AUTH_PRINCIPAL_CACHE_SIZE: int = int(os.getenv("AUTH_PRINCIPAL_CACHE_SIZE", 10000))
+    AUTH_PRINCIPAL_CACHE_TTL_SECONDS: int = int(os.getenv("AUTH_PRINCIPAL_CACHE_TTL_SECONDS", 30))
+
+    # Master data cache: how often a cached Master* table re-checks its watermark
+    MASTER_CACHE_CHECK_SECONDS: int = int(os.getenv("MASTER_CACHE_CHECK_SECONDS", 60))
+
+    # Password hashing
+    PASSWORD_HASH_SCHEME: str = os.getenv("PASSWORD_HASH_SCHEME", "argon2")
+    ARGON2_TIME_COST: int = int(os.getenv("ARGON2_TIME_COST", 2))
+    ARGON2_MEMORY_COST: int = int(os.getenv("ARGON2_MEMORY_COST", 19456))
+    ARGON2_PARALLELISM: int = int(os.getenv("ARGON2_PARALLELISM", 1))
+    BCRYPT_ROUNDS: int = int(os.getenv("BCRYPT_ROUNDS", 12))
+    PASSWORD_HASH_WORKERS: int = int(os.getenv("PASSWORD_HASH_WORKERS", 4))
+    PASSWORD_HASH_QUEUE: int = int(os.getenv("PASSWORD_HASH_QUEUE", 32))
+    PASSWORD_HASH_WAIT_SECONDS: float = float(os.getenv("PASSWORD_HASH_WAIT_SECONDS", 2))
+
+    # Key-value store for OTPs, reset tokens and rate limits ("memory" or "redis").
+    # "memory" is per process, for development with a single worker only; the
+    # redis backend works with any Redis-compatible server (plain SET/GET/DEL/INCR in MULTI).
+    KV_BACKEND: str = os.getenv("KV_BACKEND", "memory")
+    REDIS_URL: str = os.getenv("REDIS_URL", "redis://localhost:6379/0")
+    REDIS_MAX_CONNECTIONS: int = int(os.getenv("REDIS_MAX_CONNECTIONS", 50))
+    REDIS_SOCKET_TIMEOUT: float = float(os.getenv("REDIS_SOCKET_TIMEOUT", 2))
+    OTP_RATE_LIMIT: int = int(os.getenv("OTP_RATE_LIMIT", 5))
+    OTP_RATE_LIMIT_WINDOW_SECONDS: int = int(os.getenv("OTP_RATE_LIMIT_WINDOW_SECONDS", 900))
+    # wrong codes allowed per identifier and window before its OTP is revoked
+    OTP_VERIFY_ATTEMPTS: int = int(os.getenv("OTP_VERIFY_ATTEMPTS", 5))
+
+    # Allocation engine: freelancer index refresh check and candidate search radius
+    ALLOCATION_INDEX_CHECK_SECONDS: int = int(os.getenv("ALLOCATION_INDEX_CHECK_SECONDS", 60))
+    ALLOCATION_MAX_RADIUS_KM: float = float(os.getenv("ALLOCATION_MAX_RADIUS_KM", 25))
+    # open jobs a freelancer may hold at once, and ranked candidates tried per booking
+    FREELANCER_MAX_ACTIVE_JOBS: int = int(os.getenv("FREELANCER_MAX_ACTIVE_JOBS", 5))
+    ALLOCATION_CANDIDATES: int = int(os.getenv("ALLOCATION_CANDIDATES", 10))
+    ALLOCATION_BATCH_MAX: int = int(os.getenv("ALLOCATION_BATCH_MAX", 200))
+    ALLOCATION_WORKER_INTERVAL_SECONDS: float = float(os.getenv("ALLOCATION_WORKER_INTERVAL_SECONDS", 5))
+    ALLOCATION_WORKER_METRICS_PORT: int = int(os.getenv("ALLOCATION_WORKER_METRICS_PORT", 0))
+
+    # Vector search: default recall/speed trade-off for the ai_documents ANN indexes
+    VECTOR_HNSW_EF_SEARCH: int = int(os.getenv("VECTOR_HNSW_EF_SEARCH", 40))
+    VECTOR_IVFFLAT_PROBES: int = int(os.getenv("VECTOR_IVFFLAT_PROBES", 10))
+    # "hashing" (built in) or "sentence-transformers" (needs the package and a 384-dim model)
+    EMBEDDER: str = os.getenv("EMBEDDER", "hashing")
+    EMBEDDING_MODEL: str = os.getenv("EMBEDDING_MODEL", "sentence-transformers/all-MiniLM-L6-v2")
+    # Text search: pg_trgm match threshold (0-1); lower = more typo tolerant, more rows
+    SEARCH_TRGM_THRESHOLD: float = float(os.getenv("SEARCH_TRGM_THRESHOLD", 0.3))
+
+    # Live bus tracking: flush interval to bus_tracking_status, fleet id refresh,
+    # seconds without a ping before a bus counts as offline, per-client event buffer
+    BUS_TRACKING_FLUSH_SECONDS: float = float(os.getenv("BUS_TRACKING_FLUSH_SECONDS", 5))
+    BUS_FLEET_REFRESH_SECONDS: float = float(os.getenv("BUS_FLEET_REFRESH_SECONDS", 60))
+    BUS_TRACKING_STALE_SECONDS: float = float(os.getenv("BUS_TRACKING_STALE_SECONDS", 120))
+    BUS_SUBSCRIBER_QUEUE: int = int(os.getenv("BUS_SUBSCRIBER_QUEUE", 100))
+    # shared secret sent by bus telemetry devices in X-Device-Token; pings are rejected while it is unset
+    BUS_TELEMETRY_TOKEN: str = os.getenv("BUS_TELEMETRY_TOKEN", "")
+    # Bus alerts: repeats of an open (bus_id, alert_type) within the window are folded into one row
+    BUS_ALERT_DEDUP_SECONDS: float = float(os.getenv("BUS_ALERT_DEDUP_SECONDS", 300))
+
+    # Payroll runs: staff per committed chunk; a crashed run resumes after the last chunk
+    PAYROLL_RUN_CHUNK_SIZE: int = int(os.getenv("PAYROLL_RUN_CHUNK_SIZE", 5000))
+    # Bulk student import: valid rows per INSERT/commit, and how many row errors the report lists
+    STUDENT_IMPORT_BATCH_SIZE: int = int(os.getenv("STUDENT_IMPORT_BATCH_SIZE", 1000))
+    STUDENT_IMPORT_MAX_ERRORS: int = int(os.getenv("STUDENT_IMPORT_MAX_ERRORS", 1000))
+    # Batch attendance: most (user_id, date, present) records accepted per request
+    ATTENDANCE_BATCH_MAX_RECORDS: int = int(os.getenv("ATTENDANCE_BATCH_MAX_RECORDS", 20000))
+
 settings = Settings()
@@ -1,9 +1,12 @@
+import asyncio
 from fastapi import FastAPI
 from fastapi.middleware.cors import CORSMiddleware
 from dotenv import load_dotenv
 from models import generated_models 
 
-from core.database import Base, engine
+from app.config.settings import settings
+from core.database import Base, engine, async_engine
+from services.bus_tracking_service import bus_tracker
 
 from routes.user_registration_route import router as user_registration_router
 # from routes.dashboard_route import router as dashboard_router
@@ -26,16 +29,29 @@ from routes.institute_management_route import router as institute_management_rou
 from routes.partner_registration_route import router as partner_registration_router
 from routes.my_food_route import router as my_food_router
 from routes.my_food_partner_route import router as my_food_partner_router
+from routes.internal_route import router as internal_router
+from routes.master_data_route import router as master_data_router
+from routes.ai_search_route import router as ai_search_router
+from routes.search_route import router as search_router
+from routes.bus_tracking_route import router as bus_tracking_router
 
 load_dotenv()
 Base.metadata.create_all(bind=engine)
 app = FastAPI(title="Swachify India API",version="1.0.0")
-app.add_middleware(CORSMiddleware,allow_origins=["*"],allow_credentials=False,allow_methods=["*"],allow_headers=["*"],)
+app.add_middleware(CORSMiddleware,allow_origins=["*"],allow_credentials=False,allow_methods=["*"],allow_headers=["*"],expose_headers=["ETag","X-Next-Cursor","X-Total-Count"],)
 
 @app.on_event("startup")
 def startup_event():
+    bus_tracker.start()
+    if not settings.BUS_TELEMETRY_TOKEN:
+        print("WARNING: BUS_TELEMETRY_TOKEN is not set; bus position pings will be rejected")
     print("Swachify API started successfully!")
 
+@app.on_event("shutdown")
+async def shutdown_event():
+    await asyncio.to_thread(bus_tracker.stop)
+    await async_engine.dispose()
+
 app.include_router(user_registration_router)
 # app.include_router(dashboard_router)
 app.include_router(allocation_router)
@@ -56,5 +72,10 @@ app.include_router(payment_router)
 app.include_router(partner_registration_router)
 app.include_router(my_food_router)
 app.include_router(my_food_partner_router)
+app.include_router(master_data_router)
+app.include_router(ai_search_router)
+app.include_router(search_router)
+app.include_router(bus_tracking_router)
+app.include_router(internal_router)
 # app.include_router(application_router)
 # app.include_router(student_profile_router)
@@ -0,0 +1,145 @@
+"""
+Stress auto-allocation under concurrency and check that nothing is double-booked.
+
+Every pending booking is auto-allocated twice at the same time (two racing
+requests), across a pool of worker threads. Afterwards the run checks that:
+  - each booking was allocated by exactly one request
+  - no freelancer is over FREELANCER_MAX_ACTIVE_JOBS
+  - freelancer_stats.active_jobs matches the open bookings actually assigned
+Then the touched bookings are put back to pending and freelancer_stats is
+rebuilt, so the next thread count runs on the same data.
+
+Run against a staging database that has pending bookings and approved freelancers.
+
+Usage:
+    python -m benchmarks.allocation_concurrency --bookings 500 --threads 1,2,4,8
+"""
+import argparse
+import time
+from collections import Counter
+from concurrent.futures import ThreadPoolExecutor
+
+from fastapi import HTTPException
+from sqlalchemy import func, select, update
+
+from app.config.settings import settings
+from core.constants import BOOKING_STATUS_ASSIGNED, BOOKING_STATUS_PENDING, WORK_STATUS_JOB_COMPLETED
+from core.database import SessionLocal
+from models.generated_models import FreelancerStats, HomeServiceBooking
+from services.allocation_service import auto_allocate_employee
+from services.freelancer_stats_service import rebuild_freelancer_stats
+
+
+def pending_bookings(limit: int) -> list:
+    with SessionLocal() as db:
+        return db.execute(
+            select(HomeServiceBooking.id, HomeServiceBooking.created_by)
+            .where(
+                HomeServiceBooking.assigned_to.is_(None),
+                HomeServiceBooking.status_id == BOOKING_STATUS_PENDING,
+                HomeServiceBooking.is_active.is_(True)
+            )
+            .order_by(HomeServiceBooking.id)
+            .limit(limit)
+        ).all()
+
+
+def allocate(booking):
+    booking_id, created_by = booking
+    db = SessionLocal()
+    try:
+        result = auto_allocate_employee(db, booking_id, created_by)
+        return booking_id, result["assigned_to"]
+    except HTTPException:
+        return booking_id, None
+    finally:
+        db.close()
+
+
+def verify(results: list) -> list:
+    errors = []
+    wins = Counter(booking_id for booking_id, freelancer_id in results if freelancer_id)
+    errors += [f"booking {b} allocated {n} times" for b, n in wins.items() if n > 1]
+
+    with SessionLocal() as db:
+        open_jobs = dict(db.execute(
+            select(HomeServiceBooking.assigned_to, func.count())
+            .where(
+                HomeServiceBooking.assigned_to.isnot(None),
+                HomeServiceBooking.status_id == BOOKING_STATUS_ASSIGNED,
+                func.coalesce(HomeServiceBooking.work_status_id, 0) != WORK_STATUS_JOB_COMPLETED,
+                HomeServiceBooking.is_active.is_(True)
+            )
+            .group_by(HomeServiceBooking.assigned_to)
+        ).all())
+        stats = dict(db.execute(select(FreelancerStats.freelancer_id, FreelancerStats.active_jobs)).all())
+
+    for freelancer_id in {f for _, f in results if f}:
+        if stats.get(freelancer_id, 0) > settings.FREELANCER_MAX_ACTIVE_JOBS:
+            errors.append(f"freelancer {freelancer_id} over capacity: {stats[freelancer_id]}")
+        if stats.get(freelancer_id, 0) != open_jobs.get(freelancer_id, 0):
+            errors.append(
+                f"freelancer {freelancer_id} stats say {stats.get(freelancer_id, 0)} open jobs, "
+                f"bookings say {open_jobs.get(freelancer_id, 0)}"
+            )
+    return errors
+
+
+def reset(results: list):
+    allocated = [booking_id for booking_id, freelancer_id in results if freelancer_id]
+    freelancers = {freelancer_id for _, freelancer_id in results if freelancer_id}
+    with SessionLocal() as db:
+        db.execute(
+            update(HomeServiceBooking)
+            .where(HomeServiceBooking.id.in_(allocated))
+            .values(assigned_to=None, status_id=BOOKING_STATUS_PENDING, work_status_id=None)
+        )
+        db.commit()
+        for freelancer_id in freelancers:
+            rebuild_freelancer_stats(db, freelancer_id)
+
+
+def run(bookings: list, threads: int) -> dict:
+    # each booking is submitted twice so the two requests race for it
+    work = [b for b in bookings for _ in range(2)]
+    start = time.perf_counter()
+    with ThreadPoolExecutor(max_workers=threads) as pool:
+        results = list(pool.map(allocate, work))
+    elapsed = time.perf_counter() - start
+
+    errors = verify(results)
+    allocated = sum(1 for _, f in results if f)
+    reset(results)
+    return {"elapsed": elapsed, "allocated": allocated, "errors": errors}
+
+
+def main():
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--bookings", type=int, default=500)
+    parser.add_argument("--threads", default="1,2,4,8")
+    args = parser.parse_args()
+
+    bookings = pending_bookings(args.bookings)
+    if not bookings:
+        print("no pending bookings to allocate")
+        return
+
+    # start from stats that match the bookings table
+    with SessionLocal() as db:
+        rebuild_freelancer_stats(db)
+
+    print(f"bookings={len(bookings)} requests={2 * len(bookings)} capacity={settings.FREELANCER_MAX_ACTIVE_JOBS}")
+    for threads in (int(t) for t in args.threads.split(",")):
+        result = run(bookings, threads)
+        status = "OK" if not result["errors"] else f"{len(result['errors'])} violations"
+        print(
+            f"threads={threads:3}: {result['allocated']} allocated, "
+            f"{result['allocated'] / result['elapsed']:.0f} allocations/s, "
+            f"{2 * len(bookings) / result['elapsed']:.0f} requests/s, {status}"
+        )
+        for error in result["errors"][:10]:
+            print("   ", error)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,198 @@
+"""
+Load test for live bus tracking: thousands of simulated buses pinging while
+parent apps read positions and hold push subscriptions.
+
+In-process mode (default) drives services.bus_tracking_service.BusTracker
+directly: a pinger thread sends one batch per tick (every bus moves each
+--tick seconds), reader threads hammer overview/get, and asyncio subscribers
+count the events they receive. No database is needed: the periodic flush is
+not started, which also shows that reads never depend on Postgres.
+
+HTTP mode (--url) runs the same pattern against a running API instance
+(POST /pings, GET /live/{bus_id}); start the server with one worker and
+BUS_TELEMETRY_TOKEN matching --token if set. The buses must exist in bus_fleet.
+
+Usage:
+    python -m benchmarks.bus_tracking_load --buses 5000 --seconds 20 --readers 8 --subscribers 500
+    python -m benchmarks.bus_tracking_load --url http://localhost:8000 --buses 2000 --seconds 20
+"""
+import argparse
+import asyncio
+import random
+import statistics
+import threading
+import time
+
+import requests
+
+from services.bus_tracking_service import BusTracker
+
+PREFIX = "/institution/bus-tracking"
+
+
+def percentile(values: list, pct: float) -> float:
+    ordered = sorted(values)
+    return ordered[min(len(ordered) - 1, int(round(pct / 100 * (len(ordered) - 1))))]
+
+
+def report(label: str, latencies_ms: list):
+    if not latencies_ms:
+        print(f"{label:18}: no samples")
+        return
+    print(
+        f"{label:18}: n={len(latencies_ms)} p50={statistics.median(latencies_ms):.3f} ms "
+        f"p99={percentile(latencies_ms, 99):.3f} ms"
+    )
+
+
+class Fleet:
+    """Buses moving on random headings around a city centre."""
+
+    def __init__(self, buses: int, seed: int = 7):
+        rng = random.Random(seed)
+        self.rng = rng
+        self.ids = [f"BUS{i:05d}" for i in range(buses)]
+        self.positions = {bus_id: [17.385 + rng.uniform(-0.2, 0.2), 78.4867 + rng.uniform(-0.2, 0.2)] for bus_id in self.ids}
+
+    def batch(self) -> list:
+        pings = []
+        for bus_id, position in self.positions.items():
+            position[0] += self.rng.uniform(-0.0005, 0.0005)
+            position[1] += self.rng.uniform(-0.0005, 0.0005)
+            pings.append({
+                "bus_id": bus_id,
+                "latitude": round(position[0], 6),
+                "longitude": round(position[1], 6),
+                "current_speed": round(self.rng.uniform(0, 60), 2),
+                "eta_minutes": self.rng.randint(1, 40),
+                "status": "on_route",
+            })
+        return pings
+
+
+def run_in_process(args):
+    fleet = Fleet(args.buses)
+    tracker = BusTracker(flush_seconds=3600, fleet_refresh_seconds=3600, stale_seconds=120, subscriber_queue=1000)
+    tracker.set_fleet(fleet.ids)
+    stop = threading.Event()
+    ingest_ms, read_ms, overview_ms = [], [], []
+    received = [0]
+
+    def pinger():
+        while not stop.is_set():
+            started = time.perf_counter()
+            pings = fleet.batch()
+            for i in range(0, len(pings), args.batch_size):
+                t0 = time.perf_counter()
+                tracker.ingest(pings[i:i + args.batch_size])
+                ingest_ms.append((time.perf_counter() - t0) * 1000)
+            stop.wait(max(0.0, args.tick - (time.perf_counter() - started)))
+
+    def reader(seed: int):
+        rng = random.Random(seed)
+        while not stop.is_set():
+            t0 = time.perf_counter()
+            tracker.get(rng.choice(fleet.ids))
+            read_ms.append((time.perf_counter() - t0) * 1000)
+            if rng.random() < 0.001:
+                t0 = time.perf_counter()
+                tracker.overview()
+                overview_ms.append((time.perf_counter() - t0) * 1000)
+
+    async def subscribers():
+        subs = [tracker.subscribe({fleet.ids[i % len(fleet.ids)]}) for i in range(args.subscribers)]
+
+        async def drain(subscriber):
+            while True:
+                await subscriber.queue.get()
+                received[0] += 1
+
+        tasks = [asyncio.create_task(drain(s)) for s in subs]
+        await asyncio.sleep(args.seconds)
+        for subscriber in subs:
+            tracker.unsubscribe(subscriber)
+        for task in tasks:
+            task.cancel()
+
+    threads = [threading.Thread(target=pinger)] + [threading.Thread(target=reader, args=(i,)) for i in range(args.readers)]
+    for thread in threads:
+        thread.start()
+    asyncio.run(subscribers())
+    stop.set()
+    for thread in threads:
+        thread.join()
+
+    metrics = tracker.metrics
+    print(f"buses={args.buses} tick={args.tick}s batch={args.batch_size} readers={args.readers} subscribers={args.subscribers}")
+    print(f"pings accepted     : {metrics['accepted']} ({metrics['accepted'] / args.seconds:.0f}/s)")
+    report("ingest per batch", ingest_ms)
+    report("get(bus_id)", read_ms)
+    print(f"reads              : {len(read_ms) / args.seconds:.0f}/s")
+    report("overview()", overview_ms)
+    print(f"events delivered   : {received[0]} ({received[0] / args.seconds:.0f}/s)")
+
+
+def run_http(args):
+    fleet = Fleet(args.buses)
+    headers = {"X-Device-Token": args.token} if args.token else {}
+    stop = threading.Event()
+    ingest_ms, read_ms = [], []
+    rejected = set()
+
+    def pinger():
+        session = requests.Session()
+        while not stop.is_set():
+            started = time.perf_counter()
+            pings = fleet.batch()
+            for i in range(0, len(pings), args.batch_size):
+                t0 = time.perf_counter()
+                response = session.post(f"{args.url}{PREFIX}/pings", json={"pings": pings[i:i + args.batch_size]}, headers=headers)
+                ingest_ms.append((time.perf_counter() - t0) * 1000)
+                if response.ok:
+                    rejected.update(response.json()["rejected"])
+            stop.wait(max(0.0, args.tick - (time.perf_counter() - started)))
+
+    def reader(seed: int):
+        rng = random.Random(seed)
+        session = requests.Session()
+        while not stop.is_set():
+            t0 = time.perf_counter()
+            session.get(f"{args.url}{PREFIX}/live/{rng.choice(fleet.ids)}")
+            read_ms.append((time.perf_counter() - t0) * 1000)
+
+    threads = [threading.Thread(target=pinger)] + [threading.Thread(target=reader, args=(i,)) for i in range(args.readers)]
+    for thread in threads:
+        thread.start()
+    time.sleep(args.seconds)
+    stop.set()
+    for thread in threads:
+        thread.join()
+
+    print(f"url={args.url} buses={args.buses} tick={args.tick}s batch={args.batch_size} readers={args.readers}")
+    report("POST /pings", ingest_ms)
+    report("GET /live/{bus_id}", read_ms)
+    print(f"reads              : {len(read_ms) / args.seconds:.0f}/s")
+    if rejected:
+        print(f"rejected bus ids   : {len(rejected)} (not in bus_fleet)")
+
+
+def main():
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--buses", type=int, default=5000)
+    parser.add_argument("--seconds", type=float, default=20)
+    parser.add_argument("--tick", type=float, default=2.0, help="seconds between pings from each bus")
+    parser.add_argument("--batch-size", type=int, default=500)
+    parser.add_argument("--readers", type=int, default=8)
+    parser.add_argument("--subscribers", type=int, default=500, help="in-process mode only")
+    parser.add_argument("--url", help="run against a live API instead of in-process")
+    parser.add_argument("--token", help="X-Device-Token for --url")
+    args = parser.parse_args()
+
+    if args.url:
+        run_http(args)
+    else:
+        run_in_process(args)
+
+
+if __name__ == "__main__":
+    main()
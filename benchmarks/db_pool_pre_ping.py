@@ -0,0 +1,48 @@
+"""
+Measure what pool_pre_ping costs per checkout compared with the idle-only ping.
+
+Usage:
+    python -m benchmarks.db_pool_pre_ping --checkouts 5000
+"""
+import argparse
+import time
+
+from sqlalchemy import create_engine, text
+
+from core.database import DATABASE_URL
+from core.db_pool import InstrumentedQueuePool, attach_pool_metrics
+
+
+def run(pre_ping: bool, ping_idle_seconds: int, checkouts: int) -> dict:
+    engine = create_engine(DATABASE_URL, poolclass=InstrumentedQueuePool, pool_size=5, max_overflow=0, pool_pre_ping=pre_ping)
+    metrics = attach_pool_metrics(engine, f"bench-{pre_ping}-{ping_idle_seconds}", ping_idle_seconds)
+
+    with engine.connect() as conn:
+        conn.execute(text("SELECT 1"))
+
+    start = time.perf_counter()
+    for _ in range(checkouts):
+        with engine.connect() as conn:
+            conn.execute(text("SELECT 1"))
+    elapsed = time.perf_counter() - start
+    snapshot = metrics.snapshot(engine.pool)
+    engine.dispose()
+    return {"per_request_ms": elapsed / checkouts * 1000, "pings": snapshot["pings"]}
+
+
+def main():
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--checkouts", type=int, default=5000)
+    args = parser.parse_args()
+
+    with_pre_ping = run(True, 0, args.checkouts)
+    idle_ping = run(False, 60, args.checkouts)
+
+    print(f"checkouts={args.checkouts}")
+    print(f"pool_pre_ping=True : {with_pre_ping['per_request_ms']:.3f} ms/request")
+    print(f"idle ping (60s)    : {idle_ping['per_request_ms']:.3f} ms/request, pings={idle_ping['pings']}")
+    print(f"saved per request  : {with_pre_ping['per_request_ms'] - idle_ping['per_request_ms']:.3f} ms")
+
+
+if __name__ == "__main__":
+    main()
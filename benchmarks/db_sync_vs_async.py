@@ -0,0 +1,73 @@
+"""
+Compare sync (threadpool + SessionLocal) and async (asyncpg + AsyncSessionLocal)
+throughput for the hot read queries.
+
+Usage:
+    python -m benchmarks.db_sync_vs_async --requests 2000 --concurrency 50
+"""
+import argparse
+import asyncio
+import time
+from concurrent.futures import ThreadPoolExecutor
+
+from sqlalchemy import text
+
+from core.database import SessionLocal, AsyncSessionLocal, async_engine, engine
+
+QUERIES = {
+    "hospitals": "SELECT * FROM fn_get_available_hospitals()",
+    "bookings": "SELECT * FROM fn_get_all_home_service_bookings()",
+    "partner_orders": "SELECT * FROM fn_get_partner_order_counts(1)",
+}
+
+
+def run_sync(sql: str, total: int, concurrency: int) -> float:
+    def one_call(_):
+        db = SessionLocal()
+        try:
+            db.execute(text(sql)).mappings().all()
+        finally:
+            db.close()
+
+    start = time.perf_counter()
+    with ThreadPoolExecutor(max_workers=concurrency) as pool:
+        list(pool.map(one_call, range(total)))
+    return total / (time.perf_counter() - start)
+
+
+async def run_async(sql: str, total: int, concurrency: int) -> float:
+    semaphore = asyncio.Semaphore(concurrency)
+
+    async def one_call():
+        async with semaphore:
+            async with AsyncSessionLocal() as db:
+                result = await db.execute(text(sql))
+                result.mappings().all()
+
+    start = time.perf_counter()
+    await asyncio.gather(*(one_call() for _ in range(total)))
+    elapsed = time.perf_counter() - start
+    await async_engine.dispose()
+    return total / elapsed
+
+
+def main():
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--requests", type=int, default=2000)
+    parser.add_argument("--concurrency", type=int, default=50)
+    parser.add_argument("--query", choices=list(QUERIES), default="hospitals")
+    args = parser.parse_args()
+
+    sql = QUERIES[args.query]
+    sync_rps = run_sync(sql, args.requests, args.concurrency)
+    engine.dispose()
+    async_rps = asyncio.run(run_async(sql, args.requests, args.concurrency))
+
+    print(f"query={args.query} requests={args.requests} concurrency={args.concurrency}")
+    print(f"sync  : {sync_rps:10.1f} req/s")
+    print(f"async : {async_rps:10.1f} req/s")
+    print(f"ratio : {async_rps / sync_rps:10.2f}x")
+
+
+if __name__ == "__main__":
+    main()
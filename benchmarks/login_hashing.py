@@ -0,0 +1,75 @@
+"""
+Compare login password verification latency for legacy sha256_crypt hashes
+against the configured scheme, under concurrent logins.
+
+Each request verifies through utils.hash_utils the way the login routes do
+(awaited on the event loop), so the numbers include the bounded hashing
+executor and its admission limit.
+
+Usage:
+    python -m benchmarks.login_hashing --requests 400 --concurrency 32
+"""
+import argparse
+import asyncio
+import statistics
+import time
+
+from fastapi import HTTPException
+from passlib.context import CryptContext
+
+from utils.hash_utils import hash_password, verify_and_rehash_async
+
+PASSWORD = "bench-Password-123"
+
+
+def percentile(values: list, pct: float) -> float:
+    ordered = sorted(values)
+    index = min(len(ordered) - 1, int(round(pct / 100 * (len(ordered) - 1))))
+    return ordered[index]
+
+
+async def run(stored_hash: str, requests: int, concurrency: int) -> dict:
+    gate = asyncio.Semaphore(concurrency)
+
+    async def one_login():
+        async with gate:
+            start = time.perf_counter()
+            try:
+                await verify_and_rehash_async(PASSWORD, stored_hash)
+            except HTTPException:
+                return None
+            return (time.perf_counter() - start) * 1000
+
+    start = time.perf_counter()
+    results = await asyncio.gather(*(one_login() for _ in range(requests)))
+    elapsed = time.perf_counter() - start
+
+    latencies = [r for r in results if r is not None]
+    return {
+        "p50_ms": statistics.median(latencies) if latencies else 0.0,
+        "p99_ms": percentile(latencies, 99) if latencies else 0.0,
+        "rejected": len(results) - len(latencies),
+        "logins_per_s": requests / elapsed,
+    }
+
+
+def main():
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--requests", type=int, default=400)
+    parser.add_argument("--concurrency", type=int, default=32)
+    args = parser.parse_args()
+
+    legacy_hash = CryptContext(schemes=["sha256_crypt"]).hash(PASSWORD)
+    current_hash = hash_password(PASSWORD)
+
+    print(f"requests={args.requests} concurrency={args.concurrency}")
+    for label, stored in (("sha256_crypt (legacy)", legacy_hash), ("configured scheme", current_hash)):
+        result = asyncio.run(run(stored, args.requests, args.concurrency))
+        print(
+            f"{label:22}: p50={result['p50_ms']:.1f} ms p99={result['p99_ms']:.1f} ms "
+            f"{result['logins_per_s']:.0f} logins/s rejected={result['rejected']}"
+        )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,156 @@
+"""
+Payroll throughput: one payslip per HTTP-style request vs the set-based run.
+
+Everything happens in a scratch schema (dropped afterwards) that holds empty
+copies of the payroll tables, created from the models, and every connection
+uses it through search_path; the real payroll data is never touched. The
+schema is filled with --staff synthetic staff, each with a previous month's
+payslip to carry forward. Amounts are small because salary_earnings keeps
+month totals in numeric(10,2) columns. Then:
+
+  per-row   create_staff_payslip-style ORM insert + commit per staff member,
+            for the first --per-row staff
+  run       run_payroll for the whole period (chunked, with --chunk-size)
+  rerun     run_payroll again for the same period, which must write nothing
+
+Usage:
+    python -m benchmarks.payroll_run --staff 20000 --per-row 1000 --chunk-size 5000
+"""
+import argparse
+import time
+from datetime import datetime
+
+from sqlalchemy import create_engine, text
+from sqlalchemy.orm import sessionmaker
+
+from core.database import DATABASE_URL
+from models.generated_models import (
+    Base,
+    PayrollPeriod,
+    PayrollRun,
+    PayrollSummary,
+    SalaryEarnings,
+    StaffPayslip,
+    StaffProfile,
+)
+from services.payroll_run_service import run_payroll
+
+SCHEMA = "bench_payroll"
+TABLES = [
+    StaffProfile.__table__,
+    StaffPayslip.__table__,
+    PayrollPeriod.__table__,
+    SalaryEarnings.__table__,
+    PayrollSummary.__table__,
+    PayrollRun.__table__,
+]
+
+
+def scratch_engine():
+    return create_engine(DATABASE_URL, connect_args={"options": f"-csearch_path={SCHEMA}"})
+
+
+def load_schema(engine, staff: int):
+    with engine.begin() as conn:
+        conn.execute(text(f"DROP SCHEMA IF EXISTS {SCHEMA} CASCADE"))
+        conn.execute(text(f"CREATE SCHEMA {SCHEMA}"))
+    Base.metadata.create_all(engine, tables=TABLES)
+
+    start = time.perf_counter()
+    with engine.begin() as conn:
+        conn.execute(text("""
+            INSERT INTO staff_profile (staff_id, staff_name, department)
+            SELECT 'S' || lpad(g::text, 7, '0'), 'Staff ' || g, 'Dept ' || (g % 20)
+            FROM generate_series(1, :staff) g
+        """), {"staff": staff})
+        conn.execute(text("""
+            INSERT INTO staff_payslip (
+                staff_id, payroll_month, basic_pay, hra, medical_allowance, conveyance,
+                gross_earnings, pf_deduction, income_tax, professional_tax, health_insurance,
+                total_deductions, net_salary, created_date
+            )
+            SELECT
+                staff_id, 'Previous', 3000, 1200, 125, 160,
+                4485, 360, 250, 20, 50, 680, 3805, now() - interval '30 days'
+            FROM staff_profile
+        """))
+        period_id = conn.execute(text("""
+            INSERT INTO payroll_period (month, year, start_date, end_date)
+            VALUES ('Bench', 2099, '2099-01-01', '2099-01-31')
+            RETURNING id
+        """)).scalar()
+    print(f"seeded {staff} staff + previous payslips: {time.perf_counter() - start:.1f}s")
+    return period_id
+
+
+def per_row(Session, count: int) -> float:
+    db = Session()
+    try:
+        staff_ids = db.execute(
+            text("SELECT staff_id FROM staff_profile ORDER BY staff_id LIMIT :n"), {"n": count}
+        ).scalars().all()
+        start = time.perf_counter()
+        for staff_id in staff_ids:
+            payslip = StaffPayslip(
+                staff_id=staff_id, payroll_month="PerRow", basic_pay=3000, hra=1200,
+                medical_allowance=125, conveyance=160, gross_earnings=4485, pf_deduction=360,
+                income_tax=250, professional_tax=20, health_insurance=50, total_deductions=680,
+                net_salary=3805, created_date=datetime.utcnow()
+            )
+            db.add(payslip)
+            db.commit()
+            db.refresh(payslip)
+        return time.perf_counter() - start
+    finally:
+        db.close()
+
+
+def timed_run(Session, period_id: int, chunk_size: int):
+    db = Session()
+    try:
+        start = time.perf_counter()
+        run = run_payroll(db, period_id, chunk_size=chunk_size)
+        return run, time.perf_counter() - start
+    finally:
+        db.close()
+
+
+def main():
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--staff", type=int, default=20000)
+    parser.add_argument("--per-row", type=int, default=1000)
+    parser.add_argument("--chunk-size", type=int, default=5000)
+    args = parser.parse_args()
+
+    engine = scratch_engine()
+    Session = sessionmaker(bind=engine, autoflush=False, expire_on_commit=False)
+    try:
+        period_id = load_schema(engine, args.staff)
+
+        if args.per_row:
+            seconds = per_row(Session, args.per_row)
+            print(f"per-row : {args.per_row} payslips in {seconds:.2f}s = {args.per_row / seconds:,.0f} payslips/s")
+
+        run, seconds = timed_run(Session, period_id, args.chunk_size)
+        print(
+            f"run     : {run.generated_payslips} payslips in {seconds:.2f}s = "
+            f"{run.generated_payslips / seconds:,.0f} payslips/s (chunk={args.chunk_size})"
+        )
+
+        run, seconds = timed_run(Session, period_id, args.chunk_size)
+        print(f"rerun   : {run.generated_payslips} new payslips in {seconds:.2f}s")
+
+        with engine.connect() as conn:
+            summary = conn.execute(
+                text("SELECT staff_count, total_net_disbursement FROM payroll_summary WHERE payroll_month = :m"),
+                {"m": run.payroll_month}
+            ).one()
+        print(f"summary : staff_count={summary.staff_count} total_net_disbursement={summary.total_net_disbursement}")
+    finally:
+        with engine.begin() as conn:
+            conn.execute(text(f"DROP SCHEMA IF EXISTS {SCHEMA} CASCADE"))
+        engine.dispose()
+
+
+if __name__ == "__main__":
+    main()
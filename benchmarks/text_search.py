@@ -0,0 +1,144 @@
+"""
+Keyword search latency: ILIKE '%term%' scans vs tsvector/trigram GIN indexes.
+
+Creates a scratch copy of the job_openings search shape (dropped afterwards),
+fills it with synthetic rows, builds the same generated column and indexes as
+migrations/008_text_search.sql, then times each query style for a set of
+terms, including misspellings that only trigram matching finds.
+
+Usage:
+    python -m benchmarks.text_search --rows 200000 --repeat 50
+    python -m benchmarks.text_search --terms "python developer,hyderbad,logistics"
+"""
+import argparse
+import random
+import statistics
+import time
+
+from sqlalchemy import text
+
+from core.database import SessionLocal
+
+TABLE = "bench_job_openings"
+
+COMPANY_WORDS = ["Acme", "Swift", "Bright", "Green", "Nova", "Prime", "Urban", "Blue", "Apex", "Vertex", "Zen", "Metro"]
+COMPANY_SUFFIXES = ["Technologies", "Logistics", "Foods", "Healthcare", "Services", "Labs", "Constructions", "Retail"]
+CITIES = ["Hyderabad", "Bengaluru", "Chennai", "Mumbai", "Pune", "Delhi", "Kolkata", "Ahmedabad", "Vijayawada", "Warangal"]
+ROLE_WORDS = [
+    "python", "developer", "backend", "frontend", "sales", "executive", "nurse", "driver", "accountant",
+    "cleaning", "supervisor", "electrician", "plumber", "marketing", "analyst", "support", "warehouse",
+]
+
+DEFAULT_TERMS = "python developer,logistics,hyderabad,hyderbad,accountant chennai"
+
+
+def synthetic_rows(rows: int, seed: int = 7):
+    rng = random.Random(seed)
+    for i in range(rows):
+        yield {
+            "company_name": f"{rng.choice(COMPANY_WORDS)} {rng.choice(COMPANY_SUFFIXES)} {i % 997}",
+            "company_address": f"{rng.randint(1, 999)} Main Road, {rng.choice(CITIES)}",
+            "role_description": " ".join(rng.choice(ROLE_WORDS) for _ in range(12)),
+        }
+
+
+def load_table(db, rows: int):
+    db.execute(text("CREATE EXTENSION IF NOT EXISTS pg_trgm"))
+    db.execute(text(f"DROP TABLE IF EXISTS {TABLE}"))
+    db.execute(text(f"""
+        CREATE TABLE {TABLE} (
+            id bigserial PRIMARY KEY,
+            company_name varchar(255) NOT NULL,
+            company_address varchar(255) NOT NULL,
+            role_description varchar(500),
+            search_vector tsvector GENERATED ALWAYS AS (
+                setweight(to_tsvector('english', coalesce(company_name, '')), 'A') ||
+                setweight(to_tsvector('english', coalesce(role_description, '')), 'B') ||
+                setweight(to_tsvector('english', coalesce(company_address, '')), 'C')
+            ) STORED
+        )
+    """))
+    start = time.perf_counter()
+    batch = []
+    for row in synthetic_rows(rows):
+        batch.append(row)
+        if len(batch) == 5000:
+            db.execute(text(f"INSERT INTO {TABLE} (company_name, company_address, role_description) VALUES (:company_name, :company_address, :role_description)"), batch)
+            batch = []
+    if batch:
+        db.execute(text(f"INSERT INTO {TABLE} (company_name, company_address, role_description) VALUES (:company_name, :company_address, :role_description)"), batch)
+    db.commit()
+    print(f"load {rows} rows: {time.perf_counter() - start:.1f}s")
+
+    start = time.perf_counter()
+    db.execute(text(f"CREATE INDEX ON {TABLE} USING gin (search_vector)"))
+    db.execute(text(f"CREATE INDEX ON {TABLE} USING gin (company_name gin_trgm_ops)"))
+    db.execute(text(f"CREATE INDEX ON {TABLE} USING gin (company_address gin_trgm_ops)"))
+    db.execute(text(f"ANALYZE {TABLE}"))
+    db.commit()
+    print(f"GIN builds: {time.perf_counter() - start:.1f}s")
+
+
+QUERIES = {
+    "ilike": f"""
+        SELECT id FROM {TABLE}
+        WHERE company_name ILIKE :pattern OR company_address ILIKE :pattern OR role_description ILIKE :pattern
+        ORDER BY id DESC LIMIT 20
+    """,
+    "fts": f"""
+        SELECT id FROM {TABLE}, websearch_to_tsquery('english', :q) tsq
+        WHERE search_vector @@ tsq
+        ORDER BY ts_rank_cd(search_vector, tsq) DESC, id DESC LIMIT 20
+    """,
+    "fts+trigram": f"""
+        SELECT id FROM {TABLE}, websearch_to_tsquery('english', :q) tsq
+        WHERE search_vector @@ tsq OR company_name % :q OR :q <% company_address
+        ORDER BY ts_rank_cd(search_vector, tsq) + greatest(similarity(company_name, :q), word_similarity(:q, company_address)) DESC, id DESC
+        LIMIT 20
+    """,
+}
+
+
+def percentile(values: list, pct: float) -> float:
+    ordered = sorted(values)
+    return ordered[min(len(ordered) - 1, int(round(pct / 100 * (len(ordered) - 1))))]
+
+
+def time_query(db, sql: str, term: str, repeat: int):
+    params = {"q": term, "pattern": f"%{term}%"}
+    latencies = []
+    hits = 0
+    for _ in range(repeat):
+        start = time.perf_counter()
+        hits = len(db.execute(text(sql), params).all())
+        latencies.append((time.perf_counter() - start) * 1000)
+    return latencies, hits
+
+
+def main():
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--rows", type=int, default=200000)
+    parser.add_argument("--repeat", type=int, default=50)
+    parser.add_argument("--terms", default=DEFAULT_TERMS, help="comma separated")
+    args = parser.parse_args()
+
+    db = SessionLocal()
+    try:
+        load_table(db, args.rows)
+        for term in args.terms.split(","):
+            print(f"\nterm={term!r}")
+            for label, sql in QUERIES.items():
+                latencies, hits = time_query(db, sql, term, args.repeat)
+                print(
+                    f"  {label:12}: p50={statistics.median(latencies):.2f} ms "
+                    f"p99={percentile(latencies, 99):.2f} ms hits={hits}"
+                )
+    finally:
+        db.rollback()
+        db.execute(text(f"DROP TABLE IF EXISTS {TABLE}"))
+        db.commit()
+        db.close()
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,123 @@
+"""
+Recall and latency of pgvector HNSW search against exact NumPy search, on
+synthetic clustered 384-dim vectors.
+
+The vectors are COPY-loaded into a scratch table (dropped afterwards), an HNSW
+cosine index is built, and every query is answered by both pgvector (for each
+ef_search value) and NumpyVectorIndex. Recall@k is the overlap with the exact
+top-k.
+
+Usage:
+    python -m benchmarks.vector_search --rows 100000 --queries 200 --k 10 --ef-search 20,40,100
+    python -m benchmarks.vector_search --numpy-only --rows 100000
+"""
+import argparse
+import statistics
+import time
+
+import numpy as np
+from sqlalchemy import text
+
+from core.database import SessionLocal
+from services.vector_search_service import EMBEDDING_DIM, NumpyVectorIndex, copy_chunks, vector_literal
+
+TABLE = "bench_ai_documents"
+
+
+def synthetic_vectors(rows: int, clusters: int, seed: int = 7) -> np.ndarray:
+    rng = np.random.default_rng(seed)
+    centers = rng.normal(size=(clusters, EMBEDDING_DIM)).astype(np.float32)
+    labels = rng.integers(0, clusters, size=rows)
+    return centers[labels] + 0.3 * rng.normal(size=(rows, EMBEDDING_DIM)).astype(np.float32)
+
+
+def percentile(values: list, pct: float) -> float:
+    ordered = sorted(values)
+    return ordered[min(len(ordered) - 1, int(round(pct / 100 * (len(ordered) - 1))))]
+
+
+def exact_search(index: NumpyVectorIndex, queries: np.ndarray, k: int):
+    latencies, results = [], []
+    for query in queries:
+        start = time.perf_counter()
+        hits = index.search(query, k=k)
+        latencies.append((time.perf_counter() - start) * 1000)
+        results.append({hit["chunk_id"] for hit in hits})
+    return results, latencies
+
+
+def load_table(db, vectors: np.ndarray):
+    db.execute(text(f"DROP TABLE IF EXISTS {TABLE}"))
+    db.execute(text(
+        f"CREATE TABLE {TABLE} (id bigserial PRIMARY KEY, doc_id varchar(150), chunk_id int, content text, "
+        f"embedding vector({EMBEDDING_DIM}), language varchar(50), metadata jsonb)"
+    ))
+    start = time.perf_counter()
+    copy_chunks(db, (("bench", i, "", v, None, None) for i, v in enumerate(vectors)), table=TABLE)
+    db.commit()
+    print(f"COPY {len(vectors)} rows: {time.perf_counter() - start:.1f}s")
+
+    start = time.perf_counter()
+    db.execute(text(f"CREATE INDEX ON {TABLE} USING hnsw (embedding vector_cosine_ops) WITH (m = 16, ef_construction = 64)"))
+    db.commit()
+    print(f"HNSW build: {time.perf_counter() - start:.1f}s")
+
+
+def pg_search(db, queries: np.ndarray, k: int, ef_search: int):
+    latencies, results = [], []
+    db.execute(text(f"SET hnsw.ef_search = {int(ef_search)}"))
+    for query in queries:
+        start = time.perf_counter()
+        rows = db.execute(
+            text(f"SELECT chunk_id FROM {TABLE} ORDER BY embedding <=> CAST(:q AS vector) LIMIT :k"),
+            {"q": vector_literal(query), "k": k}
+        ).scalars().all()
+        latencies.append((time.perf_counter() - start) * 1000)
+        results.append(set(rows))
+    return results, latencies
+
+
+def report(label: str, latencies: list, recall: float = None):
+    line = f"{label:22}: p50={statistics.median(latencies):.2f} ms p99={percentile(latencies, 99):.2f} ms"
+    if recall is not None:
+        line += f" recall@k={recall:.3f}"
+    print(line)
+
+
+def main():
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--rows", type=int, default=100000)
+    parser.add_argument("--queries", type=int, default=200)
+    parser.add_argument("--clusters", type=int, default=100)
+    parser.add_argument("--k", type=int, default=10)
+    parser.add_argument("--ef-search", default="20,40,100")
+    parser.add_argument("--numpy-only", action="store_true")
+    args = parser.parse_args()
+
+    vectors = synthetic_vectors(args.rows, args.clusters)
+    queries = synthetic_vectors(args.queries, args.clusters, seed=11)
+
+    index = NumpyVectorIndex()
+    index.add([{"chunk_id": i} for i in range(args.rows)], vectors)
+    truth, latencies = exact_search(index, queries, args.k)
+    print(f"rows={args.rows} queries={args.queries} k={args.k}")
+    report("numpy exact", latencies)
+    if args.numpy_only:
+        return
+
+    db = SessionLocal()
+    try:
+        load_table(db, vectors)
+        for ef_search in (int(v) for v in args.ef_search.split(",")):
+            results, latencies = pg_search(db, queries, args.k, ef_search)
+            recall = sum(len(r & t) for r, t in zip(results, truth)) / (args.k * len(truth))
+            report(f"pgvector ef_search={ef_search}", latencies, recall)
+    finally:
+        db.rollback()
+        db.execute(text(f"DROP TABLE IF EXISTS {TABLE}"))
+        db.commit()
+        db.close()
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,41 @@
+from sqlalchemy.orm import Session
+from app.config.settings import settings
+from models.generated_models import UserRegistration
+from utils.ttl_cache import TTLCache
+
+# Short-lived per-user principals used by the auth dependencies. Entries are
+# per-process, so services that change a user's role/status/credentials must
+# call invalidate_principal() after committing.
+_principal_cache = TTLCache(maxsize=settings.AUTH_PRINCIPAL_CACHE_SIZE,ttl=settings.AUTH_PRINCIPAL_CACHE_TTL_SECONDS)
+
+_EXCLUDED_COLUMNS = {"password"}
+
+
+def _snapshot_user(user: UserRegistration) -> UserRegistration:
+    # Transient copy with column values only: safe to share between requests
+    # and never attached to a session.
+    return UserRegistration(**{
+        column.key: getattr(user, column.key)
+        for column in UserRegistration.__mapper__.column_attrs
+        if column.key not in _EXCLUDED_COLUMNS
+    })
+
+
+def get_principal(db: Session, user_id: int):
+    user = _principal_cache.get(user_id)
+    if user is not None:
+        return user
+    row = db.query(UserRegistration).filter(UserRegistration.id == user_id).first()
+    if not row:
+        return None
+    user = _snapshot_user(row)
+    _principal_cache.set(user_id, user)
+    return user
+
+
+def invalidate_principal(user_id: int):
+    _principal_cache.pop(int(user_id))
+
+
+def clear_principals():
+    _principal_cache.clear()
@@ -1,9 +1,12 @@
-
 from sqlalchemy import create_engine
 from sqlalchemy.orm import sessionmaker, declarative_base
+from sqlalchemy.ext.asyncio import create_async_engine, async_sessionmaker, AsyncSession
 from dotenv import load_dotenv
 import os
 import urllib.parse
+from uuid import uuid4
+from app.config.settings import settings
+from core.db_pool import InstrumentedQueuePool, InstrumentedAsyncQueuePool, attach_pool_metrics
 
 load_dotenv()
 
@@ -17,15 +20,38 @@ USER_ENC = urllib.parse.quote_plus(DB_USER)
 PASSWORD_ENC = urllib.parse.quote_plus(DB_PASSWORD)
 
 DATABASE_URL = (f"postgresql://{USER_ENC}:{PASSWORD_ENC}"f"@{DB_HOST}:{DB_PORT}/{DB_NAME}")
+ASYNC_DATABASE_URL = (f"postgresql+asyncpg://{USER_ENC}:{PASSWORD_ENC}"f"@{DB_HOST}:{DB_PORT}/{DB_NAME}")
 
-engine = create_engine(DATABASE_URL,pool_size=5,max_overflow=10,pool_pre_ping=True,pool_recycle=1800,connect_args={"connect_timeout": 5 },isolation_level="READ COMMITTED",echo=False,         future=True,)
+engine = create_engine(DATABASE_URL,poolclass=InstrumentedQueuePool,pool_size=settings.DB_POOL_SIZE,max_overflow=settings.DB_MAX_OVERFLOW,pool_timeout=settings.DB_POOL_TIMEOUT,pool_pre_ping=settings.DB_POOL_PRE_PING,pool_recycle=settings.DB_POOL_RECYCLE,connect_args={"connect_timeout": settings.DB_CONNECT_TIMEOUT },isolation_level="READ COMMITTED",echo=False,         future=True,)
+attach_pool_metrics(engine, "sync", settings.DB_POOL_PING_IDLE_SECONDS)
 
 SessionLocal = sessionmaker(bind=engine,autocommit=False,autoflush=False,expire_on_commit=False,)
 Base = declarative_base()
 
+# Async engine for services that have been moved off the threadpool.
+# It has its own pool, so migrated routes do not compete with sync ones for connections.
+ASYNC_CONNECT_ARGS = {"timeout": settings.DB_CONNECT_TIMEOUT}
+if settings.DB_PGBOUNCER_MODE:
+    # PgBouncer transaction pooling hands each transaction a different server
+    # connection, so named prepared statements from asyncpg cannot be reused.
+    ASYNC_CONNECT_ARGS.update({
+        "statement_cache_size": 0,
+        "prepared_statement_cache_size": 0,
+        "prepared_statement_name_func": lambda: f"__asyncpg_{uuid4()}__",
+    })
+
+async_engine = create_async_engine(ASYNC_DATABASE_URL,poolclass=InstrumentedAsyncQueuePool,pool_size=settings.DB_ASYNC_POOL_SIZE,max_overflow=settings.DB_ASYNC_MAX_OVERFLOW,pool_timeout=settings.DB_POOL_TIMEOUT,pool_pre_ping=settings.DB_POOL_PRE_PING,pool_recycle=settings.DB_POOL_RECYCLE,connect_args=ASYNC_CONNECT_ARGS,isolation_level="READ COMMITTED",echo=False,)
+attach_pool_metrics(async_engine, "async", settings.DB_POOL_PING_IDLE_SECONDS)
+
+AsyncSessionLocal = async_sessionmaker(bind=async_engine,class_=AsyncSession,autoflush=False,expire_on_commit=False,)
+
 def get_db():
     db = SessionLocal()
     try:
         yield db
     finally:
         db.close()
+
+async def get_async_db():
+    async with AsyncSessionLocal() as db:
+        yield db
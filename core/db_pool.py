@@ -0,0 +1,148 @@
+import threading
+import time
+from sqlalchemy import event, exc
+from sqlalchemy.pool import QueuePool, AsyncAdaptedQueuePool
+
+# upper bounds (ms) of the checkout wait histogram; the last bucket is +Inf
+WAIT_BUCKETS_MS = (1, 5, 10, 25, 50, 100, 250, 500, 1000, 5000)
+
+
+class PoolMetrics:
+    def __init__(self, name: str):
+        self.name = name
+        self._lock = threading.Lock()
+        self.checkouts = 0
+        self.overflow_hits = 0
+        self.timeouts = 0
+        self.wait_total_ms = 0.0
+        self.wait_max_ms = 0.0
+        self.wait_buckets = [0] * (len(WAIT_BUCKETS_MS) + 1)
+        self.pings = 0
+        self.ping_failures = 0
+        self.ping_total_ms = 0.0
+
+    def record_checkout(self, wait_ms: float, overflow: bool):
+        index = len(WAIT_BUCKETS_MS)
+        for i, bound in enumerate(WAIT_BUCKETS_MS):
+            if wait_ms <= bound:
+                index = i
+                break
+        with self._lock:
+            self.checkouts += 1
+            self.wait_total_ms += wait_ms
+            self.wait_max_ms = max(self.wait_max_ms, wait_ms)
+            self.wait_buckets[index] += 1
+            if overflow:
+                self.overflow_hits += 1
+
+    def record_timeout(self):
+        with self._lock:
+            self.timeouts += 1
+
+    def record_ping(self, ping_ms: float, ok: bool):
+        with self._lock:
+            self.pings += 1
+            self.ping_total_ms += ping_ms
+            if not ok:
+                self.ping_failures += 1
+
+    def snapshot(self, pool) -> dict:
+        with self._lock:
+            histogram = {
+                f"le_{bound}ms": count
+                for bound, count in zip(WAIT_BUCKETS_MS, self.wait_buckets)
+            }
+            histogram["le_inf"] = self.wait_buckets[-1]
+            return {
+                "name": self.name,
+                "pool_size": pool.size(),
+                "checked_out": pool.checkedout(),
+                "checked_in": pool.checkedin(),
+                "overflow": pool.overflow(),
+                "checkouts": self.checkouts,
+                "overflow_hits": self.overflow_hits,
+                "timeouts": self.timeouts,
+                "wait_avg_ms": round(self.wait_total_ms / self.checkouts, 3) if self.checkouts else 0.0,
+                "wait_max_ms": round(self.wait_max_ms, 3),
+                "wait_histogram": histogram,
+                "pings": self.pings,
+                "ping_failures": self.ping_failures,
+                "ping_avg_ms": round(self.ping_total_ms / self.pings, 3) if self.pings else 0.0,
+            }
+
+
+class _InstrumentedPoolMixin:
+    metrics: PoolMetrics = None
+
+    def _do_get(self):
+        start = time.perf_counter()
+        try:
+            conn = super()._do_get()
+        except exc.TimeoutError:
+            if self.metrics:
+                self.metrics.record_timeout()
+            raise
+        if self.metrics:
+            wait_ms = (time.perf_counter() - start) * 1000
+            self.metrics.record_checkout(wait_ms, self.checkedout() > self.size())
+        return conn
+
+    def recreate(self):
+        # engine.dispose() swaps in a fresh pool; keep counting into the same metrics
+        new_pool = super().recreate()
+        new_pool.metrics = self.metrics
+        return new_pool
+
+
+class InstrumentedQueuePool(_InstrumentedPoolMixin, QueuePool):
+    pass
+
+
+class InstrumentedAsyncQueuePool(_InstrumentedPoolMixin, AsyncAdaptedQueuePool):
+    pass
+
+
+POOL_METRICS: dict = {}
+
+
+def attach_pool_metrics(engine, name: str, ping_idle_seconds: int = 0) -> PoolMetrics:
+    """Register checkout metrics for `engine` and ping connections that sat idle too long.
+
+    The idle ping replaces pool_pre_ping: only connections idle for more than
+    `ping_idle_seconds` pay the extra round-trip, busy connections go straight out.
+    """
+    sync_engine = getattr(engine, "sync_engine", engine)
+    metrics = PoolMetrics(name)
+    sync_engine.pool.metrics = metrics
+    POOL_METRICS[name] = (sync_engine, metrics)
+
+    @event.listens_for(sync_engine, "checkin")
+    def _on_checkin(dbapi_conn, conn_record):
+        conn_record.info["last_checkin"] = time.monotonic()
+
+    if ping_idle_seconds > 0:
+        @event.listens_for(sync_engine, "checkout")
+        def _on_checkout(dbapi_conn, conn_record, conn_proxy):
+            last_checkin = conn_record.info.get("last_checkin")
+            if last_checkin is None or time.monotonic() - last_checkin < ping_idle_seconds:
+                return
+            start = time.perf_counter()
+            cursor = dbapi_conn.cursor()
+            try:
+                cursor.execute("SELECT 1")
+            except Exception:
+                metrics.record_ping((time.perf_counter() - start) * 1000, False)
+                # pool discards this connection and retries with a fresh one
+                raise exc.DisconnectionError()
+            finally:
+                try:
+                    cursor.close()
+                except Exception:
+                    pass
+            metrics.record_ping((time.perf_counter() - start) * 1000, True)
+
+    return metrics
+
+
+def get_pool_metrics() -> list:
+    return [metrics.snapshot(sync_engine.pool) for sync_engine, metrics in POOL_METRICS.values()]
@@ -4,7 +4,8 @@ from sqlalchemy.orm import Session
 from core.database import get_db
 from core.security import bearer_scheme
 from utils.jwt_utils import verify_token
-from models.generated_models import UserRegistration
+from core.auth_cache import get_principal
+from core.constants import ADMIN_ROLE_ID
 
 
 def get_current_user(credentials: HTTPAuthorizationCredentials = Depends(bearer_scheme),db: Session = Depends(get_db)):
@@ -16,7 +17,7 @@ def get_current_user(credentials: HTTPAuthorizationCredentials = Depends(bearer_
             status_code=status.HTTP_401_UNAUTHORIZED,
             detail="Invalid authentication token"
         )
-    user = db.query(UserRegistration).filter(UserRegistration.id == int(user_id)).first()
+    user = get_principal(db, int(user_id))
     if not user:
         raise HTTPException(
             status_code=status.HTTP_401_UNAUTHORIZED,
@@ -27,13 +28,13 @@ def get_current_admin(credentials: HTTPAuthorizationCredentials = Depends(bearer
     token = credentials.credentials
     payload = verify_token(token)
     user_id = payload.get("sub") or payload.get("user_id")
-    role = payload.get("role")
-    if role != "admin":
+    # login tokens carry role_id (see admin_login_service), not a role name
+    if int(payload.get("role_id") or 0) != ADMIN_ROLE_ID or not user_id:
         raise HTTPException(
             status_code=status.HTTP_403_FORBIDDEN,
             detail="Admin access required"
         )
-    user = db.query(UserRegistration).filter(UserRegistration.id == int(user_id)).first()
+    user = get_principal(db, int(user_id))
     if not user:
         raise HTTPException(
             status_code=status.HTTP_401_UNAUTHORIZED,
@@ -51,7 +52,7 @@ def get_user_from_request(request: Request,db: Session = Depends(get_db)):
     token = auth_header.replace("Bearer ", "")
     payload = verify_token(token)
     user_id = payload.get("sub") or payload.get("user_id")
-    user = db.query(UserRegistration).filter(UserRegistration.id == int(user_id)).first()
+    user = get_principal(db, int(user_id))
     if not user:
         raise HTTPException(
             status_code=status.HTTP_401_UNAUTHORIZED,
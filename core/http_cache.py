@@ -0,0 +1,88 @@
+import hashlib
+import json
+import threading
+from fastapi import Request, Response
+from fastapi.encoders import jsonable_encoder
+from utils.ttl_cache import TTLCache
+
+# Process-local version counters for read-mostly data that is not covered by
+# the master registry. Write services bump them after commit.
+_data_versions = {}
+_versions_lock = threading.Lock()
+
+
+def bump_data_version(name: str):
+    with _versions_lock:
+        _data_versions[name] = _data_versions.get(name, 0) + 1
+
+
+def get_data_version(name: str) -> int:
+    return _data_versions.get(name, 0)
+
+
+class _CachedBody:
+    def __init__(self, version, body: bytes):
+        self.version = version
+        self.body = body
+        self.etag = '"' + hashlib.sha1(body).hexdigest() + '"'
+
+
+# Pre-serialized bodies by route key. An entry is reused while its data version
+# is unchanged, and for at most max_age seconds so other workers' writes show up.
+_bodies = TTLCache(maxsize=2048, ttl=60)
+
+
+def _serialize(data) -> bytes:
+    return json.dumps(jsonable_encoder(data), separators=(",", ":"), ensure_ascii=False).encode("utf-8")
+
+
+def _etag_matches(request: Request, etag: str) -> bool:
+    header = request.headers.get("if-none-match")
+    if not header:
+        return False
+    for candidate in header.split(","):
+        candidate = candidate.strip()
+        if candidate == "*" or candidate.removeprefix("W/") == etag:
+            return True
+    return False
+
+
+def _lookup(key, version):
+    entry = _bodies.get(key)
+    if entry is not None and entry.version == version:
+        return entry
+    return None
+
+
+def _store(key, version, data, max_age: int):
+    entry = _CachedBody(version, _serialize(data))
+    _bodies.set(key, entry, max_age)
+    return entry
+
+
+def _respond(request: Request, entry: _CachedBody, max_age: int, scope: str) -> Response:
+    headers = {"ETag": entry.etag, "Cache-Control": f"{scope}, max-age={max_age}"}
+    if _etag_matches(request, entry.etag):
+        return Response(status_code=304, headers=headers)
+    return Response(content=entry.body, media_type="application/json", headers=headers)
+
+
+def cached_response(request: Request, key, version, max_age: int, build, scope: str = "public") -> Response:
+    """
+    Serve `build()` as JSON with an ETag and Cache-Control header.
+
+    `key` identifies the route and its parameters, `version` the data it was
+    built from. The body is serialized once per version and a matching
+    If-None-Match gets a 304 with no body.
+    """
+    entry = _lookup(key, version)
+    if entry is None:
+        entry = _store(key, version, build(), max_age)
+    return _respond(request, entry, max_age, scope)
+
+
+async def cached_response_async(request: Request, key, version, max_age: int, build, scope: str = "public") -> Response:
+    entry = _lookup(key, version)
+    if entry is None:
+        entry = _store(key, version, await build(), max_age)
+    return _respond(request, entry, max_age, scope)
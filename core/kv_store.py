@@ -0,0 +1,164 @@
+import threading
+import time
+from abc import ABC, abstractmethod
+from typing import Optional
+from app.config.settings import settings
+
+
+class KVStore(ABC):
+    """
+    Minimal key-value interface for short-lived auth state: OTPs, reset tokens
+    and rate-limit counters. Values are strings; every key carries a TTL.
+    """
+
+    @abstractmethod
+    def get(self, key: str) -> Optional[str]:
+        ...
+
+    @abstractmethod
+    def set(self, key: str, value: str, ttl_seconds: int, only_if_absent: bool = False) -> bool:
+        """Store `value`; with only_if_absent, returns False if the key already exists."""
+        ...
+
+    @abstractmethod
+    def pop(self, key: str) -> Optional[str]:
+        """Atomically read and delete `key`, so one-time values can only be used once."""
+        ...
+
+    @abstractmethod
+    def delete(self, key: str) -> None:
+        ...
+
+    @abstractmethod
+    def incr(self, key: str, ttl_seconds: int) -> int:
+        """Increment a counter; the TTL starts when the counter is created."""
+        ...
+
+
+class MemoryKVStore(KVStore):
+    """Process-local store for tests and single-worker development."""
+
+    def __init__(self):
+        self._data = {}
+        self._lock = threading.Lock()
+
+    def _live(self, key: str):
+        entry = self._data.get(key)
+        if entry is None:
+            return None
+        if entry[1] <= time.monotonic():
+            del self._data[key]
+            return None
+        return entry
+
+    def get(self, key: str) -> Optional[str]:
+        with self._lock:
+            entry = self._live(key)
+            return entry[0] if entry else None
+
+    def set(self, key: str, value: str, ttl_seconds: int, only_if_absent: bool = False) -> bool:
+        with self._lock:
+            if only_if_absent and self._live(key):
+                return False
+            self._data[key] = (str(value), time.monotonic() + ttl_seconds)
+            return True
+
+    def pop(self, key: str) -> Optional[str]:
+        with self._lock:
+            entry = self._live(key)
+            if entry is None:
+                return None
+            del self._data[key]
+            return entry[0]
+
+    def delete(self, key: str) -> None:
+        with self._lock:
+            self._data.pop(key, None)
+
+    def incr(self, key: str, ttl_seconds: int) -> int:
+        with self._lock:
+            entry = self._live(key)
+            if entry is None:
+                self._data[key] = ("1", time.monotonic() + ttl_seconds)
+                return 1
+            count = int(entry[0]) + 1
+            self._data[key] = (str(count), entry[1])
+            return count
+
+
+class RedisKVStore(KVStore):
+    """
+    Redis protocol backend over a shared connection pool.
+
+    Works with any Redis-compatible server, including Upstash through its
+    rediss:// endpoint.
+    """
+
+    def __init__(self, url: str, max_connections: int, socket_timeout: float):
+        import redis
+
+        pool = redis.ConnectionPool.from_url(
+            url,
+            max_connections=max_connections,
+            socket_timeout=socket_timeout,
+            socket_connect_timeout=socket_timeout,
+            health_check_interval=30,
+            decode_responses=True,
+        )
+        self._client = redis.Redis(connection_pool=pool)
+
+    def get(self, key: str) -> Optional[str]:
+        return self._client.get(key)
+
+    def set(self, key: str, value: str, ttl_seconds: int, only_if_absent: bool = False) -> bool:
+        return bool(self._client.set(key, value, ex=ttl_seconds, nx=only_if_absent))
+
+    def pop(self, key: str) -> Optional[str]:
+        # GET + DEL in one MULTI (GETDEL needs Redis 6.2)
+        pipe = self._client.pipeline(transaction=True)
+        pipe.get(key)
+        pipe.delete(key)
+        value, _ = pipe.execute()
+        return value
+
+    def delete(self, key: str) -> None:
+        self._client.delete(key)
+
+    def incr(self, key: str, ttl_seconds: int) -> int:
+        # SET NX creates the counter with its TTL, INCR keeps it
+        # (EXPIRE ... NX would need Redis 7)
+        pipe = self._client.pipeline(transaction=True)
+        pipe.set(key, 0, ex=ttl_seconds, nx=True)
+        pipe.incr(key)
+        _, count = pipe.execute()
+        return count
+
+
+_store: Optional[KVStore] = None
+_store_lock = threading.Lock()
+
+
+def get_kv_store() -> KVStore:
+    global _store
+    if _store is None:
+        with _store_lock:
+            if _store is None:
+                if settings.KV_BACKEND == "redis":
+                    _store = RedisKVStore(
+                        settings.REDIS_URL,
+                        settings.REDIS_MAX_CONNECTIONS,
+                        settings.REDIS_SOCKET_TIMEOUT,
+                    )
+                else:
+                    print(
+                        "WARNING: KV_BACKEND=memory keeps OTPs, reset tokens and rate limits per process; "
+                        "use KV_BACKEND=redis when running more than one worker"
+                    )
+                    _store = MemoryKVStore()
+    return _store
+
+
+def set_kv_store(store: KVStore) -> None:
+    """Swap the process-wide store (e.g. a fresh MemoryKVStore in tests)."""
+    global _store
+    _store = store
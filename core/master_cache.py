@@ -0,0 +1,134 @@
+import threading
+import time
+from sqlalchemy import func, select
+from sqlalchemy.orm import Session
+from app.config.settings import settings
+from models import generated_models
+
+# Master* tables that carry per-user or operational state (availability flags,
+# owners, ratings) rather than lookup values; these are always read from the DB.
+NON_LOOKUP_MASTERS = {
+    "MasterAmbulance",
+    "MasterAssistants",
+    "MasterInternshipStatus",
+    "MasterMechanic",
+    "MasterMenuItem",
+    "MasterRestaurant",
+}
+
+
+def _lookup_models():
+    models = {}
+    for mapper in generated_models.Base.registry.mappers:
+        cls = mapper.class_
+        if cls.__name__.startswith("Master") and cls.__name__ not in NON_LOOKUP_MASTERS:
+            models[cls.__name__] = cls
+    return models
+
+
+class _CachedTable:
+    def __init__(self):
+        self.rows = {}
+        self.ordered = []
+        self.version = 0
+        self.watermark = None
+        self.checked_at = 0.0
+        self.stale = True
+        # bumped by bump_version(); a load that overlaps a bump stays stale
+        self.invalidations = 0
+        # one refresh per table at a time; the registry lock is never held across a query
+        self.refresh_lock = threading.Lock()
+
+
+class MasterDataRegistry:
+    """
+    In-process copy of the Master* lookup tables.
+
+    Each table is loaded on first use and served from memory afterwards. A table
+    is reloaded when a write service calls bump_version() for it, or when the
+    periodic watermark check (row count, max id, latest created/modified date)
+    shows another process changed it.
+    """
+
+    def __init__(self, check_seconds: int):
+        self.check_seconds = check_seconds
+        self.models = _lookup_models()
+        self._tables = {}
+        self._lock = threading.RLock()
+
+    def is_cached(self, model) -> bool:
+        return self.models.get(model.__name__) is model
+
+    def _watermark(self, db: Session, model):
+        columns = [func.count(), func.max(model.id)]
+        for name in ("created_date", "modified_date"):
+            if hasattr(model, name):
+                columns.append(func.max(getattr(model, name)))
+        return tuple(db.execute(select(*columns).select_from(model)).one())
+
+    def _load(self, db: Session, model) -> list:
+        attrs = [attr.key for attr in model.__mapper__.column_attrs]
+        records = db.query(model).order_by(model.id).all()
+        return [{key: getattr(record, key) for key in attrs} for record in records]
+
+    def _fresh(self, table: _CachedTable) -> bool:
+        return not table.stale and time.monotonic() - table.checked_at < self.check_seconds
+
+    def _table(self, db: Session, model) -> _CachedTable:
+        with self._lock:
+            table = self._tables.setdefault(model.__name__, _CachedTable())
+        if self._fresh(table):
+            return table
+        if not table.refresh_lock.acquire(blocking=not table.version or table.stale):
+            # a periodic check is already running elsewhere; the loaded copy is still valid
+            return table
+        try:
+            if self._fresh(table):
+                return table
+            with self._lock:
+                invalidations, stale = table.invalidations, table.stale
+            watermark = self._watermark(db, model)
+            ordered = self._load(db, model) if stale or watermark != table.watermark else None
+            with self._lock:
+                if ordered is not None:
+                    table.ordered = ordered
+                    table.rows = {row["id"]: row for row in ordered}
+                    table.watermark = watermark
+                    table.version += 1
+                    table.stale = table.invalidations != invalidations
+                table.checked_at = time.monotonic()
+            return table
+        finally:
+            table.refresh_lock.release()
+
+    def get_rows(self, db: Session, model, active_only: bool = False) -> list:
+        rows = self._table(db, model).ordered
+        if active_only and hasattr(model, "is_active"):
+            return [row for row in rows if row.get("is_active")]
+        return list(rows)
+
+    def get_row(self, db: Session, model, row_id):
+        return self._table(db, model).rows.get(row_id)
+
+    def exists(self, db: Session, model, row_id, active_only: bool = False) -> bool:
+        row = self.get_row(db, model, row_id)
+        if row is None:
+            return False
+        return not active_only or row.get("is_active") is True
+
+    def get_version(self, db: Session, model) -> int:
+        return self._table(db, model).version
+
+    def bump_version(self, model):
+        with self._lock:
+            table = self._tables.get(model.__name__)
+            if table:
+                table.stale = True
+                table.invalidations += 1
+
+    def clear(self):
+        with self._lock:
+            self._tables.clear()
+
+
+master_registry = MasterDataRegistry(settings.MASTER_CACHE_CHECK_SECONDS)
@@ -0,0 +1,90 @@
+import base64
+import json
+from datetime import datetime
+from typing import Optional
+from fastapi import HTTPException, Query, Response
+from sqlalchemy import or_, tuple_
+
+DEFAULT_PAGE_SIZE = 50
+MAX_PAGE_SIZE = 200
+
+
+class PageParams:
+    def __init__(
+        self,
+        cursor: Optional[str] = Query(None, description="Opaque cursor from the X-Next-Cursor header of the previous page"),
+        limit: int = Query(DEFAULT_PAGE_SIZE, ge=1, le=MAX_PAGE_SIZE),
+        include_total: bool = Query(False, description="Also return X-Total-Count (extra COUNT query)"),
+    ):
+        self.cursor = cursor
+        self.limit = limit
+        self.include_total = include_total
+
+
+class Page:
+    def __init__(self, items: list, next_cursor: Optional[str], total: Optional[int]):
+        self.items = items
+        self.next_cursor = next_cursor
+        self.total = total
+
+
+def encode_cursor(*values) -> str:
+    raw = json.dumps([v.isoformat() if isinstance(v, datetime) else v for v in values])
+    return base64.urlsafe_b64encode(raw.encode()).decode().rstrip("=")
+
+
+def decode_cursor(cursor: str) -> list:
+    try:
+        padded = cursor + "=" * (-len(cursor) % 4)
+        return json.loads(base64.urlsafe_b64decode(padded.encode()))
+    except (ValueError, TypeError):
+        raise HTTPException(status_code=400, detail="Invalid cursor")
+
+
+def paginate(query, model, page: PageParams) -> Page:
+    """
+    Keyset pagination on (created_date DESC, id DESC), newest first.
+
+    Rows with a NULL created_date sort last, so the cursor carries a NULL date
+    once the page boundary reaches them.
+    """
+    created = model.created_date
+    total = query.order_by(None).count() if page.include_total else None
+
+    if page.cursor:
+        values = decode_cursor(page.cursor)
+        if not isinstance(values, list) or len(values) != 2:
+            raise HTTPException(status_code=400, detail="Invalid cursor")
+        last_created, last_id = values
+        try:
+            last_created = datetime.fromisoformat(last_created) if last_created else None
+            last_id = int(last_id)
+        except (ValueError, TypeError):
+            raise HTTPException(status_code=400, detail="Invalid cursor")
+        if last_created is None:
+            query = query.filter(created.is_(None), model.id < last_id)
+        else:
+            query = query.filter(or_(tuple_(created, model.id) < (last_created, last_id), created.is_(None)))
+
+    rows = (
+        query.order_by(None)
+        .order_by(created.desc().nulls_last(), model.id.desc())
+        .limit(page.limit + 1)
+        .all()
+    )
+
+    next_cursor = None
+    if len(rows) > page.limit:
+        rows = rows[:page.limit]
+        last = rows[-1]
+        next_cursor = encode_cursor(last.created_date, last.id)
+    return Page(rows, next_cursor, total)
+
+
+def page_response(response: Response, page: Page) -> list:
+    """Put paging info in headers so list endpoints keep returning a plain list."""
+    if page.next_cursor:
+        response.headers["X-Next-Cursor"] = page.next_cursor
+    if page.total is not None:
+        response.headers["X-Total-Count"] = str(page.total)
+    return page.items
@@ -0,0 +1,19 @@
+-- Indexes backing core.pagination.paginate (ORDER BY created_date DESC NULLS LAST, id DESC).
+-- Run with: psql "$DATABASE_URL" -f migrations/001_keyset_pagination_indexes.sql
+-- CONCURRENTLY cannot run inside a transaction block, so do not wrap this file in BEGIN/COMMIT.
+
+CREATE INDEX CONCURRENTLY IF NOT EXISTS idx_companies_registration_created_date_id ON companies_registration (created_date DESC NULLS LAST, id DESC);
+CREATE INDEX CONCURRENTLY IF NOT EXISTS idx_hospital_registration_created_date_id ON hospital_registration (created_date DESC NULLS LAST, id DESC);
+CREATE INDEX CONCURRENTLY IF NOT EXISTS idx_lab_registration_created_date_id ON lab_registration (created_date DESC NULLS LAST, id DESC);
+CREATE INDEX CONCURRENTLY IF NOT EXISTS idx_doctor_registration_created_date_id ON doctor_registration (created_date DESC NULLS LAST, id DESC);
+CREATE INDEX CONCURRENTLY IF NOT EXISTS idx_student_registration_created_date_id ON student_registration (created_date DESC NULLS LAST, id DESC);
+CREATE INDEX CONCURRENTLY IF NOT EXISTS idx_my_food_registration_created_date_id ON my_food_registration (created_date DESC NULLS LAST, id DESC);
+CREATE INDEX CONCURRENTLY IF NOT EXISTS idx_food_order_created_date_id ON food_order (created_date DESC NULLS LAST, id DESC);
+CREATE INDEX CONCURRENTLY IF NOT EXISTS idx_food_order_refund_request_created_date_id ON food_order_refund_request (created_date DESC NULLS LAST, id DESC);
+CREATE INDEX CONCURRENTLY IF NOT EXISTS idx_institution_branch_created_date_id ON institution_branch (created_date DESC NULLS LAST, id DESC);
+
+-- list endpoints that only show active rows
+CREATE INDEX CONCURRENTLY IF NOT EXISTS idx_product_registration_active_created_date_id ON product_registration (created_date DESC NULLS LAST, id DESC) WHERE is_active = true;
+CREATE INDEX CONCURRENTLY IF NOT EXISTS idx_property_listing_active_created_date_id ON property_listing (created_date DESC NULLS LAST, id DESC) WHERE is_active = true;
+CREATE INDEX CONCURRENTLY IF NOT EXISTS idx_student_profile_active_created_date_id ON student_profile (created_date DESC NULLS LAST, id DESC) WHERE is_active = true;
+CREATE INDEX CONCURRENTLY IF NOT EXISTS idx_user_registration_role_created_date_id ON user_registration (role_id, created_date DESC NULLS LAST, id DESC) WHERE is_active = true;
@@ -0,0 +1,11 @@
+-- Indexes backing user_registration_service.login_user.
+-- Run with: psql "$DATABASE_URL" -f migrations/002_login_lookup_indexes.sql
+-- CONCURRENTLY cannot run inside a transaction block, so do not wrap this file in BEGIN/COMMIT.
+--
+-- The user lookup filters on email or on mobile (chosen by the identifier), which the
+-- existing uk_user_registration_email / uk_user_registration_mobile unique indexes cover.
+-- The service/skill id aggregates are correlated subqueries on user_id; covering
+-- indexes let them run as index-only scans instead of heap fetches per row.
+
+CREATE INDEX CONCURRENTLY IF NOT EXISTS idx_user_services_user_id_module_id ON user_services (user_id) INCLUDE (module_id);
+CREATE INDEX CONCURRENTLY IF NOT EXISTS idx_user_skill_user_id_skill_id ON user_skill (user_id) INCLUDE (skill_id);
@@ -0,0 +1,13 @@
+-- Allocation columns used by allocation_service and freelancer_service on home_service_booking.
+-- Run with: psql "$DATABASE_URL" -f migrations/003_booking_allocation_columns.sql
+-- No-ops on databases that already have the columns.
+
+ALTER TABLE home_service_booking ADD COLUMN IF NOT EXISTS assigned_to bigint;
+ALTER TABLE home_service_booking ADD COLUMN IF NOT EXISTS work_status_id integer;
+ALTER TABLE home_service_booking ADD COLUMN IF NOT EXISTS rating integer;
+
+-- CONCURRENTLY cannot run inside a transaction block, so do not wrap this file in BEGIN/COMMIT.
+-- Seeding the allocation engine's workload counters aggregates only open assignments.
+CREATE INDEX CONCURRENTLY IF NOT EXISTS idx_home_service_booking_assigned_to ON home_service_booking (assigned_to) WHERE assigned_to IS NOT NULL AND is_active = true;
+-- freelancer candidates per service module (user_id first is covered by 002)
+CREATE INDEX CONCURRENTLY IF NOT EXISTS idx_user_services_module_id_user_id ON user_services (module_id, user_id);
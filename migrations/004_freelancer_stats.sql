@@ -0,0 +1,20 @@
+-- Per-freelancer workload and rating summary maintained by services/freelancer_stats_service.py.
+-- Run with: psql "$DATABASE_URL" -f migrations/004_freelancer_stats.sql
+-- then populate it with: python -m workers.rebuild_freelancer_stats
+
+CREATE TABLE IF NOT EXISTS freelancer_stats (
+    freelancer_id bigint NOT NULL,
+    total_jobs integer NOT NULL DEFAULT 0,
+    active_jobs integer NOT NULL DEFAULT 0,
+    rating_count integer NOT NULL DEFAULT 0,
+    rating_sum bigint NOT NULL DEFAULT 0,
+    avg_rating numeric(3, 2) NOT NULL DEFAULT 0,
+    last_job_at timestamp,
+    modified_date timestamp DEFAULT now(),
+    CONSTRAINT pk_freelancer_stats_freelancer_id PRIMARY KEY (freelancer_id),
+    CONSTRAINT fk_freelancer_stats_freelancer_id FOREIGN KEY (freelancer_id) REFERENCES user_registration (id)
+);
+
+-- allocation options list (ORDER BY avg_rating DESC) and least-loaded lookups
+CREATE INDEX IF NOT EXISTS idx_freelancer_stats_avg_rating ON freelancer_stats (avg_rating DESC, freelancer_id);
+CREATE INDEX IF NOT EXISTS idx_freelancer_stats_active_jobs_avg_rating ON freelancer_stats (active_jobs, avg_rating DESC);
@@ -0,0 +1,9 @@
+-- Queue index for the allocation worker (services/batch_allocation_service.py):
+-- pending, unassigned bookings in preferred_date / time slot order.
+-- Run with: psql "$DATABASE_URL" -f migrations/005_pending_booking_queue_index.sql
+-- CONCURRENTLY cannot run inside a transaction block, so do not wrap this file in BEGIN/COMMIT.
+-- status_id 2 is BOOKING_STATUS_PENDING in core/constants.py.
+
+CREATE INDEX CONCURRENTLY IF NOT EXISTS idx_home_service_booking_pending_queue
+    ON home_service_booking (preferred_date, time_slot_id, id)
+    WHERE assigned_to IS NULL AND status_id = 2 AND is_active = true;
@@ -0,0 +1,15 @@
+-- ANN and filter indexes for services/vector_search_service.py.
+-- Run with: psql "$DATABASE_URL" -f migrations/006_ai_documents_vector_indexes.sql
+-- CONCURRENTLY cannot run inside a transaction block, so do not wrap this file in BEGIN/COMMIT.
+--
+-- pgvector only uses an index whose operator class matches the query's distance
+-- operator: cosine search (<=>) needs vector_cosine_ops, L2 search (<->) vector_l2_ops.
+-- Query-time recall is tuned with hnsw.ef_search (VECTOR_HNSW_EF_SEARCH).
+
+CREATE INDEX CONCURRENTLY IF NOT EXISTS idx_ai_documents_embedding_hnsw_cosine
+    ON ai_documents USING hnsw (embedding vector_cosine_ops) WITH (m = 16, ef_construction = 64);
+CREATE INDEX CONCURRENTLY IF NOT EXISTS idx_ai_documents_embedding_hnsw_l2
+    ON ai_documents USING hnsw (embedding vector_l2_ops) WITH (m = 16, ef_construction = 64);
+
+CREATE INDEX CONCURRENTLY IF NOT EXISTS idx_ai_documents_language ON ai_documents (language);
+CREATE INDEX CONCURRENTLY IF NOT EXISTS idx_ai_documents_metadata ON ai_documents USING gin (metadata jsonb_path_ops);
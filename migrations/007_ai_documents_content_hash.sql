@@ -0,0 +1,4 @@
+-- Content hash used by services/document_ingestion_service.py to skip unchanged chunks on re-ingestion.
+-- Run with: psql "$DATABASE_URL" -f migrations/007_ai_documents_content_hash.sql
+
+ALTER TABLE ai_documents ADD COLUMN IF NOT EXISTS content_hash varchar(64);
@@ -0,0 +1,36 @@
+-- Full-text and trigram search for services/text_search_service.py.
+-- Run with: psql "$DATABASE_URL" -f migrations/008_text_search.sql
+-- CONCURRENTLY cannot run inside a transaction block, so do not wrap this file in BEGIN/COMMIT.
+--
+-- Adding a STORED generated column rewrites the table once (ACCESS EXCLUSIVE lock);
+-- run it off-peak on large tables. The tsvector config ('english') must match the
+-- one used in the queries, otherwise the GIN indexes are not used.
+
+CREATE EXTENSION IF NOT EXISTS pg_trgm;
+
+ALTER TABLE job_openings ADD COLUMN IF NOT EXISTS search_vector tsvector
+    GENERATED ALWAYS AS (
+        setweight(to_tsvector('english', coalesce(company_name, '')), 'A') ||
+        setweight(to_tsvector('english', coalesce(role_description, '')), 'B') ||
+        setweight(to_tsvector('english', coalesce(requirements, '')), 'C') ||
+        setweight(to_tsvector('english', coalesce(company_address, '')), 'C')
+    ) STORED;
+
+ALTER TABLE master_job ADD COLUMN IF NOT EXISTS search_vector tsvector
+    GENERATED ALWAYS AS (to_tsvector('english', coalesce(job_name, ''))) STORED;
+
+ALTER TABLE property_sell_listing ADD COLUMN IF NOT EXISTS search_vector tsvector
+    GENERATED ALWAYS AS (
+        setweight(to_tsvector('english', coalesce(locality_area, '')), 'A') ||
+        setweight(to_tsvector('english', coalesce(property_description, '')), 'B')
+    ) STORED;
+
+CREATE INDEX CONCURRENTLY IF NOT EXISTS idx_job_openings_search_vector ON job_openings USING gin (search_vector);
+CREATE INDEX CONCURRENTLY IF NOT EXISTS idx_master_job_search_vector ON master_job USING gin (search_vector);
+CREATE INDEX CONCURRENTLY IF NOT EXISTS idx_property_sell_listing_search_vector ON property_sell_listing USING gin (search_vector);
+
+-- typo tolerance: % (similarity) and <% (word_similarity) both use gin_trgm_ops
+CREATE INDEX CONCURRENTLY IF NOT EXISTS idx_job_openings_company_name_trgm ON job_openings USING gin (company_name gin_trgm_ops);
+CREATE INDEX CONCURRENTLY IF NOT EXISTS idx_job_openings_company_address_trgm ON job_openings USING gin (company_address gin_trgm_ops);
+CREATE INDEX CONCURRENTLY IF NOT EXISTS idx_master_job_job_name_trgm ON master_job USING gin (job_name gin_trgm_ops);
+CREATE INDEX CONCURRENTLY IF NOT EXISTS idx_property_sell_listing_locality_area_trgm ON property_sell_listing USING gin (locality_area gin_trgm_ops);
@@ -0,0 +1,41 @@
+-- Company directory maintained by services/company_summary_service.py.
+-- Run with: psql "$DATABASE_URL" -f migrations/009_company_summary.sql
+-- then populate it with: python -m workers.rebuild_company_summary
+--
+-- One row per (company_name, company_address) seen in job_openings. Rows are
+-- never deleted, so ids stay stable; companies with no active openings keep
+-- active_openings = 0 and drop out of the listing indexes.
+
+CREATE TABLE IF NOT EXISTS company_summary (
+    id bigserial NOT NULL,
+    company_name varchar(255) NOT NULL,
+    company_address varchar(255) NOT NULL,
+    industry_id bigint,
+    company_size_id bigint,
+    jobs_count integer NOT NULL DEFAULT 0,
+    internships_count integer NOT NULL DEFAULT 0,
+    active_openings integer NOT NULL DEFAULT 0,
+    last_active_time timestamp,
+    modified_date timestamp DEFAULT now(),
+    CONSTRAINT pk_company_summary_id PRIMARY KEY (id),
+    CONSTRAINT uk_company_summary_company_name_address UNIQUE (company_name, company_address)
+);
+
+-- one keyset index per sort order of GET /api/jobs
+CREATE INDEX IF NOT EXISTS idx_company_summary_last_active
+    ON company_summary (last_active_time DESC NULLS LAST, id DESC) WHERE active_openings > 0;
+CREATE INDEX IF NOT EXISTS idx_company_summary_jobs_count
+    ON company_summary (jobs_count DESC, id DESC) WHERE active_openings > 0;
+CREATE INDEX IF NOT EXISTS idx_company_summary_internships_count
+    ON company_summary (internships_count DESC, id DESC) WHERE active_openings > 0;
+CREATE INDEX IF NOT EXISTS idx_company_summary_industry_id ON company_summary (industry_id);
+CREATE INDEX IF NOT EXISTS idx_company_summary_company_size_id ON company_summary (company_size_id);
+
+-- location filter (ILIKE '%...%'); pg_trgm is created by 008
+CREATE EXTENSION IF NOT EXISTS pg_trgm;
+CREATE INDEX IF NOT EXISTS idx_company_summary_company_address_trgm
+    ON company_summary USING gin (company_address gin_trgm_ops);
+
+-- per-company recompute on job opening create/delete
+CREATE INDEX IF NOT EXISTS idx_job_openings_company_name_address
+    ON job_openings (company_name, company_address) WHERE is_active = true;
@@ -0,0 +1,27 @@
+-- Numeric percentage for student_qualification, used by GET /api/internship/trending.
+-- Run with: psql "$DATABASE_URL" -f migrations/010_student_qualification_percentage_value.sql
+-- CONCURRENTLY cannot run inside a transaction block, so do not wrap this file in BEGIN/COMMIT.
+--
+-- percentage is free text ("85", "85%", "85.5 %", "8.2 CGPA", ...). The conversion
+-- never raises: anything that is not a plain 0-100 number (after dropping "%" and
+-- spaces) becomes NULL instead of failing the row. The casts sit inside nested
+-- CASEs because AND does not guarantee the regex check runs first. Adding the
+-- STORED generated column rewrites the table once, which is the backfill of
+-- existing rows; new and updated rows are converted by Postgres on write.
+
+ALTER TABLE student_qualification ADD COLUMN IF NOT EXISTS percentage_value numeric(5, 2)
+    GENERATED ALWAYS AS (
+    CASE WHEN replace(replace(btrim(percentage), '%', ''), ' ', '') ~ '^[0-9]{1,3}(\.[0-9]+)?$'
+        THEN CASE WHEN replace(replace(btrim(percentage), '%', ''), ' ', '')::numeric <= 100
+            THEN round(replace(replace(btrim(percentage), '%', ''), ' ', '')::numeric, 2)
+        END
+    END
+    ) STORED;
+
+CREATE INDEX CONCURRENTLY IF NOT EXISTS idx_student_qualification_percentage_value
+    ON student_qualification (percentage_value DESC, id DESC)
+    WHERE is_active = true AND percentage_value IS NOT NULL;
+
+-- rows left NULL (not a recognisable percentage), for manual review:
+--   SELECT id, user_id, percentage FROM student_qualification
+--   WHERE percentage_value IS NULL AND percentage IS NOT NULL;
@@ -0,0 +1,10 @@
+-- Columns and index for services/bus_tracking_service.py.
+-- Run with: psql "$DATABASE_URL" -f migrations/011_bus_tracking_live.sql
+-- CONCURRENTLY cannot run inside a transaction block, so do not wrap this file in BEGIN/COMMIT.
+
+ALTER TABLE bus_tracking_status ADD COLUMN IF NOT EXISTS latitude numeric(9, 6);
+ALTER TABLE bus_tracking_status ADD COLUMN IF NOT EXISTS longitude numeric(9, 6);
+
+-- latest row per bus (tracker warm-up on startup, history per bus)
+CREATE INDEX CONCURRENTLY IF NOT EXISTS idx_bus_tracking_status_bus_id_last_updated
+    ON bus_tracking_status (bus_id, last_updated DESC);
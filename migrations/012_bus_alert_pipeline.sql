@@ -0,0 +1,33 @@
+-- Columns, indexes and view for services/bus_alert_service.py.
+-- Run with: psql "$DATABASE_URL" -f migrations/012_bus_alert_pipeline.sql
+-- CONCURRENTLY cannot run inside a transaction block, so do not wrap this file in BEGIN/COMMIT.
+
+-- repeats of an open alert within the dedup window update these instead of adding rows
+ALTER TABLE bus_alert_log ADD COLUMN IF NOT EXISTS occurrence_count integer NOT NULL DEFAULT 1;
+ALTER TABLE bus_alert_log ADD COLUMN IF NOT EXISTS last_seen timestamp;
+
+-- open alerts only: its size follows the number of unresolved alerts, not the history
+CREATE INDEX CONCURRENTLY IF NOT EXISTS idx_bus_alert_log_unresolved
+    ON bus_alert_log (created_date DESC NULLS LAST, id DESC)
+    WHERE resolved = false AND is_active = true;
+
+-- paginated full history (GET /institution/management/bus/alerts)
+CREATE INDEX CONCURRENTLY IF NOT EXISTS idx_bus_alert_log_created_date_id
+    ON bus_alert_log (created_date DESC NULLS LAST, id DESC);
+
+CREATE OR REPLACE VIEW vw_bus_alerts_unresolved AS
+SELECT
+    a.id,
+    a.bus_id,
+    f.bus_name,
+    f.driver_name,
+    a.alert_type,
+    a.alert_message,
+    a.alert_time,
+    a.last_seen,
+    a.occurrence_count,
+    a.created_date
+FROM bus_alert_log a
+JOIN bus_fleet f ON f.bus_id = a.bus_id
+WHERE a.resolved = false
+  AND a.is_active = true;
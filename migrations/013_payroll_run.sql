@@ -0,0 +1,41 @@
+-- Progress table and indexes for services/payroll_run_service.py.
+-- Run with: psql "$DATABASE_URL" -f migrations/013_payroll_run.sql
+-- CONCURRENTLY cannot run inside a transaction block, so do not wrap this file in BEGIN/COMMIT.
+--
+-- One row per payroll period. last_staff_id is the keyset position of the last
+-- committed chunk, so an interrupted run resumes where it stopped.
+
+CREATE TABLE IF NOT EXISTS payroll_run (
+    id bigserial NOT NULL,
+    payroll_period_id bigint NOT NULL,
+    payroll_month varchar(20) NOT NULL,
+    status varchar(20) NOT NULL DEFAULT 'RUNNING',
+    total_staff integer NOT NULL DEFAULT 0,
+    processed_staff integer NOT NULL DEFAULT 0,
+    generated_payslips integer NOT NULL DEFAULT 0,
+    skipped_staff integer NOT NULL DEFAULT 0,
+    last_staff_id varchar(50),
+    error text,
+    started_at timestamp DEFAULT now(),
+    finished_at timestamp,
+    created_by bigint,
+    modified_date timestamp DEFAULT now(),
+    CONSTRAINT pk_payroll_run_id PRIMARY KEY (id),
+    CONSTRAINT uk_payroll_run_payroll_period_id UNIQUE (payroll_period_id),
+    CONSTRAINT fk_payroll_run_payroll_period_id FOREIGN KEY (payroll_period_id) REFERENCES payroll_period (id)
+);
+
+-- month totals for salary_earnings / payroll_summary (uk_staff_payslip leads with staff_id)
+CREATE INDEX CONCURRENTLY IF NOT EXISTS idx_staff_payslip_payroll_month
+    ON staff_payslip (payroll_month) WHERE is_active = true;
+
+-- each staff member's latest payslip, carried forward as the next month's pay structure
+CREATE INDEX CONCURRENTLY IF NOT EXISTS idx_staff_payslip_staff_id_created_date
+    ON staff_payslip (staff_id, created_date DESC NULLS LAST, id DESC) WHERE is_active = true;
+
+-- keyset walk over active staff
+CREATE INDEX CONCURRENTLY IF NOT EXISTS idx_staff_profile_active_staff_id
+    ON staff_profile (staff_id) WHERE is_active = true;
+
+CREATE INDEX CONCURRENTLY IF NOT EXISTS idx_salary_earnings_payroll_period_id
+    ON salary_earnings (payroll_period_id) WHERE is_active = true;
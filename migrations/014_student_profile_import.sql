@@ -0,0 +1,26 @@
+-- Columns for services/student_import_service.py.
+-- Run with: psql "$DATABASE_URL" -f migrations/014_student_profile_import.sql
+--
+-- Bulk imports carry gender, state and district for each student; they are
+-- validated against the master tables and stored as ids. All three are
+-- nullable, so existing rows and the single-student API are unaffected.
+
+ALTER TABLE student_profile ADD COLUMN IF NOT EXISTS gender_id integer;
+ALTER TABLE student_profile ADD COLUMN IF NOT EXISTS state_id integer;
+ALTER TABLE student_profile ADD COLUMN IF NOT EXISTS district_id integer;
+
+DO $$
+BEGIN
+    IF NOT EXISTS (SELECT 1 FROM pg_constraint WHERE conname = 'fk_student_profile_gender_id') THEN
+        ALTER TABLE student_profile
+            ADD CONSTRAINT fk_student_profile_gender_id FOREIGN KEY (gender_id) REFERENCES master_gender (id);
+    END IF;
+    IF NOT EXISTS (SELECT 1 FROM pg_constraint WHERE conname = 'fk_student_profile_state_id') THEN
+        ALTER TABLE student_profile
+            ADD CONSTRAINT fk_student_profile_state_id FOREIGN KEY (state_id) REFERENCES master_state (id);
+    END IF;
+    IF NOT EXISTS (SELECT 1 FROM pg_constraint WHERE conname = 'fk_student_profile_district_id') THEN
+        ALTER TABLE student_profile
+            ADD CONSTRAINT fk_student_profile_district_id FOREIGN KEY (district_id) REFERENCES master_district (id);
+    END IF;
+END $$;
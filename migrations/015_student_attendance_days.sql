@@ -0,0 +1,36 @@
+-- Daily attendance and running counters for services/student_attendance_service.py.
+-- Run with: psql "$DATABASE_URL" -f migrations/015_student_attendance_days.sql
+-- CONCURRENTLY cannot run inside a transaction block, so do not wrap this file in BEGIN/COMMIT.
+--
+-- student_attendance keeps one active row per student; its days_total and
+-- days_present are adjusted by the delta of each attendance batch, so
+-- attendance_percentage never needs a full recount of student_attendance_day.
+
+CREATE TABLE IF NOT EXISTS student_attendance_day (
+    id bigserial NOT NULL,
+    user_id bigint NOT NULL,
+    attendance_date date NOT NULL,
+    present boolean NOT NULL,
+    created_date timestamp DEFAULT now(),
+    modified_date timestamp,
+    CONSTRAINT pk_student_attendance_day_id PRIMARY KEY (id),
+    CONSTRAINT uk_student_attendance_day_user_id_date UNIQUE (user_id, attendance_date),
+    CONSTRAINT fk_student_attendance_day_user_id FOREIGN KEY (user_id) REFERENCES user_registration (id)
+);
+
+ALTER TABLE student_attendance ADD COLUMN IF NOT EXISTS days_total integer NOT NULL DEFAULT 0;
+ALTER TABLE student_attendance ADD COLUMN IF NOT EXISTS days_present integer NOT NULL DEFAULT 0;
+ALTER TABLE student_attendance ADD COLUMN IF NOT EXISTS modified_date timestamp;
+
+-- the batch upsert targets the active row per student; keep the newest one if
+-- earlier single-row writes left more than one
+UPDATE student_attendance a
+SET is_active = false
+WHERE a.is_active = true
+  AND EXISTS (
+      SELECT 1 FROM student_attendance b
+      WHERE b.user_id = a.user_id AND b.is_active = true AND b.id > a.id
+  );
+
+CREATE UNIQUE INDEX CONCURRENTLY IF NOT EXISTS uk_student_attendance_user_id_active
+    ON student_attendance (user_id) WHERE is_active = true;
@@ -0,0 +1,11 @@
+-- Dedup lookup for services/bus_alert_service.py.
+-- Run with: psql "$DATABASE_URL" -f migrations/016_bus_alert_open_lookup.sql
+-- CONCURRENTLY cannot run inside a transaction block, so do not wrap this file in BEGIN/COMMIT.
+--
+-- Alerts are deduplicated in the database rather than in process memory: each
+-- submit looks up the newest open alert for its (bus_id, alert_type) under an
+-- advisory lock, so all workers fold repeats into the same row.
+
+CREATE INDEX CONCURRENTLY IF NOT EXISTS idx_bus_alert_log_open_bus_type
+    ON bus_alert_log (bus_id, alert_type, id DESC)
+    WHERE resolved = false AND is_active = true;
@@ -3,7 +3,7 @@ import datetime
 import decimal
 
 from pgvector.sqlalchemy.vector import VECTOR
-from sqlalchemy import BigInteger, Boolean, CheckConstraint, Column, Date, DateTime, ForeignKeyConstraint, Index, Integer, JSON, Numeric, PrimaryKeyConstraint, Sequence, String, Table, Text, Time, UniqueConstraint, text
+from sqlalchemy import BigInteger, Boolean, CheckConstraint, Column, Computed, Date, DateTime, ForeignKeyConstraint, Index, Integer, JSON, Numeric, PrimaryKeyConstraint, Sequence, String, Table, Text, Time, UniqueConstraint, text
 from sqlalchemy.dialects.postgresql import JSONB
 from sqlalchemy.orm import DeclarativeBase, Mapped, mapped_column, relationship
 
@@ -31,6 +31,7 @@ class AiDocuments(Base):
     modified_by: Mapped[Optional[int]] = mapped_column(BigInteger)
     modified_date: Mapped[Optional[datetime.datetime]] = mapped_column(DateTime)
     is_active: Mapped[Optional[bool]] = mapped_column(Boolean, server_default=text('true'))
+    content_hash: Mapped[Optional[str]] = mapped_column(String(64))
 
 
 class AvailablePharmacies(Base):
@@ -87,6 +88,30 @@ class BusFleet(Base):
     bus_tracking_status: Mapped[list['BusTrackingStatus']] = relationship('BusTrackingStatus', back_populates='bus')
 
 
+class CompanySummary(Base):
+    __tablename__ = 'company_summary'
+    __table_args__ = (
+        PrimaryKeyConstraint('id', name='pk_company_summary_id'),
+        UniqueConstraint('company_name', 'company_address', name='uk_company_summary_company_name_address'),
+        Index('idx_company_summary_last_active', text('last_active_time DESC NULLS LAST'), text('id DESC'), postgresql_where=text('active_openings > 0')),
+        Index('idx_company_summary_jobs_count', text('jobs_count DESC'), text('id DESC'), postgresql_where=text('active_openings > 0')),
+        Index('idx_company_summary_internships_count', text('internships_count DESC'), text('id DESC'), postgresql_where=text('active_openings > 0')),
+        Index('idx_company_summary_industry_id', 'industry_id'),
+        Index('idx_company_summary_company_size_id', 'company_size_id')
+    )
+
+    id: Mapped[int] = mapped_column(BigInteger, primary_key=True)
+    company_name: Mapped[str] = mapped_column(String(255), nullable=False)
+    company_address: Mapped[str] = mapped_column(String(255), nullable=False)
+    industry_id: Mapped[Optional[int]] = mapped_column(BigInteger)
+    company_size_id: Mapped[Optional[int]] = mapped_column(BigInteger)
+    jobs_count: Mapped[int] = mapped_column(Integer, nullable=False, server_default=text('0'))
+    internships_count: Mapped[int] = mapped_column(Integer, nullable=False, server_default=text('0'))
+    active_openings: Mapped[int] = mapped_column(Integer, nullable=False, server_default=text('0'))
+    last_active_time: Mapped[Optional[datetime.datetime]] = mapped_column(DateTime)
+    modified_date: Mapped[Optional[datetime.datetime]] = mapped_column(DateTime, server_default=text('now()'))
+
+
 class HomeServiceBooking(Base):
     __tablename__ = 'home_service_booking'
     __table_args__ = (
@@ -144,6 +169,9 @@ class HomeServiceBooking(Base):
     convenience_fee: Mapped[Optional[decimal.Decimal]] = mapped_column(Numeric(10, 2), server_default=text('0'))
     home_service_payment_id: Mapped[Optional[int]] = mapped_column(BigInteger)
     item_total: Mapped[Optional[decimal.Decimal]] = mapped_column(Numeric(10, 2), server_default=text('0'))
+    assigned_to: Mapped[Optional[int]] = mapped_column(BigInteger)
+    work_status_id: Mapped[Optional[int]] = mapped_column(Integer)
+    rating: Mapped[Optional[int]] = mapped_column(Integer)
 
     bhk_type: Mapped[Optional['MasterBhkType']] = relationship('MasterBhkType', back_populates='home_service_booking')
     brand: Mapped[Optional['MasterVehicleBrand']] = relationship('MasterVehicleBrand', back_populates='home_service_booking')
@@ -1377,7 +1405,8 @@ class StaffProfile(Base):
     __tablename__ = 'staff_profile'
     __table_args__ = (
         PrimaryKeyConstraint('id', name='pk_staff_profile_id'),
-        UniqueConstraint('staff_id', name='uk_staff_profile_staff_id')
+        UniqueConstraint('staff_id', name='uk_staff_profile_staff_id'),
+        Index('idx_staff_profile_active_staff_id', 'staff_id', postgresql_where=text('is_active = true'))
     )
 
     id: Mapped[int] = mapped_column(BigInteger, primary_key=True)
@@ -1582,7 +1611,10 @@ class BusAlertLog(Base):
     __tablename__ = 'bus_alert_log'
     __table_args__ = (
         ForeignKeyConstraint(['bus_id'], ['bus_fleet.bus_id'], name='fk_bus_alert_log_bus_id'),
-        PrimaryKeyConstraint('id', name='pk_bus_alert_log_id')
+        PrimaryKeyConstraint('id', name='pk_bus_alert_log_id'),
+        Index('idx_bus_alert_log_unresolved', text('created_date DESC NULLS LAST'), text('id DESC'), postgresql_where=text('resolved = false AND is_active = true')),
+        Index('idx_bus_alert_log_open_bus_type', 'bus_id', 'alert_type', text('id DESC'), postgresql_where=text('resolved = false AND is_active = true')),
+        Index('idx_bus_alert_log_created_date_id', text('created_date DESC NULLS LAST'), text('id DESC'))
     )
 
     id: Mapped[int] = mapped_column(BigInteger, primary_key=True)
@@ -1596,6 +1628,8 @@ class BusAlertLog(Base):
     modified_by: Mapped[Optional[int]] = mapped_column(BigInteger)
     modified_date: Mapped[Optional[datetime.datetime]] = mapped_column(DateTime)
     is_active: Mapped[Optional[bool]] = mapped_column(Boolean, server_default=text('true'))
+    occurrence_count: Mapped[int] = mapped_column(Integer, nullable=False, server_default=text('1'))
+    last_seen: Mapped[Optional[datetime.datetime]] = mapped_column(DateTime)
 
     bus: Mapped['BusFleet'] = relationship('BusFleet', back_populates='bus_alert_log')
 
@@ -1604,7 +1638,8 @@ class BusTrackingStatus(Base):
     __tablename__ = 'bus_tracking_status'
     __table_args__ = (
         ForeignKeyConstraint(['bus_id'], ['bus_fleet.bus_id'], name='fk_bus_tracking_status_bus_id'),
-        PrimaryKeyConstraint('id', name='pk_bus_tracking_status_id')
+        PrimaryKeyConstraint('id', name='pk_bus_tracking_status_id'),
+        Index('idx_bus_tracking_status_bus_id_last_updated', 'bus_id', text('last_updated DESC'))
     )
 
     id: Mapped[int] = mapped_column(BigInteger, primary_key=True)
@@ -1615,6 +1650,8 @@ class BusTrackingStatus(Base):
     next_stop: Mapped[Optional[str]] = mapped_column(String(100))
     eta_minutes: Mapped[Optional[int]] = mapped_column(Integer)
     last_updated: Mapped[Optional[datetime.datetime]] = mapped_column(DateTime, server_default=text('now()'))
+    latitude: Mapped[Optional[decimal.Decimal]] = mapped_column(Numeric(9, 6))
+    longitude: Mapped[Optional[decimal.Decimal]] = mapped_column(Numeric(9, 6))
     created_by: Mapped[Optional[int]] = mapped_column(BigInteger)
     created_date: Mapped[Optional[datetime.datetime]] = mapped_column(DateTime, server_default=text('now()'))
     modified_by: Mapped[Optional[int]] = mapped_column(BigInteger)
@@ -1953,11 +1990,36 @@ class RawMaterialDetails(Base):
     raw_material_type: Mapped['MasterRawMaterialType'] = relationship('MasterRawMaterialType', back_populates='raw_material_details')
 
 
+class PayrollRun(Base):
+    __tablename__ = 'payroll_run'
+    __table_args__ = (
+        ForeignKeyConstraint(['payroll_period_id'], ['payroll_period.id'], name='fk_payroll_run_payroll_period_id'),
+        PrimaryKeyConstraint('id', name='pk_payroll_run_id'),
+        UniqueConstraint('payroll_period_id', name='uk_payroll_run_payroll_period_id')
+    )
+
+    id: Mapped[int] = mapped_column(BigInteger, primary_key=True)
+    payroll_period_id: Mapped[int] = mapped_column(BigInteger, nullable=False)
+    payroll_month: Mapped[str] = mapped_column(String(20), nullable=False)
+    status: Mapped[str] = mapped_column(String(20), nullable=False, server_default=text("'RUNNING'::character varying"))
+    total_staff: Mapped[int] = mapped_column(Integer, nullable=False, server_default=text('0'))
+    processed_staff: Mapped[int] = mapped_column(Integer, nullable=False, server_default=text('0'))
+    generated_payslips: Mapped[int] = mapped_column(Integer, nullable=False, server_default=text('0'))
+    skipped_staff: Mapped[int] = mapped_column(Integer, nullable=False, server_default=text('0'))
+    last_staff_id: Mapped[Optional[str]] = mapped_column(String(50))
+    error: Mapped[Optional[str]] = mapped_column(Text)
+    started_at: Mapped[Optional[datetime.datetime]] = mapped_column(DateTime, server_default=text('now()'))
+    finished_at: Mapped[Optional[datetime.datetime]] = mapped_column(DateTime)
+    created_by: Mapped[Optional[int]] = mapped_column(BigInteger)
+    modified_date: Mapped[Optional[datetime.datetime]] = mapped_column(DateTime, server_default=text('now()'))
+
+
 class SalaryEarnings(Base):
     __tablename__ = 'salary_earnings'
     __table_args__ = (
         ForeignKeyConstraint(['payroll_period_id'], ['payroll_period.id'], name='fk_salary_earnings_payroll_period_id'),
-        PrimaryKeyConstraint('id', name='pk_salary_earnings_id')
+        PrimaryKeyConstraint('id', name='pk_salary_earnings_id'),
+        Index('idx_salary_earnings_payroll_period_id', 'payroll_period_id', postgresql_where=text('is_active = true'))
     )
 
     id: Mapped[int] = mapped_column(BigInteger, primary_key=True)
@@ -1988,7 +2050,9 @@ class StaffPayslip(Base):
     __table_args__ = (
         ForeignKeyConstraint(['staff_id'], ['staff_profile.staff_id'], name='fk_staff_payslip_staff_id'),
         PrimaryKeyConstraint('id', name='pk_staff_payslip_id'),
-        UniqueConstraint('staff_id', 'payroll_month', name='uk_staff_payslip')
+        UniqueConstraint('staff_id', 'payroll_month', name='uk_staff_payslip'),
+        Index('idx_staff_payslip_payroll_month', 'payroll_month', postgresql_where=text('is_active = true')),
+        Index('idx_staff_payslip_staff_id_created_date', 'staff_id', text('created_date DESC NULLS LAST'), text('id DESC'), postgresql_where=text('is_active = true'))
     )
 
     id: Mapped[int] = mapped_column(BigInteger, primary_key=True)
@@ -2610,6 +2674,25 @@ class FoodOrder(Base):
     food_payment: Mapped[list['FoodPayment']] = relationship('FoodPayment', back_populates='order')
 
 
+class FreelancerStats(Base):
+    __tablename__ = 'freelancer_stats'
+    __table_args__ = (
+        ForeignKeyConstraint(['freelancer_id'], ['user_registration.id'], name='fk_freelancer_stats_freelancer_id'),
+        PrimaryKeyConstraint('freelancer_id', name='pk_freelancer_stats_freelancer_id'),
+        Index('idx_freelancer_stats_avg_rating', text('avg_rating DESC'), 'freelancer_id'),
+        Index('idx_freelancer_stats_active_jobs_avg_rating', 'active_jobs', text('avg_rating DESC'))
+    )
+
+    freelancer_id: Mapped[int] = mapped_column(BigInteger, primary_key=True)
+    total_jobs: Mapped[int] = mapped_column(Integer, nullable=False, server_default=text('0'))
+    active_jobs: Mapped[int] = mapped_column(Integer, nullable=False, server_default=text('0'))
+    rating_count: Mapped[int] = mapped_column(Integer, nullable=False, server_default=text('0'))
+    rating_sum: Mapped[int] = mapped_column(BigInteger, nullable=False, server_default=text('0'))
+    avg_rating: Mapped[decimal.Decimal] = mapped_column(Numeric(3, 2), nullable=False, server_default=text('0'))
+    last_job_at: Mapped[Optional[datetime.datetime]] = mapped_column(DateTime)
+    modified_date: Mapped[Optional[datetime.datetime]] = mapped_column(DateTime, server_default=text('now()'))
+
+
 class FreelancerTaskHistory(Base):
     __tablename__ = 'freelancer_task_history'
     __table_args__ = (
@@ -3382,17 +3465,37 @@ class StudentAttendance(Base):
     __table_args__ = (
         ForeignKeyConstraint(['user_id'], ['user_registration.id'], name='fk_student_attendance_user_id'),
         PrimaryKeyConstraint('id', name='pk_student_attendance_id'),
-        Index('idx_student_attendance_user_id', 'user_id')
+        Index('idx_student_attendance_user_id', 'user_id'),
+        Index('uk_student_attendance_user_id_active', 'user_id', unique=True, postgresql_where=text('is_active = true'))
     )
 
     id: Mapped[int] = mapped_column(BigInteger, primary_key=True)
     user_id: Mapped[Optional[int]] = mapped_column(BigInteger)
     attendance_percentage: Mapped[Optional[decimal.Decimal]] = mapped_column(Numeric(5, 2))
     is_active: Mapped[Optional[bool]] = mapped_column(Boolean, server_default=text('true'))
+    days_total: Mapped[int] = mapped_column(Integer, nullable=False, server_default=text('0'))
+    days_present: Mapped[int] = mapped_column(Integer, nullable=False, server_default=text('0'))
+    modified_date: Mapped[Optional[datetime.datetime]] = mapped_column(DateTime)
 
     user: Mapped[Optional['UserRegistration']] = relationship('UserRegistration', back_populates='student_attendance')
 
 
+class StudentAttendanceDay(Base):
+    __tablename__ = 'student_attendance_day'
+    __table_args__ = (
+        ForeignKeyConstraint(['user_id'], ['user_registration.id'], name='fk_student_attendance_day_user_id'),
+        PrimaryKeyConstraint('id', name='pk_student_attendance_day_id'),
+        UniqueConstraint('user_id', 'attendance_date', name='uk_student_attendance_day_user_id_date')
+    )
+
+    id: Mapped[int] = mapped_column(BigInteger, primary_key=True)
+    user_id: Mapped[int] = mapped_column(BigInteger, nullable=False)
+    attendance_date: Mapped[datetime.date] = mapped_column(Date, nullable=False)
+    present: Mapped[bool] = mapped_column(Boolean, nullable=False)
+    created_date: Mapped[Optional[datetime.datetime]] = mapped_column(DateTime, server_default=text('now()'))
+    modified_date: Mapped[Optional[datetime.datetime]] = mapped_column(DateTime)
+
+
 class StudentCertificate(Base):
     __tablename__ = 'student_certificate'
     __table_args__ = (
@@ -3450,6 +3553,9 @@ class StudentProfile(Base):
     __tablename__ = 'student_profile'
     __table_args__ = (
         ForeignKeyConstraint(['branch_id'], ['institution_branch.id'], name='fk_student_profile_branch_id'),
+        ForeignKeyConstraint(['district_id'], ['master_district.id'], name='fk_student_profile_district_id'),
+        ForeignKeyConstraint(['gender_id'], ['master_gender.id'], name='fk_student_profile_gender_id'),
+        ForeignKeyConstraint(['state_id'], ['master_state.id'], name='fk_student_profile_state_id'),
         PrimaryKeyConstraint('id', name='pk_student_profile_id'),
         UniqueConstraint('student_id', name='uk_student_profile_student_id')
     )
@@ -3467,6 +3573,9 @@ class StudentProfile(Base):
     modified_date: Mapped[Optional[datetime.datetime]] = mapped_column(DateTime)
     is_active: Mapped[Optional[bool]] = mapped_column(Boolean, server_default=text('true'))
     parent_mobile: Mapped[Optional[str]] = mapped_column(String(100))
+    gender_id: Mapped[Optional[int]] = mapped_column(Integer)
+    state_id: Mapped[Optional[int]] = mapped_column(Integer)
+    district_id: Mapped[Optional[int]] = mapped_column(Integer)
 
     branch: Mapped['InstitutionBranch'] = relationship('InstitutionBranch', back_populates='student_profile')
     student_academic_finance: Mapped['StudentAcademicFinance'] = relationship('StudentAcademicFinance', uselist=False, back_populates='student')
@@ -3483,7 +3592,8 @@ class StudentQualification(Base):
         PrimaryKeyConstraint('id', name='pk_student_qualification_id'),
         Index('idx_student_qualification_created_by', 'created_by'),
         Index('idx_student_qualification_modified_by', 'modified_by'),
-        Index('idx_student_qualification_user_id', 'user_id')
+        Index('idx_student_qualification_user_id', 'user_id'),
+        Index('idx_student_qualification_percentage_value', text('percentage_value DESC'), text('id DESC'), postgresql_where=text('is_active = true AND percentage_value IS NOT NULL'))
     )
 
     id: Mapped[int] = mapped_column(BigInteger, primary_key=True)
@@ -3496,6 +3606,7 @@ class StudentQualification(Base):
     modified_by: Mapped[Optional[int]] = mapped_column(BigInteger)
     modified_date: Mapped[Optional[datetime.datetime]] = mapped_column(DateTime)
     is_active: Mapped[Optional[bool]] = mapped_column(Boolean, server_default=text('true'))
+    percentage_value: Mapped[Optional[decimal.Decimal]] = mapped_column(Numeric(5, 2), Computed("CASE WHEN replace(replace(btrim(percentage), '%', ''), ' ', '') ~ '^[0-9]{1,3}(\\.[0-9]+)?$' THEN CASE WHEN replace(replace(btrim(percentage), '%', ''), ' ', '')::numeric <= 100 THEN round(replace(replace(btrim(percentage), '%', ''), ' ', '')::numeric, 2) END END", persisted=True))
 
     user_registration: Mapped[Optional['UserRegistration']] = relationship('UserRegistration', foreign_keys=[created_by], back_populates='student_qualification')
     user_registration_: Mapped[Optional['UserRegistration']] = relationship('UserRegistration', foreign_keys=[modified_by], back_populates='student_qualification_')
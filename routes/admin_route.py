@@ -1,4 +1,5 @@
 from fastapi import APIRouter, Depends, Request, Response, Header, HTTPException, status
+from core.pagination import PageParams, page_response
 from sqlalchemy.orm import Session, joinedload
 from core.database import get_db
 from core.constants import ADMIN_ROLE_ID, CUSTOMER_ROLE_ID, FREELANCER_ROLE_ID
@@ -15,9 +16,9 @@ def register_admin(request: RegisterAdmin, db: Session = Depends(get_db)):
     return register_admin_service(request, db)
 
 @router.post("/login")
-def admin_login(request: AdminLogin, db: Session = Depends(get_db), req: Request = None):
+async def admin_login(request: AdminLogin, db: Session = Depends(get_db), req: Request = None):
     """Admin login endpoint. Returns JWT tokens and admin info."""
-    return admin_login_service(request, db, req)
+    return await admin_login_service(request, db, req)
 
 @router.get("/admin/profile")
 def get_admin_profile(payload = Depends(verify_admin_token)):
@@ -147,8 +148,8 @@ def get_freelancer_list(db: Session = Depends(get_db)):
     return freelancers
 
 @router.get("/customers")
-def get_all_customers(db: Session = Depends(get_db)):
-    return get_all_customers_service(db)
+def get_all_customers(response: Response, page: PageParams = Depends(), db: Session = Depends(get_db)):
+    return page_response(response, get_all_customers_service(db, page))
 
 @router.get("/customer/{customer_id}")
 def get_customer_full_details(customer_id: int, db: Session = Depends(get_db)):
@@ -0,0 +1,34 @@
+from fastapi import APIRouter, Depends, HTTPException, status
+from sqlalchemy.orm import Session
+from typing import List
+from core.database import get_db
+from core.dependencies import get_current_admin
+from schemas.ai_search_schema import VectorSearchRequest, VectorSearchHit, DocumentIngestRequest, DocumentIngestResponse
+from services.vector_search_service import search_documents
+from services.document_ingestion_service import SourceDocument, ingest_documents
+from utils.embedding_utils import get_embedder
+
+router = APIRouter(prefix="/api/ai", tags=["AI Search"])
+
+@router.post("/search", response_model=List[VectorSearchHit])
+def vector_search(payload: VectorSearchRequest, db: Session = Depends(get_db)):
+    embedding = payload.embedding
+    if embedding is None:
+        if not payload.query:
+            raise HTTPException(status_code=status.HTTP_400_BAD_REQUEST, detail="Provide embedding or query")
+        embedding = get_embedder().embed([payload.query])[0]
+    return search_documents(
+        db,
+        embedding,
+        k=payload.k,
+        metric=payload.metric,
+        language=payload.language,
+        metadata=payload.metadata,
+        ef_search=payload.ef_search,
+        probes=payload.probes
+    )
+
+@router.put("/documents", response_model=DocumentIngestResponse)
+def ingest_document(payload: DocumentIngestRequest, db: Session = Depends(get_db), admin=Depends(get_current_admin)):
+    document = SourceDocument(payload.doc_id, payload.content, payload.language, payload.metadata)
+    return ingest_documents(db, [document]).as_dict()
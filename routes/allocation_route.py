@@ -1,9 +1,11 @@
-from fastapi import APIRouter, Depends
+from fastapi import APIRouter, Depends, HTTPException, Query, status
 from sqlalchemy.orm import Session
+from app.config.settings import settings
 from core.database import get_db,SessionLocal
+from core.constants import ADMIN_ROLE_ID
 from core.dependencies import get_current_user
 from models.generated_models import UserRegistration
-from services.allocation_service import (get_allocation_options,auto_allocate_employee,manual_allocate_employee)
+from services.allocation_service import (get_allocation_options,auto_allocate_employee,manual_allocate_employee,auto_allocate_pending_batch)
 
 router = APIRouter(prefix="/api/allocation", tags=["Allocation"])
 
@@ -22,6 +24,12 @@ def allocation_options(booking_id: int,db: Session = Depends(get_db),user:UserRe
 def auto_allocate(booking_id: int,db: Session = Depends(get_db),current_user=Depends(get_current_user)):
     return auto_allocate_employee(db=db,booking_id=booking_id,system_user_id=current_user.id)
 
+@router.post("/auto-batch")
+def auto_allocate_batch(limit: int = Query(50, ge=1, le=settings.ALLOCATION_BATCH_MAX),db: Session = Depends(get_db),current_user=Depends(get_current_user)):
+    if current_user.role_id != ADMIN_ROLE_ID:
+        raise HTTPException(status_code=status.HTTP_403_FORBIDDEN,detail="Admin access required")
+    return auto_allocate_pending_batch(db=db,limit=limit,admin_id=current_user.id)
+
 @router.post("/manual/{booking_id}/{employee_id}")
 def manual_allocate(booking_id: int,employee_id: int,db: Session = Depends(get_db),current_user=Depends(get_current_user)):
     return manual_allocate_employee(
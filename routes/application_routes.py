@@ -1,7 +1,8 @@
-from fastapi import APIRouter,HTTPException, Depends, Query, Header
+from fastapi import APIRouter,HTTPException, Depends, Query, Header, Response
 from sqlalchemy.orm import Session
 from typing import List
 from core.database import get_db
+from core.pagination import PageParams, page_response
 from schemas.application_schema import (
     ApplicationUpdateRequest,
     ApplicationReviewResponse,
@@ -42,8 +43,13 @@ def get_application_internships(
     }
 
 @router.get("/trending", response_model=List[TrendingStudentResponse])
-def trending_students(db: Session = Depends(get_db)):
-    return get_trending_students(db)
+def trending_students(
+    response: Response,
+    page: PageParams = Depends(),
+    min_percentage: float = Query(80, ge=0, le=100),
+    db: Session = Depends(get_db)
+):
+    return page_response(response, get_trending_students(db, page, min_percentage))
 
 @router.get("/internship")
 def get_job_data(master_job_id: int | None = Query(None, description="Fetch Master Job Only"),job_id: int | None = Query(None, description="Fetch UI Success Card"),db: Session = Depends(get_db)):
@@ -233,7 +233,7 @@
 #     db: Session = Depends(get_db),
 # ):
 #     try:
-#         reset_token = fp_service.verify_otp(body.otp, db)
+#         reset_token = fp_service.verify_otp(body.email, body.otp, db)
 #     except fp_service.OtpExpired:
 #         raise HTTPException(
 #             status_code=status.HTTP_400_BAD_REQUEST,
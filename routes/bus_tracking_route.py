@@ -0,0 +1,144 @@
+import asyncio
+import json
+import secrets
+from typing import List, Optional
+from fastapi import APIRouter, Header, HTTPException, Query, Request, WebSocket, WebSocketDisconnect, status
+from fastapi.encoders import jsonable_encoder
+from fastapi.responses import StreamingResponse
+from app.config.settings import settings
+from core.database import SessionLocal
+from models.generated_models import BusAlertLog
+from schemas.bus_tracking_schema import BusPingBatch, BusPingResult, BusLiveState, BusLiveSummary
+from schemas.institution_schema import BusAlertResponse
+from services.bus_alert_service import bus_alert_pipeline
+from services.bus_tracking_service import bus_tracker
+
+# Position routes never touch the database: reads are served from the tracker's
+# memory. Alert streams read the open alerts once, for the initial snapshot.
+router = APIRouter(prefix="/institution/bus-tracking", tags=["Bus Tracking"])
+
+HEARTBEAT_SECONDS = 15
+ALERT_SNAPSHOT_LIMIT = 200
+
+
+def _bus_filter(bus_id: Optional[List[str]]) -> Optional[set]:
+    return set(bus_id) if bus_id else None
+
+
+@router.post("/pings", response_model=BusPingResult)
+def ingest_pings(payload: BusPingBatch, x_device_token: Optional[str] = Header(None)):
+    # no token configured means telemetry is switched off, never unauthenticated
+    if not settings.BUS_TELEMETRY_TOKEN:
+        raise HTTPException(status_code=status.HTTP_503_SERVICE_UNAVAILABLE, detail="Bus telemetry ingestion is not configured")
+    if not secrets.compare_digest(x_device_token or "", settings.BUS_TELEMETRY_TOKEN):
+        raise HTTPException(status_code=status.HTTP_401_UNAUTHORIZED, detail="Invalid device token")
+    return bus_tracker.ingest([ping.model_dump() for ping in payload.pings])
+
+
+@router.get("/live", response_model=List[BusLiveState])
+def live_overview(bus_id: Optional[List[str]] = Query(None)):
+    return bus_tracker.overview(_bus_filter(bus_id))
+
+
+@router.get("/live/summary", response_model=BusLiveSummary)
+def live_summary():
+    return bus_tracker.summary()
+
+
+@router.get("/live/{bus_id}", response_model=BusLiveState)
+def live_bus(bus_id: str):
+    state = bus_tracker.get(bus_id)
+    if not state:
+        raise HTTPException(status_code=404, detail="No position for this bus yet")
+    return state
+
+
+def _split_event(event: dict, default_name: str):
+    # events are shared between subscribers, so copy rather than pop
+    if "event" not in event:
+        return default_name, event
+    return event["event"], {k: v for k, v in event.items() if k != "event"}
+
+
+def _sse(request: Request, source, bus_ids: Optional[set], snapshot: list, event_name: str) -> StreamingResponse:
+    subscriber = source.subscribe(bus_ids)
+
+    async def events():
+        try:
+            yield f"event: snapshot\ndata: {json.dumps(snapshot, default=str)}\n\n"
+            while not await request.is_disconnected():
+                try:
+                    event = await asyncio.wait_for(subscriber.queue.get(), timeout=HEARTBEAT_SECONDS)
+                except asyncio.TimeoutError:
+                    yield ": keep-alive\n\n"
+                    continue
+                name, data = _split_event(event, event_name)
+                yield f"event: {name}\ndata: {json.dumps(data)}\n\n"
+        finally:
+            source.unsubscribe(subscriber)
+
+    return StreamingResponse(
+        events(),
+        media_type="text/event-stream",
+        headers={"Cache-Control": "no-cache", "X-Accel-Buffering": "no"}
+    )
+
+
+async def _socket(websocket: WebSocket, source, bus_ids: Optional[set], snapshot: list, event_name: str):
+    subscriber = source.subscribe(bus_ids)
+    try:
+        await websocket.send_json({"type": "snapshot", "data": jsonable_encoder(snapshot)})
+        while True:
+            event = await subscriber.queue.get()
+            name, data = _split_event(event, event_name)
+            await websocket.send_json({"type": name, "data": data})
+    except WebSocketDisconnect:
+        pass
+    finally:
+        source.unsubscribe(subscriber)
+
+
+@router.get("/stream")
+async def live_stream(request: Request, bus_id: Optional[List[str]] = Query(None)):
+    """Server-sent events: a `snapshot` event, then one `position` event per change."""
+    bus_ids = _bus_filter(bus_id)
+    return _sse(request, bus_tracker, bus_ids, bus_tracker.overview(bus_ids), "position")
+
+
+@router.websocket("/ws")
+async def live_socket(websocket: WebSocket, bus_id: Optional[List[str]] = Query(None)):
+    """Same events as /stream, as JSON messages {"type": "snapshot"|"position", "data": ...}."""
+    await websocket.accept()
+    bus_ids = _bus_filter(bus_id)
+    await _socket(websocket, bus_tracker, bus_ids, bus_tracker.overview(bus_ids), "position")
+
+
+def _open_alerts(bus_ids: Optional[set]) -> list:
+    db = SessionLocal()
+    try:
+        query = db.query(BusAlertLog).filter(BusAlertLog.resolved == False, BusAlertLog.is_active == True)
+        if bus_ids:
+            query = query.filter(BusAlertLog.bus_id.in_(bus_ids))
+        rows = query.order_by(BusAlertLog.created_date.desc(), BusAlertLog.id.desc()).limit(ALERT_SNAPSHOT_LIMIT).all()
+        return [BusAlertResponse.model_validate(row).model_dump(mode="json") for row in rows]
+    finally:
+        db.close()
+
+
+@router.get("/alerts/stream")
+async def alert_stream(request: Request, bus_id: Optional[List[str]] = Query(None)):
+    """
+    Server-sent events: a `snapshot` of open alerts (newest first, capped),
+    then `alert` (new or repeated) and `resolved` events as they happen.
+    """
+    bus_ids = _bus_filter(bus_id)
+    snapshot = await asyncio.to_thread(_open_alerts, bus_ids)
+    return _sse(request, bus_alert_pipeline, bus_ids, snapshot, "alert")
+
+
+@router.websocket("/alerts/ws")
+async def alert_socket(websocket: WebSocket, bus_id: Optional[List[str]] = Query(None)):
+    await websocket.accept()
+    bus_ids = _bus_filter(bus_id)
+    snapshot = await asyncio.to_thread(_open_alerts, bus_ids)
+    await _socket(websocket, bus_alert_pipeline, bus_ids, snapshot, "alert")
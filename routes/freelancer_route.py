@@ -20,8 +20,8 @@ def get_freelancer_status(freelancer_id: int,db: Session = Depends(get_db)):
   return freelancer_status_service(db, freelancer_id)
 
 @router.post("/login")
-def login_freelancer(payload: FreelancerLogin, response: Response, db: Session = Depends(get_db)):
-    return freelancer_login_service(db, payload, response)
+async def login_freelancer(payload: FreelancerLogin, response: Response, db: Session = Depends(get_db)):
+    return await freelancer_login_service(db, payload, response)
 
 @router.get("/{freelancer_id}")
 def get_freelancer_details(freelancer_id: int,db: Session = Depends(get_db)):
@@ -1,7 +1,8 @@
 from fastapi import APIRouter, Depends, Header, Path, Query, HTTPException, status
 from sqlalchemy.orm import Session
+from sqlalchemy.ext.asyncio import AsyncSession
 from typing import List, Optional
-from core.database import get_db
+from core.database import get_db, get_async_db
 from core.dependencies import get_current_user
 from models.generated_models import Appointments, DoctorProfile, ServiceRequests, UserRegistration
 from schemas.healthcare_schema import (
@@ -78,8 +79,8 @@ def release_ambulance(booking_id: int,db: Session = Depends(get_db)):
     return release_ambulance_booking(db, booking_id)
 
 @router.get("/available-hospitals")
-def fetch_available_hospitals(db: Session = Depends(get_db)):
-    return get_available_hospitals(db)
+async def fetch_available_hospitals(db: AsyncSession = Depends(get_async_db)):
+    return await get_available_hospitals(db)
 
 # @router.get("/available-labs")
 # def fetch_available_labs(db: Session = Depends(get_db)):
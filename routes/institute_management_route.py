@@ -3,11 +3,12 @@
 
 
 from email.mime import text
-from fastapi import APIRouter, Depends, Path
+from fastapi import APIRouter, Depends, Path, Response
 from fastapi.params import Query
 from sqlalchemy.orm import Session
 
 from core.database import get_db
+from core.pagination import PageParams, page_response
 from schemas.institution_schema import (
     BusFleetCreate,
     BusFleetResponse,
@@ -27,6 +28,8 @@ from schemas.institution_schema import (
     MaintenanceBudgetResponse,
     PayrollPeriodCreate,
     PayrollPeriodResponse,
+    PayrollRunCreate,
+    PayrollRunResponse,
     PayrollSummaryCreate,
     PayrollSummaryResponse,
     SalaryEarningsCreate,
@@ -53,6 +56,7 @@ from services.institution_service import (
     create_staff_profile,
     fetch_exam_schedule,
     get_all_alerts,
+    get_open_alerts,
     get_all_exam_reminders_service,
     get_all_staff,
     get_all_staff,
@@ -69,6 +73,7 @@ from services.institution_service import (
     get_bus_tracking_overview,
     get_bus_tracking_summary
 )
+from services.payroll_run_service import get_payroll_run, run_payroll
 
 router = APIRouter(prefix="/institution/management",tags=["Institution Management"])
 @router.get("/management-overview")
@@ -115,8 +120,12 @@ def create_bus_alert_api(payload: BusAlertCreate,db: Session = Depends(get_db)):
 
 
 @router.get("/bus/alerts",response_model=list[BusAlertResponse])
-def get_all_alerts_api(db: Session = Depends(get_db)):
-    return get_all_alerts(db)
+def get_all_alerts_api(response: Response,resolved: bool | None = Query(None),page: PageParams = Depends(),db: Session = Depends(get_db)):
+    return page_response(response, get_all_alerts(db, page, resolved))
+
+@router.get("/bus/alerts/open",response_model=list[BusAlertResponse])
+def get_open_alerts_api(response: Response,bus_id: str | None = Query(None),page: PageParams = Depends(),db: Session = Depends(get_db)):
+    return page_response(response, get_open_alerts(db, page, bus_id))
 
 @router.put("/bus/{alert_id}",response_model=BusAlertResponse)
 def update_bus_alert_api(alert_id: int = Path(..., gt=0),payload: BusAlertUpdate = None,db: Session = Depends(get_db)):
@@ -273,6 +282,29 @@ def create_salary_earnings_api(
     return create_salary_earnings(db, payload)
 
 
+@router.post(
+    "/payroll-run",
+    response_model=PayrollRunResponse
+)
+def run_payroll_api(
+    payload: PayrollRunCreate,
+    db: Session = Depends(get_db)
+):
+    # generates every payslip of the period; safe to repeat, an interrupted run resumes
+    return run_payroll(db, payload.payroll_period_id, payload.payroll_month, payload.created_by)
+
+
+@router.get(
+    "/payroll-run/{payroll_period_id}",
+    response_model=PayrollRunResponse
+)
+def get_payroll_run_api(
+    payroll_period_id: int,
+    db: Session = Depends(get_db)
+):
+    return get_payroll_run(db, payroll_period_id)
+
+
 
 
 @router.get("/salary-summary")
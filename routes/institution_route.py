@@ -1,4 +1,4 @@
-from fastapi import APIRouter, Depends, Path, Query, HTTPException
+from fastapi import APIRouter, Depends, File, Path, Query, HTTPException, Response, UploadFile
 from sqlalchemy.orm import Session
 from typing import List
 from datetime import datetime, timedelta
@@ -7,6 +7,7 @@ from core.dependencies import get_current_user
 from models.generated_models import InstitutionRegistration, UserRegistration
 
 from core.database import get_db
+from core.pagination import PageParams, page_response
 
 from schemas.institution_schema import (
     BusAlertCreate,
@@ -28,6 +29,7 @@ from schemas.institution_schema import (
     StudentAcademicFinanceResponse,
     StudentFeeInstallmentCreateSchema,
     StudentFeeInstallmentResponseSchema,
+    StudentImportResponse,
     StudentProfileCreate,
     StudentProfileUpdate,
     StudentProfileResponse,
@@ -44,6 +46,8 @@ from services.healthcare_service import (
     create_payment
 )
 
+from services.student_import_service import import_students
+
 
 from services.institution_service import (
     create_bus,
@@ -176,9 +180,11 @@ def create_branch_api(payload: InstitutionBranchCreate,db: Session = Depends(get
 
 # @router.get("/all/branches")
 # def get_all_branches_api(
+#     response: Response,
+#     page: PageParams = Depends(),
 #     db: Session = Depends(get_db)
 # ):
-#     return get_all_branches(db)
+#     return page_response(response, get_all_branches(db, page))
 
 
 @router.get("/institution/{institution_id}/branches",response_model=list[InstitutionBranchResponse])
@@ -211,9 +217,21 @@ def preview_branch_directory(
 def create_student_api(payload: StudentProfileCreate,db: Session = Depends(get_db)):
     return create_student_profile(db, payload)
 
+@router.post("/students/import",response_model=StudentImportResponse)
+def import_students_api(
+    file: UploadFile = File(..., description="CSV or XLSX with a header row: student_id, student_name, academic_year, branch_id or branch_code, and optionally parent_mobile, profile_image_url, gender, state, district"),
+    institution_id: int | None = Query(None, gt=0, description="Only accept branches of this institution"),
+    branch_id: int | None = Query(None, gt=0, description="Branch for rows without a branch column"),
+    dry_run: bool = Query(False, description="Validate only, write nothing"),
+    created_by: int | None = Query(None),
+    db: Session = Depends(get_db)
+):
+    report = import_students(db, file.file, file.filename, institution_id, branch_id, created_by, dry_run)
+    return report.as_dict()
+
 @router.get("/students",response_model=list[StudentProfileResponse])
-def get_students_api(db: Session = Depends(get_db)):
-    return get_all_students(db)
+def get_students_api(response: Response,page: PageParams = Depends(),db: Session = Depends(get_db)):
+    return page_response(response, get_all_students(db, page))
 
 @router.get("/by-branch")
 def get_students_by_branch_api(branch_id: int = Query(..., gt=0),db: Session = Depends(get_db)):
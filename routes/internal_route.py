@@ -0,0 +1,16 @@
+from fastapi import APIRouter, Depends
+from app.config.settings import settings
+from core.db_pool import get_pool_metrics
+from core.dependencies import get_current_admin
+
+# pool sizing and DSN-derived details are for operators only
+router = APIRouter(prefix="/internal", tags=["Internal"], include_in_schema=False, dependencies=[Depends(get_current_admin)])
+
+@router.get("/db-pool")
+def db_pool_metrics():
+    return {
+        "pre_ping": settings.DB_POOL_PRE_PING,
+        "ping_idle_seconds": settings.DB_POOL_PING_IDLE_SECONDS,
+        "pgbouncer_mode": settings.DB_PGBOUNCER_MODE,
+        "pools": get_pool_metrics(),
+    }
@@ -41,7 +41,8 @@ def get_opening(job_id: int,db: Session = Depends(get_db)):
     if not job:
         raise HTTPException(status_code=404, detail="Job opening not found")
     return job
-from fastapi import APIRouter, Depends, Query
+from fastapi import APIRouter, Depends, Query, Response
+from core.pagination import PageParams, page_response
 from sqlalchemy.orm import Session
 
 @router.get("/active")
@@ -76,6 +77,8 @@ def get_my_job_applications(db: Session = Depends(get_db),current_user: UserRegi
 
 @router.get("",response_model=List[CompanyListResponse],summary="Get all companies ")
 def get_companies_api(
+    response: Response,
+    page: PageParams = Depends(),
     industry_id: Optional[int] = Query(None),
     company_size_id: Optional[int] = Query(None),
     location: Optional[str] = Query(None),
@@ -86,10 +89,11 @@ def get_companies_api(
     db: Session = Depends(get_db)
 ):
 
-    return get_all_companies(
+    return page_response(response, get_all_companies(
         db=db,
+        page=page,
         industry_id=industry_id,
         company_size_id=company_size_id,
         location=location,
         sort_by=sort_by
-    )
+    ))
@@ -0,0 +1,17 @@
+from fastapi import APIRouter, Depends, Request
+from sqlalchemy.orm import Session
+from core.database import get_db
+from core.http_cache import cached_response
+from services.master_data_service import get_master_data, get_master_data_version, get_active_time_slots, get_time_slot_version
+
+router = APIRouter(prefix="/api/master-data", tags=["Master Data"])
+
+MASTER_DATA_MAX_AGE = 300
+
+@router.get("")
+def fetch_master_data(request: Request, db: Session = Depends(get_db)):
+    return cached_response(request,"master_data",get_master_data_version(db),MASTER_DATA_MAX_AGE,lambda: get_master_data(db))
+
+@router.get("/time-slots")
+def fetch_time_slots(request: Request, db: Session = Depends(get_db)):
+    return cached_response(request,"time_slots",get_time_slot_version(db),MASTER_DATA_MAX_AGE,lambda: get_active_time_slots(db))
@@ -1,13 +1,16 @@
 from fastapi import APIRouter, Depends, Query
 from sqlalchemy.orm import Session
-from typing import List, Optional
+from sqlalchemy.ext.asyncio import AsyncSession
+from typing import List, Literal, Optional
 
-from core.database import get_db
+from core.database import get_db, get_async_db
+from core.dependencies import get_current_admin, get_current_user
 from models.generated_models import HomeServiceBooking
 from schemas.home_schema import (
     HomeServiceBookingCreateSchema,
     HomeServiceBookingMapCreateSchema,
     HomeServiceBookingMapResponseSchema,
+    HomeServiceBookingRatingSchema,
     HomeServiceBookingResponseSchema,
     MasterMechanicCreateSchema,
     MasterMechanicResponseSchema, HomeServiceBookingAddOnCreate, 
@@ -15,6 +18,7 @@ from schemas.home_schema import (
     HomeServicePaymentCreate,
       HomeServicePaymentResponse
 )
+from services.export_service import export_home_service_bookings, export_home_service_payments, export_response
 from services.master_module_service import (
     create_booking_service_map,
     create_home_service_booking,
@@ -36,6 +40,7 @@ from services.master_module_service import (
 
 
     get_home_service_booking_summary,
+    rate_home_service_booking,
 )
 
 router = APIRouter(prefix="/api/home-service/bookings",tags=["Home Service Booking"])
@@ -46,13 +51,23 @@ def create_booking(payload: HomeServiceBookingCreateSchema,db: Session = Depends
     return create_home_service_booking(db, payload)
 
 @router.get("/all")
-def fetch_all_home_service_bookings(db: Session = Depends(get_db)):
+async def fetch_all_home_service_bookings(db: AsyncSession = Depends(get_async_db)):
     return {
         "status": True,
-        "data": get_all_home_service_bookings(db)
+        "data": await get_all_home_service_bookings(db)
     }
 
 
+@router.put("/{booking_id}/rating")
+def rate_booking(booking_id: int, payload: HomeServiceBookingRatingSchema, db: Session = Depends(get_db), current_user=Depends(get_current_user)):
+    return rate_home_service_booking(db, booking_id, payload.rating, current_user.id)
+
+
+@router.get("/export")
+def export_all_home_service_bookings(export_format: Literal["ndjson", "csv"] = Query("ndjson", alias="format"), admin=Depends(get_current_admin)):
+    return export_response(export_home_service_bookings(export_format), "home_service_bookings", export_format)
+
+
 @router.post("/mechanics",response_model=MasterMechanicResponseSchema,status_code=201)
 def create_mechanic(payload: MasterMechanicCreateSchema,db: Session = Depends(get_db)):
     return create_master_mechanic(db, payload)
@@ -100,6 +115,10 @@ def create_payment(data: HomeServicePaymentCreate,db: Session = Depends(get_db))
 def get_all_payments(db: Session = Depends(get_db)):
     return get_all_home_service_payments(db)
 
+@router.get("/home-service-payment/export")
+def export_all_payments(export_format: Literal["ndjson", "csv"] = Query("ndjson", alias="format"), admin=Depends(get_current_admin)):
+    return export_response(export_home_service_payments(export_format), "home_service_payments", export_format)
+
 
 # # -------- GET BY BOOKING ID --------
 # @router.get(
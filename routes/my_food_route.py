@@ -1,6 +1,11 @@
-from fastapi import APIRouter, Depends
+from fastapi import APIRouter, Depends, Query, Request, Response
+from typing import Literal
 from sqlalchemy.orm import Session
 from core.database import get_db
+from core.dependencies import get_current_admin
+from core.http_cache import cached_response, get_data_version
+from core.pagination import PageParams, page_response
+from services.export_service import export_food_orders, export_response
 from schemas.my_food_schema import FoodOrderCreate, FoodOrderRefundRequestCreate, FoodOrderRefundRequestResponse, FoodOrderResponse, MyFoodRegistrationCreate, MyFoodRegistrationUpdate, MyFoodRegistrationResponse
 from services.my_food_service import (create_food_order, create_refund_request, get_all_refund_requests,get_food_orders,get_food_order_by_id, get_items_by_restaurant_and_category, get_refund_request_by_id, get_restaurant_view_data, create_my_food_registration, get_my_food_registration, get_all_my_food_registrations, update_my_food_registration, delete_my_food_registration)
 from schemas.my_food_schema import FoodOrderCreate, FoodOrderResponse, FoodOrderStatusHistoryCreate, FoodOrderRefundRequestCreate, FoodOrderReviewCreate
@@ -8,6 +13,8 @@ from services.my_food_service import (create_food_order,get_food_orders,get_food
 
 router = APIRouter(prefix="/food-orders", tags=["Customer Food Orders"])
 
+FOOD_MENU_MAX_AGE = 60
+
 
 # -----------------------------
 # FOOD ORDER APIs
@@ -19,8 +26,13 @@ def create_order(order: FoodOrderCreate, db: Session = Depends(get_db)):
 
 
 @router.get("/", response_model=list[FoodOrderResponse])
-def list_orders(db: Session = Depends(get_db)):
-    return get_food_orders(db)
+def list_orders(response: Response, page: PageParams = Depends(), db: Session = Depends(get_db)):
+    return page_response(response, get_food_orders(db, page))
+
+
+@router.get("/export")
+def export_orders(export_format: Literal["ndjson", "csv"] = Query("ndjson", alias="format"), admin=Depends(get_current_admin)):
+    return export_response(export_food_orders(export_format), "food_orders", export_format)
 
 
 @router.get("/order/{order_id}", response_model=FoodOrderResponse)
@@ -36,8 +48,8 @@ def create_refund(
     return create_refund_request(db, refund)
 
 @router.get("/refund/all")
-def get_all_refunds(db: Session = Depends(get_db)):
-    return get_all_refund_requests(db)
+def get_all_refunds(response: Response, page: PageParams = Depends(), db: Session = Depends(get_db)):
+    return page_response(response, get_all_refund_requests(db, page))
 
 
 @router.get("/refund/{refund_id}", response_model=FoodOrderRefundRequestResponse)
@@ -46,20 +58,29 @@ def get_refund(refund_id: int, db: Session = Depends(get_db)):
 
 @router.get("/items")
 def get_items(
+    request: Request,
     restaurant_id: int,
     category_id: int,
     db:Session = Depends(get_db)
 ):
     
-    return get_items_by_restaurant_and_category(
-        db,
-        restaurant_id,
-        category_id
+    return cached_response(
+        request,
+        ("food_items", restaurant_id, category_id),
+        get_data_version("food_menu"),
+        FOOD_MENU_MAX_AGE,
+        lambda: get_items_by_restaurant_and_category(db, restaurant_id, category_id)
     )
 
 @router.get("/view")
-def get_restaurant_data(restaurant_id: int,category_id:int,db:Session = Depends(get_db)):
-    return get_restaurant_view_data(db,restaurant_id,category_id)
+def get_restaurant_data(request: Request,restaurant_id: int,category_id:int,db:Session = Depends(get_db)):
+    return cached_response(
+        request,
+        ("food_view", restaurant_id, category_id),
+        get_data_version("food_menu"),
+        FOOD_MENU_MAX_AGE,
+        lambda: get_restaurant_view_data(db,restaurant_id,category_id)
+    )
 @router.post("/food-order-status-history")
 def create_food_order_status_history_api(
     payload: FoodOrderStatusHistoryCreate,
@@ -1,7 +1,8 @@
-from fastapi import APIRouter, Depends
+from fastapi import APIRouter, Depends, Response
 from sqlalchemy.orm import Session
 
 from core.database import SessionLocal
+from core.pagination import PageParams, page_response
 from services.partner_registration_service import (
     create_companies_registration,
     create_doctor_registration,
@@ -165,10 +166,14 @@ def create_my_food_registration_api(
 
 @router.get("/companies")
 def get_companies_api(
+    response: Response,
     company_id: int | None = None,
+    page: PageParams = Depends(),
     db: Session = Depends(get_db)
 ):
-    return get_companies(db, company_id)
+    if company_id:
+        return get_companies(db, company_id)
+    return page_response(response, get_companies(db, page=page))
 
 
 @router.get("/training")
@@ -181,18 +186,26 @@ def get_training_api(
 
 @router.get("/hospitals")
 def get_hospitals_api(
+    response: Response,
     hospital_id: int | None = None,
+    page: PageParams = Depends(),
     db: Session = Depends(get_db)
 ):
-    return get_hospitals(db, hospital_id)
+    if hospital_id:
+        return get_hospitals(db, hospital_id)
+    return page_response(response, get_hospitals(db, page=page))
 
 
 @router.get("/labs")
 def get_labs_api(
+    response: Response,
     lab_id: int | None = None,
+    page: PageParams = Depends(),
     db: Session = Depends(get_db)
 ):
-    return get_labs(db, lab_id)
+    if lab_id:
+        return get_labs(db, lab_id)
+    return page_response(response, get_labs(db, page=page))
 
 
 @router.get("/medical-stores")
@@ -205,18 +218,26 @@ def get_medical_stores_api(
 
 @router.get("/doctors")
 def get_doctors_api(
+    response: Response,
     doctor_id: int | None = None,
+    page: PageParams = Depends(),
     db: Session = Depends(get_db)
 ):
-    return get_doctors(db, doctor_id)
+    if doctor_id:
+        return get_doctors(db, doctor_id)
+    return page_response(response, get_doctors(db, page=page))
 
 
 @router.get("/students")
 def get_students_api(
+    response: Response,
     student_id: int | None = None,
+    page: PageParams = Depends(),
     db: Session = Depends(get_db)
 ):
-    return get_students(db, student_id)
+    if student_id:
+        return get_students(db, student_id)
+    return page_response(response, get_students(db, page=page))
 
 
 @router.get("/general-education")
@@ -229,7 +250,11 @@ def get_general_education_api(
 
 @router.get("/my-food")
 def get_my_food_api(
+    response: Response,
     food_id: int | None = None,
+    page: PageParams = Depends(),
     db: Session = Depends(get_db)
 ):
-    return get_my_food(db, food_id)
\ No newline at end of file
+    if food_id:
+        return get_my_food(db, food_id)
+    return page_response(response, get_my_food(db, page=page))
\ No newline at end of file
@@ -1,8 +1,9 @@
-from fastapi import APIRouter, Depends,Query
+from fastapi import APIRouter, Depends,Query,Response
 from requests import session
 from sqlalchemy.orm import Session
 from typing import List
 from core.database import get_db
+from core.pagination import PageParams, page_response
 from schemas.property_sell_listing_schema import (
     PropertySellListingCreate,
     PropertySellListingUpdate,
@@ -62,8 +63,8 @@ def create_listing(payload: PropertyListingCreate,db: Session = Depends(get_db))
     return create_property_listing(db, payload)
 
 @router.get("/listing/all",response_model=list[PropertyListingResponse])
-def get_listing_by_id(db: Session = Depends(get_db)):
-    return get_all_property_listings(db)
+def get_listing_by_id(response: Response,page: PageParams = Depends(),db: Session = Depends(get_db)):
+    return page_response(response, get_all_property_listings(db, page))
 
 
 # @router.get("/listing/{listing_id}",response_model=PropertyListingResponse)
@@ -0,0 +1,49 @@
+from typing import List
+from fastapi import APIRouter, Depends, Query, Response
+from sqlalchemy.orm import Session
+from core.database import get_db
+from schemas.search_schema import JobSearchHit, CompanySearchHit, PropertySearchHit
+from services.text_search_service import (
+    search_job_openings,
+    search_companies,
+    search_property_sell_listings
+)
+
+router = APIRouter(prefix="/api/search", tags=["Search"])
+
+MAX_SEARCH_LIMIT = 100
+# deep OFFSET pages get slower linearly; ranked search is for the first few pages
+MAX_SEARCH_OFFSET = 1000
+
+
+class SearchParams:
+    def __init__(
+        self,
+        q: str = Query(..., min_length=2, max_length=200, description="Keywords; quotes, OR and -term are supported"),
+        limit: int = Query(20, ge=1, le=MAX_SEARCH_LIMIT),
+        offset: int = Query(0, ge=0, le=MAX_SEARCH_OFFSET),
+    ):
+        self.q = q
+        self.limit = limit
+        self.offset = offset
+
+
+def _respond(response: Response, result) -> list:
+    rows, total = result
+    response.headers["X-Total-Count"] = str(total)
+    return rows
+
+
+@router.get("/jobs", response_model=List[JobSearchHit])
+def search_jobs_api(response: Response, params: SearchParams = Depends(), db: Session = Depends(get_db)):
+    return _respond(response, search_job_openings(db, params.q, params.limit, params.offset))
+
+
+@router.get("/companies", response_model=List[CompanySearchHit])
+def search_companies_api(response: Response, params: SearchParams = Depends(), db: Session = Depends(get_db)):
+    return _respond(response, search_companies(db, params.q, params.limit, params.offset))
+
+
+@router.get("/properties", response_model=List[PropertySearchHit])
+def search_properties_api(response: Response, params: SearchParams = Depends(), db: Session = Depends(get_db)):
+    return _respond(response, search_property_sell_listings(db, params.q, params.limit, params.offset))
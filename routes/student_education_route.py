@@ -1,7 +1,8 @@
-from fastapi import APIRouter, Depends, HTTPException
+from fastapi import APIRouter, Depends, HTTPException, Query, Response
 from sqlalchemy.orm import Session
 from typing import List
 from core.database import get_db
+from core.pagination import MAX_PAGE_SIZE, Page, PageParams, page_response
 from schemas.student_education_schema import (
     StudentListResponse,
     StudentProfileResponse,
@@ -13,6 +14,8 @@ from schemas.student_family_schema import (
     StudentFamilyMemberUpdate,
 )
 from schemas.student_attendance_schema import (
+    StudentAttendanceBatchCreate,
+    StudentAttendanceBatchResponse,
     StudentAttendanceCreate,
     StudentAttendanceResponse,
 )
@@ -32,7 +35,7 @@ from services.student_education_service import (
     get_students_list_service,
     get_top_performers_service,
 )
-from services.student_attendance_service import upsert_student_attendance
+from services.student_attendance_service import record_attendance_batch, upsert_student_attendance
 from services.student_family_service import (
     add_family_member_service,
     hard_delete_family_member_service,
@@ -49,17 +52,24 @@ router = APIRouter(prefix="/api/education", tags=["Student Education"])
 
 @router.get("/students-list")
 def get_students_list(
+    response: Response,
     skill_id: int | None = None,
     aggregate: str | None = None,
     internship_status: str | None = None,
+    sort_by: str | None = Query(None, description="rating | attendance | joined_date (default)"),
+    page: PageParams = Depends(),
     db: Session = Depends(get_db),
 ):
-    return get_students_list_service(
+    students, next_cursor = get_students_list_service(
         db=db,
         skill_id=skill_id,
         aggregate=aggregate,
         internship_status=internship_status,
+        sort_by=sort_by,
+        limit=page.limit,
+        cursor=page.cursor,
     )
+    return page_response(response, Page(students, next_cursor, None))
 
 
 @router.get(
@@ -181,6 +191,20 @@ def add_full_student_profile(
     return {"message": "Student profile updated successfully", "data": results}
 
 
+@router.post(
+    "/students/attendance/batch",
+    response_model=StudentAttendanceBatchResponse,
+)
+def record_student_attendance_batch(
+    payload: StudentAttendanceBatchCreate,
+    db: Session = Depends(get_db),
+):
+    return record_attendance_batch(
+        db,
+        [(r.user_id, r.attendance_date, r.present) for r in payload.records],
+    )
+
+
 @router.post(
     "/students/{student_id}/attendance",
     response_model=StudentAttendanceResponse,
@@ -217,7 +241,7 @@ def update_student_internship_status(
     "/students/top-performers",
     response_model=List[StudentListResponse],
 )
-def get_top_performers(limit: int = 10, db: Session = Depends(get_db)):
+def get_top_performers(limit: int = Query(10, ge=1, le=MAX_PAGE_SIZE), db: Session = Depends(get_db)):
     return get_top_performers_service(db, limit)
 
 
@@ -225,7 +249,7 @@ def get_top_performers(limit: int = 10, db: Session = Depends(get_db)):
     "/students/recent-joiners",
     response_model=List[StudentListResponse],
 )
-def get_recent_joiners(limit: int = 10, db: Session = Depends(get_db)):
+def get_recent_joiners(limit: int = Query(10, ge=1, le=MAX_PAGE_SIZE), db: Session = Depends(get_db)):
     return get_recent_joiners_service(db, limit)
 
 
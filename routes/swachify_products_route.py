@@ -1,7 +1,8 @@
-from fastapi import APIRouter, Depends, HTTPException, Query
+from fastapi import APIRouter, Depends, HTTPException, Query, Response
 from sqlalchemy.orm import Session
 from typing import List
 from core.database import get_db
+from core.pagination import PageParams, page_response
 from schemas.swachify_products_schema import (
     ProductOrderCreate,
     ProductOrderResponse,
@@ -48,8 +49,8 @@ def get_product(product_id: int,db: Session = Depends(get_db)):
     return get_product_registration_by_id(db, product_id)
 
 @router.get("/",response_model=List[ProductRegistrationResponse])
-def get_products(db: Session = Depends(get_db)):
-    return get_all_product_registrations(db)
+def get_products(response: Response,page: PageParams = Depends(),db: Session = Depends(get_db)):
+    return page_response(response, get_all_product_registrations(db, page))
 
 # @router.put("/{product_id}",response_model=ProductRegistrationResponse)
 # def update_product(product_id: int,payload: ProductRegistrationUpdate,db: Session = Depends(get_db)):
@@ -199,8 +199,8 @@ def register(payload: RegisterUser, db: Session = Depends(get_db)):
     "/login",
     response_model=LoginResponse
 )
-def login(payload: LoginRequest, db: Session = Depends(get_db)):
-    return login_user(db, payload)
+async def login(payload: LoginRequest, db: Session = Depends(get_db)):
+    return await login_user(db, payload)
 
 
 @router.post("/forgot-password")
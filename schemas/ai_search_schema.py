@@ -0,0 +1,41 @@
+from pydantic import BaseModel, Field
+from typing import Any, List, Literal, Optional
+
+
+class VectorSearchRequest(BaseModel):
+    # either a precomputed embedding or text to embed with the configured embedder
+    embedding: Optional[List[float]] = None
+    query: Optional[str] = None
+    k: int = Field(10, ge=1, le=100)
+    metric: Literal["cosine", "l2"] = "cosine"
+    language: Optional[str] = None
+    metadata: Optional[dict] = None
+    ef_search: Optional[int] = Field(None, ge=1, le=1000)
+    probes: Optional[int] = Field(None, ge=1, le=1000)
+
+
+class VectorSearchHit(BaseModel):
+    id: int
+    doc_id: str
+    chunk_id: int
+    content: str
+    language: Optional[str] = None
+    metadata: Optional[Any] = None
+    distance: float
+
+
+class DocumentIngestRequest(BaseModel):
+    doc_id: str = Field(max_length=150)
+    content: str
+    language: Optional[str] = Field(None, max_length=50)
+    metadata: Optional[dict] = None
+
+
+class DocumentIngestResponse(BaseModel):
+    documents: int
+    chunks: int
+    skipped_unchanged: int
+    written: int
+    removed_stale: int
+    seconds: float
+    chunks_per_second: float
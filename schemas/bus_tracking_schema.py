@@ -0,0 +1,51 @@
+from pydantic import BaseModel, Field, field_validator
+from typing import Dict, List, Optional
+from datetime import datetime
+
+
+class BusPing(BaseModel):
+    bus_id: str = Field(max_length=20)
+    latitude: Optional[float] = Field(None, ge=-90, le=90)
+    longitude: Optional[float] = Field(None, ge=-180, le=180)
+    current_speed: Optional[float] = Field(None, ge=0, le=999.99)
+    next_stop: Optional[str] = Field(None, max_length=100)
+    # bus_tracking_status.eta_minutes is an int4 column
+    eta_minutes: Optional[int] = Field(None, ge=0, le=2147483647)
+    status: Optional[str] = Field(None, max_length=50)
+    location_description: Optional[str] = None
+    recorded_at: Optional[datetime] = None
+
+    @field_validator("bus_id", mode="before")
+    @classmethod
+    def bus_id_as_text(cls, value):
+        # bus_fleet.bus_id is text, but devices often send it as a number
+        return str(value) if isinstance(value, int) else value
+
+
+class BusPingBatch(BaseModel):
+    pings: List[BusPing] = Field(min_length=1, max_length=5000)
+
+
+class BusPingResult(BaseModel):
+    accepted: int
+    stale: int
+    rejected: List[str]
+
+
+class BusLiveState(BaseModel):
+    bus_id: str
+    status: Optional[str] = None
+    latitude: Optional[float] = None
+    longitude: Optional[float] = None
+    current_speed: Optional[float] = None
+    next_stop: Optional[str] = None
+    eta_minutes: Optional[int] = None
+    location_description: Optional[str] = None
+    last_updated: Optional[datetime] = None
+
+
+class BusLiveSummary(BaseModel):
+    total_buses: int
+    moving: int
+    offline: int
+    by_status: Dict[str, int]
@@ -1,4 +1,4 @@
-from pydantic import BaseModel
+from pydantic import BaseModel, Field
 from typing import Optional
 from datetime import datetime
 from decimal import Decimal
@@ -126,6 +126,11 @@ class HomeServiceBookingResponseSchema(HomeServiceBookingCreateSchema):
     is_active: bool
 
 
+# home_service_booking.rating is a whole number of stars
+class HomeServiceBookingRatingSchema(BaseModel):
+    rating: int = Field(..., ge=1, le=5)
+
+
 
 
 
@@ -1,5 +1,5 @@
 from pydantic import BaseModel
-from pydantic import BaseModel, EmailStr
+from pydantic import BaseModel, EmailStr, Field
 from typing import Optional
 from datetime import date, datetime, time
 from decimal import Decimal
@@ -131,6 +131,23 @@ class StudentProfileUpdate(BaseModel):
     is_active: Optional[bool] = None
 
 
+class StudentImportRowError(BaseModel):
+    row: int
+    student_id: Optional[str] = None
+    errors: list[str]
+
+
+class StudentImportResponse(BaseModel):
+    rows: int
+    inserted: int
+    duplicates: int
+    invalid: int
+    errors: list[StudentImportRowError]
+    # row errors past STUDENT_IMPORT_MAX_ERRORS are only counted
+    errors_omitted: int
+    seconds: float
+
+
 class StudentProfileResponse(StudentProfileBase):
     id: int
     branch_id: Optional[int] = None
@@ -138,6 +155,9 @@ class StudentProfileResponse(StudentProfileBase):
     student_name: Optional[str] = None
     academic_year: Optional[str] = None
     profile_image_url: Optional[str] = None
+    gender_id: Optional[int] = None
+    state_id: Optional[int] = None
+    district_id: Optional[int] = None
     modified_by: Optional[int] = None
     is_active: Optional[bool] = None
     created_by: Optional[int]
@@ -207,13 +227,13 @@ class BusFleetResponse(BaseModel):
 
 class BusAlertCreate(BaseModel):
     bus_id: int 
-    alert_type: Optional[str] = None
+    alert_type: Optional[str] = Field(None, max_length=100)
     alert_message: Optional[str] = None
     created_by: Optional[int] = None
     is_active: Optional[bool] = True
 
 class BusAlertUpdate(BaseModel):
-    alert_type: Optional[str] = None
+    alert_type: Optional[str] = Field(None, max_length=100)
     alert_message: Optional[str] = None
     resolved: Optional[bool] = None
     modified_by: Optional[int] = None
@@ -227,6 +247,8 @@ class BusAlertResponse(BaseModel):
     alert_time: datetime
     resolved: bool
     is_active: bool
+    occurrence_count: int = 1
+    last_seen: Optional[datetime] = None
 
     class Config:
         from_attributes = True
@@ -524,6 +546,31 @@ class SalaryEarningsResponse(BaseModel):
         from_attributes = True
 
 
+class PayrollRunCreate(BaseModel):
+    payroll_period_id: int
+    # defaults to "<month> <year>" of the payroll period
+    payroll_month: Optional[str] = Field(None, max_length=20)
+    created_by: Optional[int] = None
+
+
+class PayrollRunResponse(BaseModel):
+    id: int
+    payroll_period_id: int
+    payroll_month: str
+    status: str
+    total_staff: int
+    processed_staff: int
+    generated_payslips: int
+    skipped_staff: int
+    last_staff_id: Optional[str]
+    error: Optional[str]
+    started_at: Optional[datetime]
+    finished_at: Optional[datetime]
+
+    class Config:
+        from_attributes = True
+
+
 
 class StudentFeeInstallmentCreateSchema(BaseModel):
     student_id: str
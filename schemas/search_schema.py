@@ -0,0 +1,44 @@
+from pydantic import BaseModel
+from typing import Optional
+from datetime import datetime
+from decimal import Decimal
+
+
+class JobSearchHit(BaseModel):
+    id: int
+    job_id: int
+    job_title: Optional[str] = None
+    company_name: str
+    location: Optional[str] = None
+    role_description: Optional[str] = None
+    sub_module_id: Optional[int] = None
+    category_id: Optional[int] = None
+    location_type_id: Optional[int] = None
+    work_type_id: Optional[int] = None
+    created_date: Optional[datetime] = None
+    rank: float
+
+
+class CompanySearchHit(BaseModel):
+    company_name: str
+    location: Optional[str] = None
+    jobs_count: int
+    internships_count: int
+    last_active_time: Optional[datetime] = None
+    rank: float
+
+
+class PropertySearchHit(BaseModel):
+    id: int
+    module_id: int
+    sub_module_id: Optional[int] = None
+    property_type_id: Optional[int] = None
+    expected_price: Optional[Decimal] = None
+    monthly_rent: Optional[Decimal] = None
+    bhk_type_id: Optional[int] = None
+    furnishing_id: Optional[int] = None
+    locality_area: Optional[str] = None
+    property_description: Optional[str] = None
+    upload_photos: Optional[str] = None
+    created_date: Optional[datetime] = None
+    rank: float
@@ -1,7 +1,10 @@
-from pydantic import BaseModel
+from pydantic import BaseModel, Field
 from typing import Optional
+from datetime import date
 from decimal import Decimal
 
+from app.config.settings import settings
+
 
 class StudentAttendanceCreate(BaseModel):
     attendance_percentage: Decimal
@@ -14,3 +17,29 @@ class StudentAttendanceResponse(BaseModel):
 
     class Config:
         from_attributes = True
+
+
+class StudentAttendanceRecord(BaseModel):
+    user_id: int
+    attendance_date: date
+    present: bool
+
+
+class StudentAttendanceBatchCreate(BaseModel):
+    records: list[StudentAttendanceRecord] = Field(..., min_length=1, max_length=settings.ATTENDANCE_BATCH_MAX_RECORDS)
+
+
+class StudentAttendanceTotals(BaseModel):
+    user_id: int
+    attendance_percentage: Optional[Decimal]
+    days_total: int
+    days_present: int
+
+
+class StudentAttendanceBatchResponse(BaseModel):
+    received: int
+    applied: int
+    # students whose counters moved; resent or unchanged days do not count
+    changed_students: int
+    rejected_user_ids: list[int]
+    students: list[StudentAttendanceTotals]
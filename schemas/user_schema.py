@@ -231,6 +231,7 @@
 
 
 # class VerifyOtpRequest(BaseModel):
+#     email: EmailStr
 #     otp: str = Field(min_length=4, max_length=8)
 
 
@@ -1,10 +1,14 @@
+import asyncio
 from sqlalchemy.orm import Session
+from core.pagination import PageParams, paginate
 from fastapi import HTTPException, status, Request
 from sqlalchemy import or_
 from models.generated_models import UserRegistration,HomeServiceBooking
 from schemas.admin_schema import RegisterAdmin, AdminLogin, UserBase
-from utils.hash_utils import hash_password, verify_password
+from utils.hash_utils import hash_password, verify_and_rehash_async
 from utils.jwt_utils import create_access_token, create_refresh_token, is_admin_already_logged_in
+from core.auth_cache import invalidate_principal
+from services.freelancer_stats_service import ensure_stats_row
 from core.constants import (
     ADMIN_ROLE_ID,
     CUSTOMER_ROLE_ID,
@@ -54,7 +58,19 @@ def register_admin_service(request: RegisterAdmin, db: Session):
         "data": admin
     }
 
-def admin_login_service(credentials: AdminLogin, db: Session, http_request: Request):
+def _find_admin(db: Session, identifier: str):
+    return db.query(UserRegistration).filter(
+        UserRegistration.role_id == ADMIN_ROLE_ID,
+        UserRegistration.is_active == True,
+        or_(
+            UserRegistration.email == identifier,
+            UserRegistration.mobile == identifier,
+            UserRegistration.unique_id == identifier,
+        )
+    ).first()
+
+
+async def admin_login_service(credentials: AdminLogin, db: Session, http_request: Request):
     """
     Authenticate admin and generate JWT tokens.
     
@@ -78,21 +94,19 @@ def admin_login_service(credentials: AdminLogin, db: Session, http_request: Requ
 
     identifier = credentials.username_or_email.strip()
 
-    admin = db.query(UserRegistration).filter(
-        UserRegistration.role_id == ADMIN_ROLE_ID,
-        UserRegistration.is_active == True,
-        or_(
-            UserRegistration.email == identifier,
-            UserRegistration.mobile == identifier,
-            UserRegistration.unique_id == identifier,
-        )
-    ).first()
+    # DB work runs on a worker thread; the password check is awaited on the hashing pool
+    admin = await asyncio.to_thread(_find_admin, db, identifier)
 
-    if not admin or not verify_password(credentials.password, admin.password):
+    is_valid, new_hash = await verify_and_rehash_async(credentials.password, admin.password) if admin else (False, None)
+    if not is_valid:
         raise HTTPException(
             status_code=status.HTTP_401_UNAUTHORIZED,
             detail="Invalid credentials"
         )
+
+    if new_hash:
+        admin.password = new_hash
+        await asyncio.to_thread(db.commit)
     
     # JWT token with role_id (consistent with freelancer and auth_dependencies)
     payload = {
@@ -158,6 +172,7 @@ def admin_update_service(db: Session, admin_id: int, payload: dict):
     admin.modified_date = datetime.utcnow()
 
     db.commit()
+    invalidate_principal(admin_id)
     db.refresh(admin)
     return {
         "message": "Admin details updated successfully",
@@ -192,6 +207,7 @@ def admin_delete_service(db: Session, admin_id: int):
     admin.modified_date = datetime.utcnow()
 
     db.commit()
+    invalidate_principal(admin_id)
     return {"message": "Admin deactivated successfully"}
 
 def admin_hard_delete_service(db: Session, admin_id: int):
@@ -205,6 +221,7 @@ def admin_hard_delete_service(db: Session, admin_id: int):
 
     db.delete(admin)
     db.commit()
+    invalidate_principal(admin_id)
     return {"message": "Admin deleted permanently"}
 
 def get_pending_freelancers_service(db: Session):
@@ -248,8 +265,10 @@ def approve_freelancer_service(db: Session, freelancer_id: int, admin_id: int):
     freelancer.status_id = STATUS_APPROVED
     freelancer.modified_by = admin_id
     freelancer.modified_date = datetime.utcnow()
+    ensure_stats_row(db, freelancer_id)
 
     db.commit()
+    invalidate_principal(freelancer_id)
     db.refresh(freelancer)
 
     return {
@@ -294,6 +313,7 @@ def reject_freelancer_service(db: Session, freelancer_id: int, admin_id: int):
     freelancer.modified_date = datetime.utcnow()
 
     db.commit()
+    invalidate_principal(freelancer_id)
     db.refresh(freelancer)
 
     return {
@@ -302,22 +322,23 @@ def reject_freelancer_service(db: Session, freelancer_id: int, admin_id: int):
         "rejected_by": admin_id
     }
     
-def get_all_customers_service(db: Session):
+def get_all_customers_service(db: Session, page: PageParams):
     """
-    Fetch all active customers (role_id = 2).
+    Fetch active customers (role_id = 2), newest first, one page at a time.
     
     Args:
         db: Database session
+        page: Cursor and page size
     
     Returns:
-        List of customer records
+        Page of customer records
     """
-    customers = db.query(UserRegistration).filter(
+    query = db.query(UserRegistration).filter(
         UserRegistration.role_id == CUSTOMER_ROLE_ID,
         UserRegistration.is_active == True
-    ).all()
+    )
     
-    return customers
+    return paginate(query, UserRegistration, page)
 
 
 def get_customer_details_service(db: Session, customer_id: int):
@@ -0,0 +1,175 @@
+import math
+import threading
+import time
+from dataclasses import dataclass
+from typing import Optional
+from sqlalchemy import and_, func, select
+from sqlalchemy.orm import Session
+from app.config.settings import settings
+from models.generated_models import UserRegistration, UserServices
+from services.freelancer_stats_service import get_stats
+from core.constants import FREELANCER_ROLE_ID, STATUS_APPROVED
+
+# grid cell size in degrees (~5.5 km of latitude)
+CELL_DEGREES = 0.05
+EARTH_RADIUS_KM = 6371.0
+
+# ranking weights: one open job costs as much as WORKLOAD_KM of extra travel,
+# one rating star is worth RATING_KM of travel
+WORKLOAD_KM = 5.0
+RATING_KM = 2.0
+
+
+def haversine_km(lat1: float, lon1: float, lat2: float, lon2: float) -> float:
+    lat1, lon1, lat2, lon2 = map(math.radians, (lat1, lon1, lat2, lon2))
+    a = math.sin((lat2 - lat1) / 2) ** 2 + math.cos(lat1) * math.cos(lat2) * math.sin((lon2 - lon1) / 2) ** 2
+    return 2 * EARTH_RADIUS_KM * math.asin(math.sqrt(a))
+
+
+def _cell(lat: float, lon: float) -> tuple:
+    return (math.floor(lat / CELL_DEGREES), math.floor(lon / CELL_DEGREES))
+
+
+@dataclass
+class Candidate:
+    freelancer_id: int
+    distance_km: Optional[float]
+    active_jobs: int
+    avg_rating: float
+    score: float
+
+
+class AllocationEngine:
+    """
+    In-process candidate index for home-service allocation.
+
+    Approved freelancers are bucketed per service module into a lat/lon grid, so
+    an allocation only looks at the cells around the booking instead of
+    aggregating the booking table. Open jobs and ratings for the candidates
+    in range come from freelancer_stats by primary key.
+
+    Every check_seconds the grid is rebuilt if the freelancer watermark
+    (count, max id, latest modified date) changed.
+    """
+
+    def __init__(self, check_seconds: int, max_radius_km: float):
+        self.check_seconds = check_seconds
+        self.max_radius_km = max_radius_km
+        self._lock = threading.RLock()
+        self._cells = {}        # module_id -> {cell: set(freelancer_id)}
+        self._unlocated = {}    # module_id -> set(freelancer_id) without coordinates
+        self._positions = {}    # freelancer_id -> (lat, lon)
+        self._watermark = None
+        self._checked_at = 0.0
+        self._stale = True
+
+    def _freelancer_filter(self):
+        return and_(
+            UserRegistration.role_id == FREELANCER_ROLE_ID,
+            UserRegistration.status_id == STATUS_APPROVED,
+            UserRegistration.is_active.is_(True)
+        )
+
+    def _get_watermark(self, db: Session):
+        users = db.execute(
+            select(func.count(), func.max(UserRegistration.id), func.max(UserRegistration.modified_date))
+            .where(self._freelancer_filter())
+        ).one()
+        services = db.execute(
+            select(func.count(), func.max(UserServices.id), func.max(UserServices.modified_date))
+        ).one()
+        return tuple(users) + tuple(services)
+
+    def _load(self, db: Session, watermark):
+        rows = db.execute(
+            select(UserRegistration.id, UserRegistration.latitude, UserRegistration.longitude, UserServices.module_id)
+            .join(UserServices, UserServices.user_id == UserRegistration.id)
+            .where(self._freelancer_filter(), UserServices.is_active.isnot(False))
+        ).all()
+
+        cells, unlocated, positions = {}, {}, {}
+        for freelancer_id, lat, lon, module_id in rows:
+            if lat is None or lon is None:
+                unlocated.setdefault(module_id, set()).add(freelancer_id)
+                continue
+            position = (float(lat), float(lon))
+            positions[freelancer_id] = position
+            cells.setdefault(module_id, {}).setdefault(_cell(*position), set()).add(freelancer_id)
+
+        self._cells, self._unlocated, self._positions = cells, unlocated, positions
+        self._watermark = watermark
+        self._stale = False
+
+    def _ensure_loaded(self, db: Session):
+        with self._lock:
+            now = time.monotonic()
+            if not self._stale and now - self._checked_at < self.check_seconds:
+                return
+            watermark = self._get_watermark(db)
+            if self._stale or watermark != self._watermark:
+                self._load(db, watermark)
+            self._checked_at = now
+
+    def _nearby(self, module_id: int, lat: float, lon: float) -> list:
+        """Freelancer ids in the grid cells covering max_radius_km around the point."""
+        grid = self._cells.get(module_id, {})
+        if not grid:
+            return []
+        center_row, center_col = _cell(lat, lon)
+        # a degree of longitude shrinks with latitude, so widen the column span accordingly
+        max_rows = math.ceil(self.max_radius_km / 111.0 / CELL_DEGREES)
+        lon_scale = max(math.cos(math.radians(lat)), 0.01)
+        max_cols = math.ceil(self.max_radius_km / (111.0 * lon_scale) / CELL_DEGREES)
+
+        found = []
+        for row in range(center_row - max_rows, center_row + max_rows + 1):
+            for col in range(center_col - max_cols, center_col + max_cols + 1):
+                found.extend(grid.get((row, col), ()))
+        return found
+
+    def _score(self, freelancer_id: int, distance_km: Optional[float], stats: dict) -> Candidate:
+        active_jobs, avg_rating = stats.get(freelancer_id, (0, 0.0))
+        travel_km = distance_km if distance_km is not None else self.max_radius_km
+        score = travel_km + active_jobs * WORKLOAD_KM - avg_rating * RATING_KM
+        return Candidate(freelancer_id, distance_km, active_jobs, avg_rating, score)
+
+    def _in_range(self, module_id: int, latitude, longitude) -> dict:
+        """freelancer_id -> distance_km (None when either side has no coordinates)."""
+        distances = {}
+        if latitude is not None and longitude is not None:
+            lat, lon = float(latitude), float(longitude)
+            for freelancer_id in self._nearby(module_id, lat, lon):
+                distance = haversine_km(lat, lon, *self._positions[freelancer_id])
+                if distance <= self.max_radius_km:
+                    distances[freelancer_id] = distance
+
+        if not distances:
+            for freelancer_id in self._unlocated.get(module_id, ()):
+                distances[freelancer_id] = None
+            for members in self._cells.get(module_id, {}).values():
+                for freelancer_id in members:
+                    distances[freelancer_id] = None
+        return distances
+
+    def rank(self, db: Session, module_id: int, latitude=None, longitude=None, limit: int = 10) -> list:
+        """
+        Best candidates for a booking in `module_id`, lowest score first.
+
+        With booking coordinates, only freelancers inside max_radius_km are
+        considered (falling back to everyone in the module when nobody is in
+        range); without them, workload and rating decide.
+        """
+        self._ensure_loaded(db)
+        with self._lock:
+            distances = self._in_range(module_id, latitude, longitude)
+        stats = get_stats(db, distances.keys())
+        candidates = [self._score(fid, distance, stats) for fid, distance in distances.items()]
+        candidates.sort(key=lambda c: (c.score, c.freelancer_id))
+        return candidates[:limit]
+
+    def invalidate(self):
+        with self._lock:
+            self._stale = True
+
+
+allocation_engine = AllocationEngine(settings.ALLOCATION_INDEX_CHECK_SECONDS, settings.ALLOCATION_MAX_RADIUS_KM)
@@ -1,14 +1,19 @@
 from sqlalchemy.orm import Session
-from sqlalchemy import func, desc, asc, and_
+from sqlalchemy import desc
 from fastapi import HTTPException, status
 
 from models.generated_models import (
          HomeServiceBooking,
     HomeServiceBooking,
     UserRegistration,
-    UserServices
+    FreelancerStats
 )
 
+from services.allocation_engine import allocation_engine
+from services.freelancer_stats_service import reserve_assignment
+from services.batch_allocation_service import run_allocation_round
+from app.config.settings import settings
+
 from core.constants import (
     CUSTOMER_ROLE_ID,
     FREELANCER_ROLE_ID,
@@ -45,28 +50,23 @@ def get_allocation_options(
         )
     
     # ✅ SHOW ALL APPROVED FREELANCERS
+    # freelancer_stats keeps avg_rating per freelancer; a freelancer approved
+    # before their stats row exists is still listed, unrated
     freelancers = (
         db.query(
             UserRegistration.id,
             UserRegistration.first_name,
             UserRegistration.last_name,
             UserRegistration.address,
-            func.coalesce(func.avg(HomeServiceBooking.rating), 0).label("avg_rating")
-        )
-        .outerjoin(
-            HomeServiceBooking,
-            and_(
-                HomeServiceBooking.assigned_to == UserRegistration.id,
-                HomeServiceBooking.is_active.is_(True)
-            )
+            FreelancerStats.avg_rating
         )
+        .outerjoin(FreelancerStats, FreelancerStats.freelancer_id == UserRegistration.id)
         .filter(
             UserRegistration.role_id == FREELANCER_ROLE_ID,
             UserRegistration.status_id == STATUS_APPROVED,
             UserRegistration.is_active.is_(True)
         )
-        .group_by(UserRegistration.id)
-        .order_by(desc("avg_rating"))
+        .order_by(desc(FreelancerStats.avg_rating).nulls_last(), UserRegistration.id)
         .all()
     )
 
@@ -75,34 +75,41 @@ def get_allocation_options(
             "employee_id": emp.id,
             "name": f"{emp.first_name} {emp.last_name}",
             "address": emp.address,
-            "rating": round(emp.avg_rating, 1)
+            "rating": round(float(emp.avg_rating or 0), 1)
         }
         for emp in freelancers
     ]
 
 # ---------------------------------------------------------
-# AUTO ALLOCATION (ROUND-ROBIN + RATING)
+# BOOKING CLAIMS
 # ---------------------------------------------------------
-def auto_allocate_employee(
-    db: Session,
-    booking_id: int,
-    system_user_id: int
-):
-    """
-    Auto allocation strategy:
-    1. Fewest active assignments
-    2. Highest rating
+def _claim_booking(db: Session, booking_id: int, user_id: int) -> HomeServiceBooking:
     """
+    Lock the booking row for this transaction.
 
-
-    booking = db.query(HomeServiceBooking).filter(
+    SKIP LOCKED makes a second, concurrent allocation of the same booking fail
+    fast with 409 instead of waiting and then assigning it a second time.
+    """
+    ownership = (
         HomeServiceBooking.id == booking_id,
-        HomeServiceBooking.created_by == system_user_id,
+        HomeServiceBooking.created_by == user_id,
         HomeServiceBooking.is_active.is_(True)
-    ).first()
+    )
+
+    booking = (
+        db.query(HomeServiceBooking)
+        .filter(*ownership)
+        .with_for_update(skip_locked=True)
+        .first()
+    )
 
 
     if not booking:
+        if db.query(HomeServiceBooking.id).filter(*ownership).first():
+            raise HTTPException(
+                status_code=status.HTTP_409_CONFLICT,
+                detail="Booking is being allocated, please retry"
+            )
         raise HTTPException(
             status_code=status.HTTP_404_NOT_FOUND,
             detail="Booking not found"
@@ -115,49 +122,64 @@ def auto_allocate_employee(
             detail="Booking already allocated"
         )
 
+    return booking
 
-    freelancer = (
-        db.query(UserRegistration)
-        .join(
-            UserServices,
-            and_(
-                UserServices.user_id == UserRegistration.id,
-                UserServices.module_id == booking.module_id
-            )
-        )
-        .outerjoin(
-            HomeServiceBooking,
-            and_(
-                HomeServiceBooking.assigned_to == UserRegistration.id,
-                HomeServiceBooking.is_active.is_(True)
-            )
-        )
-        .filter(
-            UserRegistration.role_id == FREELANCER_ROLE_ID,
-            UserRegistration.status_id == STATUS_APPROVED,
-            UserRegistration.is_active.is_(True)
-        )
-        .group_by(UserRegistration.id)
-        .order_by(
-            asc(func.count(HomeServiceBooking.id)),   # workload
-            desc(func.coalesce(func.avg(HomeServiceBooking.rating), 0))  # rating
-        )
-        .first()
+
+def _assign(booking: HomeServiceBooking, freelancer_id: int, user_id: int = None):
+    booking.assigned_to = freelancer_id
+    booking.status_id = BOOKING_STATUS_ASSIGNED
+    booking.work_status_id = WORK_STATUS_ON_THE_WAY
+    if user_id:
+        booking.modified_by = user_id
+
+
+def _allocate_best(db: Session, booking: HomeServiceBooking):
+    """Reserve the best-ranked candidate that still has capacity; None if nobody does."""
+    candidates = allocation_engine.rank(
+        db,
+        booking.module_id,
+        booking.latitude,
+        booking.longitude,
+        limit=settings.ALLOCATION_CANDIDATES
     )
+    for candidate in candidates:
+        if reserve_assignment(db, candidate.freelancer_id, settings.FREELANCER_MAX_ACTIVE_JOBS):
+            _assign(booking, candidate.freelancer_id)
+            return candidate
+    return None
+
+
+# ---------------------------------------------------------
+# AUTO ALLOCATION (DISTANCE + WORKLOAD + RATING)
+# ---------------------------------------------------------
+def auto_allocate_employee(
+    db: Session,
+    booking_id: int,
+    system_user_id: int
+):
+    """
+    Auto allocation strategy (see services.allocation_engine):
+    1. Freelancers offering the booking's module, nearest first
+    2. Penalised by open assignments
+    3. Boosted by rating
+    The first ranked freelancer with a free slot gets the booking.
+    """
+
+
+    booking = _claim_booking(db, booking_id, system_user_id)
+
+
+    freelancer = _allocate_best(db, booking)
 
 
     if not freelancer:
+        db.rollback()
         raise HTTPException(
             status_code=status.HTTP_404_NOT_FOUND,
             detail="No freelancers available for this service"
         )
 
 
-    booking.assigned_to = freelancer.id
-    booking.status_id = BOOKING_STATUS_ASSIGNED
-    booking.work_status_id = WORK_STATUS_ON_THE_WAY
-
-
     db.commit()
     db.refresh(booking)
 
@@ -165,8 +187,30 @@ def auto_allocate_employee(
     return {
         "message": "Employee auto-allocated successfully",
         "booking_id": booking.id,
-        "assigned_to": freelancer.id,
-        "strategy": "Round-robin with rating priority"
+        "assigned_to": freelancer.freelancer_id,
+        "distance_km": round(freelancer.distance_km, 2) if freelancer.distance_km is not None else None,
+        "strategy": "Nearest freelancer weighted by workload and rating"
+    }
+
+
+# ---------------------------------------------------------
+# BATCH AUTO ALLOCATION (ADMIN)
+# ---------------------------------------------------------
+def auto_allocate_pending_batch(db: Session, limit: int, admin_id: int):
+    """
+    Allocate up to `limit` pending bookings, oldest preferred date first, as one
+    batch in one transaction (see services.batch_allocation_service). Bookings
+    locked by another allocation are skipped, so batches can run side by side.
+    """
+    result = run_allocation_round(db, limit, modified_by=admin_id)
+
+    return {
+        "message": f"Allocated {len(result['allocated'])} of {result['claimed']} pending bookings",
+        "allocated": [
+            {"booking_id": booking_id, "assigned_to": freelancer_id}
+            for booking_id, freelancer_id in result["allocated"].items()
+        ],
+        "unallocated": result["unallocated"]
     }
 
 
@@ -180,25 +224,7 @@ def manual_allocate_employee(
     employee_id: int,
     current_user_id: int
 ):
-    booking = db.query(HomeServiceBooking).filter(
-        HomeServiceBooking.id == booking_id,
-        HomeServiceBooking.created_by == current_user_id,
-        HomeServiceBooking.is_active.is_(True)
-    ).first()
-
-
-    if not booking:
-        raise HTTPException(
-            status_code=status.HTTP_404_NOT_FOUND,
-            detail="Booking not found"
-        )
-
-
-    if booking.assigned_to:
-        raise HTTPException(
-            status_code=status.HTTP_400_BAD_REQUEST,
-            detail="Booking already allocated"
-        )
+    booking = _claim_booking(db, booking_id, current_user_id)
 
 
     freelancer = db.query(UserRegistration).filter(
@@ -210,16 +236,23 @@ def manual_allocate_employee(
 
 
     if not freelancer:
+        db.rollback()
         raise HTTPException(
             status_code=status.HTTP_404_NOT_FOUND,
             detail="Freelancer not found or not approved"
         )
 
 
-    booking.assigned_to = freelancer.id
-    booking.status_id = BOOKING_STATUS_ASSIGNED   # ✅ FIXED (NO TUPLE)
-    booking.work_status_id = WORK_STATUS_ON_THE_WAY
-    booking.modified_by = current_user_id
+    # the caller chose this freelancer, so wait for their stats row rather than skipping it
+    if not reserve_assignment(db, freelancer.id, settings.FREELANCER_MAX_ACTIVE_JOBS, wait=True):
+        db.rollback()
+        raise HTTPException(
+            status_code=status.HTTP_409_CONFLICT,
+            detail="Freelancer has no free capacity"
+        )
+
+
+    _assign(booking, freelancer.id, current_user_id)
 
 
     db.commit()
@@ -231,4 +264,3 @@ def manual_allocate_employee(
         "booking_id": booking.id,
         "assigned_to": freelancer.id
     }
-
@@ -1,5 +1,6 @@
 from sqlalchemy.orm import Session
-from sqlalchemy import func,  text, cast, Float, desc
+import decimal
+from sqlalchemy import text, desc, tuple_
 from core.database import SessionLocal
 from models.generated_models import UserRegistration
 from models.generated_models import StudentQualification
@@ -11,6 +12,8 @@ from fastapi import HTTPException, status
 
 from models.generated_models import JobOpenings
 from models.generated_models import MasterJob
+from services.company_summary_service import refresh_company
+from core.pagination import Page, PageParams, decode_cursor, encode_cursor
 
 
 #### ADDED
@@ -49,6 +52,7 @@ def create_job_opening(db: Session, payload):
     )
 
     db.add(job)
+    refresh_company(db, job.company_name, job.company_address)
     db.commit()
     db.refresh(job)
     return job
@@ -215,34 +219,52 @@ def update_application(user_id: int, data):
 
  
 
-def get_trending_students(db: Session):
-
-    percentage_clean = cast(
-        func.replace(StudentQualification.percentage, '%', ''),
-        Float
-    )
-
-    students = (
+def get_trending_students(db: Session, page: PageParams, min_percentage: float = 80) -> Page:
+    """
+    Highest percentages first, keyset-paginated on (percentage_value, id) so
+    each page is a range read of idx_student_qualification_percentage_value.
+    """
+    query = (
         db.query(
+            StudentQualification.id,
             UserRegistration.first_name,
             UserRegistration.last_name,
             UserRegistration.is_active,
             StudentQualification.institute,
             StudentQualification.degree,
-            percentage_clean.label("percentage")
+            StudentQualification.percentage_value.label("percentage")
         )
-        .join(StudentQualification, StudentQualification.user_id == UserRegistration.id)
+        .join(UserRegistration, StudentQualification.user_id == UserRegistration.id)
         .filter(
-            percentage_clean.isnot(None),
-            percentage_clean >= 80,
+            StudentQualification.percentage_value.isnot(None),
+            StudentQualification.percentage_value >= min_percentage,
             UserRegistration.is_active.is_(True),
             StudentQualification.is_active.is_(True)
         )
-        .order_by(desc(percentage_clean))
+    )
+
+    if page.cursor:
+        values = decode_cursor(page.cursor)
+        try:
+            last_percentage, last_id = decimal.Decimal(values[0]), int(values[1])
+        except (decimal.InvalidOperation, ValueError, TypeError, IndexError, KeyError):
+            raise HTTPException(status_code=400, detail="Invalid cursor")
+        query = query.filter(
+            tuple_(StudentQualification.percentage_value, StudentQualification.id) < (last_percentage, last_id)
+        )
+
+    students = (
+        query.order_by(desc(StudentQualification.percentage_value), desc(StudentQualification.id))
+        .limit(page.limit + 1)
         .all()
     )
 
-    return [
+    next_cursor = None
+    if len(students) > page.limit:
+        students = students[:page.limit]
+        next_cursor = encode_cursor(str(students[-1].percentage), students[-1].id)
+
+    return Page([
         {
             "full_name": f"{s.first_name} {s.last_name}",
             "institute": s.institute,
@@ -251,7 +273,7 @@ def get_trending_students(db: Session):
             "active": bool(s.is_active)
         }
         for s in students
-    ]
+    ], next_cursor, None)
 
 
 
@@ -324,4 +346,5 @@ def delete_by_id(db: Session, id: int):
 
     # ✅ Soft delete
     record.is_active = False
+    refresh_company(db, record.company_name, record.company_address)
     db.commit()
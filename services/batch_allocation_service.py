@@ -0,0 +1,145 @@
+import heapq
+from datetime import datetime
+from sqlalchemy import func, select, update
+from sqlalchemy.orm import Session
+
+from app.config.settings import settings
+from models.generated_models import FreelancerStats, HomeServiceBooking
+from services.allocation_engine import allocation_engine, WORKLOAD_KM
+from core.constants import BOOKING_STATUS_PENDING, BOOKING_STATUS_ASSIGNED, WORK_STATUS_ON_THE_WAY
+
+
+def _pending_filter():
+    return (
+        HomeServiceBooking.assigned_to.is_(None),
+        HomeServiceBooking.status_id == BOOKING_STATUS_PENDING,
+        HomeServiceBooking.is_active.is_(True)
+    )
+
+
+def count_pending(db: Session) -> int:
+    return db.execute(select(func.count()).select_from(HomeServiceBooking).where(*_pending_filter())).scalar()
+
+
+def match_bookings(candidates_by_booking: dict, free_slots: dict) -> dict:
+    """
+    Greedy batch matching of bookings to freelancers.
+
+    `candidates_by_booking` maps booking_id -> ranked Candidates, `free_slots`
+    maps freelancer_id -> open-job slots left. The globally cheapest
+    (booking, freelancer) pair is taken first; every booking a freelancer wins
+    makes their remaining pairs WORKLOAD_KM more expensive, so work spreads
+    out across the batch instead of piling onto the best-rated freelancer.
+    Returns booking_id -> freelancer_id.
+    """
+    taken = {}          # freelancer_id -> bookings won in this batch
+    assignments = {}
+    heap = []
+    for booking_id, candidates in candidates_by_booking.items():
+        if candidates:
+            heapq.heappush(heap, (candidates[0].score, booking_id, 0, 0))
+
+    while heap:
+        score, booking_id, index, seen_taken = heapq.heappop(heap)
+        candidate = candidates_by_booking[booking_id][index]
+        freelancer_id = candidate.freelancer_id
+        won = taken.get(freelancer_id, 0)
+
+        if won != seen_taken:
+            # the freelancer picked up work since this pair was scored; re-queue at its new cost
+            heapq.heappush(heap, (candidate.score + won * WORKLOAD_KM, booking_id, index, won))
+            continue
+
+        if free_slots.get(freelancer_id, 0) - won > 0:
+            assignments[booking_id] = freelancer_id
+            taken[freelancer_id] = won + 1
+            continue
+
+        next_index = index + 1
+        if next_index < len(candidates_by_booking[booking_id]):
+            nxt = candidates_by_booking[booking_id][next_index]
+            nxt_won = taken.get(nxt.freelancer_id, 0)
+            heapq.heappush(heap, (nxt.score + nxt_won * WORKLOAD_KM, booking_id, next_index, nxt_won))
+
+    return assignments
+
+
+def run_allocation_round(db: Session, batch_size: int, modified_by: int = None) -> dict:
+    """
+    Claim up to `batch_size` pending bookings (SKIP LOCKED), match them as one
+    batch and write all assignments in a single transaction.
+    """
+    now = datetime.utcnow()
+    bookings = db.execute(
+        select(
+            HomeServiceBooking.id,
+            HomeServiceBooking.module_id,
+            HomeServiceBooking.latitude,
+            HomeServiceBooking.longitude,
+            HomeServiceBooking.created_date
+        )
+        .where(*_pending_filter())
+        .order_by(HomeServiceBooking.preferred_date, HomeServiceBooking.time_slot_id, HomeServiceBooking.id)
+        .limit(batch_size)
+        .with_for_update(skip_locked=True)
+    ).all()
+
+    if not bookings:
+        db.commit()
+        return {"claimed": 0, "allocated": {}, "unallocated": [], "wait_seconds": []}
+
+    candidates_by_booking = {
+        b.id: allocation_engine.rank(db, b.module_id, b.latitude, b.longitude, limit=settings.ALLOCATION_CANDIDATES)
+        for b in bookings
+    }
+
+    # lock every candidate's stats row up front, in id order; rows held by another
+    # allocation are skipped, which just removes that freelancer from this batch
+    freelancer_ids = sorted({c.freelancer_id for cs in candidates_by_booking.values() for c in cs})
+    stats = {
+        row.freelancer_id: row
+        for row in db.query(FreelancerStats)
+        .filter(FreelancerStats.freelancer_id.in_(freelancer_ids))
+        .order_by(FreelancerStats.freelancer_id)
+        .with_for_update(skip_locked=True)
+        .all()
+    } if freelancer_ids else {}
+    free_slots = {
+        freelancer_id: settings.FREELANCER_MAX_ACTIVE_JOBS - row.active_jobs
+        for freelancer_id, row in stats.items()
+    }
+
+    assignments = match_bookings(candidates_by_booking, free_slots)
+
+    if assignments:
+        values = {
+            "status_id": BOOKING_STATUS_ASSIGNED,
+            "work_status_id": WORK_STATUS_ON_THE_WAY,
+            "modified_date": now,
+        }
+        if modified_by:
+            values["modified_by"] = modified_by
+        db.execute(
+            update(HomeServiceBooking),
+            [{"id": booking_id, "assigned_to": freelancer_id, **values} for booking_id, freelancer_id in assignments.items()]
+        )
+        for freelancer_id in set(assignments.values()):
+            won = sum(1 for f in assignments.values() if f == freelancer_id)
+            row = stats[freelancer_id]
+            row.total_jobs += won
+            row.active_jobs += won
+            row.last_job_at = now
+            row.modified_date = now
+
+    db.commit()
+
+    created = {b.id: b.created_date for b in bookings}
+    return {
+        "claimed": len(bookings),
+        "allocated": assignments,
+        "unallocated": [b.id for b in bookings if b.id not in assignments],
+        "wait_seconds": [
+            (now - created[booking_id]).total_seconds()
+            for booking_id in assignments if created[booking_id]
+        ],
+    }
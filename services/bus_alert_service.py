@@ -0,0 +1,176 @@
+import asyncio
+import threading
+from datetime import datetime, timedelta
+from typing import Optional
+from fastapi import HTTPException
+from sqlalchemy import func, select, text
+from sqlalchemy.orm import Session
+
+from app.config.settings import settings
+from models.generated_models import BusAlertLog
+from services.bus_tracking_service import EventSubscriber, bus_tracker
+
+
+class BusAlertPipeline:
+    """
+    Deduplicates and fans out bus alerts.
+
+    An alert with the same (bus_id, alert_type) as an open alert seen within
+    the dedup window is folded into it (occurrence_count / last_seen) instead of
+    becoming a new row. Deduplication runs against bus_alert_log itself under a
+    transaction-level advisory lock per (bus_id, alert_type), so every worker
+    sees the same open alerts and a resolved alert is never reused. Each alert
+    is committed before the request returns and before it is pushed; only the
+    subscriber lists are per process.
+    """
+
+    def __init__(self, dedup_seconds: float, subscriber_queue: int):
+        self.dedup_window = timedelta(seconds=dedup_seconds)
+        self.subscriber_queue = subscriber_queue
+        self._lock = threading.Lock()
+        self._firehose: set = set()
+        self._watchers: dict = {}
+        self.metrics = {"submitted": 0, "deduplicated": 0, "inserted": 0}
+
+    # ---------- submit ----------
+
+    def _open_alert(self, db: Session, bus_id: str, alert_type: Optional[str], since: datetime):
+        # walks idx_bus_alert_log_open_bus_type
+        return db.execute(
+            select(BusAlertLog)
+            .where(
+                BusAlertLog.bus_id == bus_id,
+                BusAlertLog.alert_type.is_(None) if alert_type is None else BusAlertLog.alert_type == alert_type,
+                BusAlertLog.resolved == False,
+                BusAlertLog.is_active == True,
+                func.coalesce(BusAlertLog.last_seen, BusAlertLog.alert_time) >= since
+            )
+            .order_by(BusAlertLog.id.desc())
+            .limit(1)
+        ).scalars().first()
+
+    def submit(
+        self,
+        db: Session,
+        bus_id: str,
+        alert_type: Optional[str],
+        alert_message: Optional[str],
+        created_by: Optional[int] = None,
+        is_active: bool = True
+    ) -> dict:
+        """
+        An inactive alert (is_active=False) is only recorded: it is not folded
+        into an open alert and is not pushed to subscribers.
+        """
+        if not bus_tracker.is_known_bus(bus_id):
+            raise HTTPException(status_code=404, detail="Bus not found")
+
+        now = datetime.utcnow()
+        alert = None
+        if is_active:
+            # serialises submits for this (bus_id, alert_type) across workers until commit
+            db.execute(
+                text("SELECT pg_advisory_xact_lock(hashtextextended(:key, 0))"),
+                {"key": f"bus_alert:{bus_id}:{alert_type or ''}"}
+            )
+            alert = self._open_alert(db, bus_id, alert_type, now - self.dedup_window)
+
+        if alert is not None:
+            alert.occurrence_count += 1
+            alert.last_seen = now
+            alert.alert_message = alert_message or alert.alert_message
+            db.commit()
+            with self._lock:
+                self.metrics["submitted"] += 1
+                self.metrics["deduplicated"] += 1
+            return _as_dict(alert)
+
+        alert = BusAlertLog(
+            bus_id=bus_id,
+            alert_type=alert_type,
+            alert_message=alert_message,
+            alert_time=now,
+            last_seen=now,
+            occurrence_count=1,
+            resolved=False,
+            is_active=is_active,
+            created_by=created_by,
+            created_date=now
+        )
+        db.add(alert)
+        db.commit()
+        db.refresh(alert)
+        alert = _as_dict(alert)
+        with self._lock:
+            self.metrics["submitted"] += 1
+            self.metrics["inserted"] += 1
+            targets = (self._watchers.get(bus_id, set()) | self._firehose) if is_active else set()
+        self._publish(targets, {"event": "alert", **_event(alert)})
+        return alert
+
+    def resolved(self, alert: BusAlertLog):
+        """Call after an alert is resolved or deactivated to push the change to subscribers."""
+        with self._lock:
+            targets = self._watchers.get(alert.bus_id, set()) | self._firehose
+        self._publish(targets, {"event": "resolved", **_event(_as_dict(alert))})
+
+    # ---------- subscribers ----------
+
+    def subscribe(self, bus_ids: Optional[set] = None) -> EventSubscriber:
+        subscriber = EventSubscriber(asyncio.get_running_loop(), bus_ids, self.subscriber_queue)
+        with self._lock:
+            if bus_ids is None:
+                self._firehose.add(subscriber)
+            else:
+                for bus_id in bus_ids:
+                    self._watchers.setdefault(bus_id, set()).add(subscriber)
+        return subscriber
+
+    def unsubscribe(self, subscriber: EventSubscriber):
+        with self._lock:
+            self._firehose.discard(subscriber)
+            for bus_id in subscriber.bus_ids or ():
+                watchers = self._watchers.get(bus_id)
+                if watchers:
+                    watchers.discard(subscriber)
+                    if not watchers:
+                        del self._watchers[bus_id]
+
+    def _publish(self, targets: set, event: dict):
+        for subscriber in targets:
+            if not subscriber.offer(event):
+                self.unsubscribe(subscriber)
+
+
+def _as_dict(row: BusAlertLog) -> dict:
+    return {
+        "id": row.id,
+        "bus_id": row.bus_id,
+        "alert_type": row.alert_type,
+        "alert_message": row.alert_message,
+        "alert_time": row.alert_time,
+        "last_seen": row.last_seen or row.alert_time,
+        "occurrence_count": row.occurrence_count or 1,
+        "resolved": bool(row.resolved),
+        "is_active": row.is_active is not False,
+        "created_by": row.created_by,
+        "created_date": row.created_date,
+    }
+
+
+def _event(alert: dict) -> dict:
+    return {
+        "id": alert["id"],
+        "bus_id": alert["bus_id"],
+        "alert_type": alert["alert_type"],
+        "alert_message": alert["alert_message"],
+        "alert_time": alert["alert_time"].isoformat() if alert["alert_time"] else None,
+        "occurrence_count": alert["occurrence_count"],
+        "resolved": alert["resolved"],
+    }
+
+
+bus_alert_pipeline = BusAlertPipeline(
+    dedup_seconds=settings.BUS_ALERT_DEDUP_SECONDS,
+    subscriber_queue=settings.BUS_SUBSCRIBER_QUEUE
+)
@@ -0,0 +1,356 @@
+import asyncio
+import threading
+import time
+from dataclasses import asdict, dataclass
+from datetime import datetime, timezone
+from typing import Iterable, Optional
+from sqlalchemy import insert, select, text
+
+from app.config.settings import settings
+from core.database import SessionLocal
+from models.generated_models import BusFleet, BusTrackingStatus
+
+# fields whose change is pushed to subscribers; a ping that only refreshes the
+# timestamp updates the state but is not broadcast
+_NUMERIC_FIELDS = ("latitude", "longitude", "current_speed")
+_BROADCAST_FIELDS = ("status", "latitude", "longitude", "current_speed", "next_stop", "eta_minutes", "location_description")
+
+
+@dataclass
+class BusState:
+    bus_id: str
+    status: Optional[str] = None
+    latitude: Optional[float] = None
+    longitude: Optional[float] = None
+    current_speed: Optional[float] = None
+    next_stop: Optional[str] = None
+    eta_minutes: Optional[int] = None
+    location_description: Optional[str] = None
+    last_updated: Optional[datetime] = None
+
+    def as_dict(self) -> dict:
+        # hot path (every broadcast and overview); dataclasses.asdict deep-copies and is ~10x slower
+        return {
+            "bus_id": self.bus_id,
+            "status": self.status,
+            "latitude": self.latitude,
+            "longitude": self.longitude,
+            "current_speed": self.current_speed,
+            "next_stop": self.next_stop,
+            "eta_minutes": self.eta_minutes,
+            "location_description": self.location_description,
+            "last_updated": self.last_updated.isoformat() if self.last_updated else None,
+        }
+
+
+def _utc_naive(value: Optional[datetime], now: datetime) -> datetime:
+    """Device timestamps as naive UTC (like the rest of the schema), never in the future."""
+    if value is None:
+        return now
+    if value.tzinfo is not None:
+        value = value.astimezone(timezone.utc).replace(tzinfo=None)
+    return min(value, now)
+
+
+class EventSubscriber:
+    """One SSE/WebSocket client. Events are handed to its event loop thread-safely."""
+
+    def __init__(self, loop: asyncio.AbstractEventLoop, bus_ids: Optional[set], maxsize: int):
+        self.loop = loop
+        self.bus_ids = bus_ids
+        self.queue: asyncio.Queue = asyncio.Queue(maxsize=maxsize)
+
+    def offer(self, event: dict) -> bool:
+        try:
+            self.loop.call_soon_threadsafe(self._put, event)
+        except RuntimeError:
+            # the client's event loop has shut down
+            return False
+        return True
+
+    def _put(self, event: dict):
+        # a slow client drops its oldest update rather than stalling ingestion;
+        # positions are latest-wins, so the next event supersedes it anyway
+        if self.queue.full():
+            self.queue.get_nowait()
+        self.queue.put_nowait(event)
+
+
+class BusTracker:
+    """
+    Latest position per bus, held in process memory.
+
+    Pings update the in-memory state and are pushed to subscribers straight
+    away; a background thread appends the changed buses to bus_tracking_status
+    every flush interval, one bulk INSERT per flush. Reads never query Postgres.
+
+    State is per process: run the API with a single worker for the tracking
+    routes (or pin telemetry and subscribers to one process), otherwise each
+    worker only sees the pings it received.
+    """
+
+    def __init__(self, flush_seconds: float, fleet_refresh_seconds: float, stale_seconds: float, subscriber_queue: int):
+        self.flush_seconds = flush_seconds
+        self.fleet_refresh_seconds = fleet_refresh_seconds
+        self.stale_seconds = stale_seconds
+        self.subscriber_queue = subscriber_queue
+        self._lock = threading.Lock()
+        self._states: dict = {}
+        self._dirty: dict = {}
+        self._fleet: Optional[frozenset] = None
+        self._fleet_loaded_at = 0.0
+        # subscribers to every bus, and per-bus subscribers, so a ping only
+        # touches the clients that follow that bus
+        self._firehose: set = set()
+        self._watchers: dict = {}
+        self._version = 0
+        self._overview_cache = (-1, [])
+        self._stop = threading.Event()
+        self._thread: Optional[threading.Thread] = None
+        self.metrics = {"pings": 0, "accepted": 0, "rejected": 0, "broadcasts": 0, "flushed_rows": 0, "flush_errors": 0, "dropped": 0}
+
+    # ---------- fleet / warm-up ----------
+
+    def _refresh_fleet(self, db):
+        ids = db.execute(select(BusFleet.bus_id).where(BusFleet.is_active.isnot(False))).scalars().all()
+        self.set_fleet(ids)
+
+    def load(self, db):
+        """Fleet ids plus the last stored state of every bus, so reads are warm after a restart."""
+        self._refresh_fleet(db)
+        rows = db.execute(text("""
+            SELECT DISTINCT ON (bus_id)
+                bus_id, status, latitude, longitude, current_speed, next_stop,
+                eta_minutes, location_description, last_updated
+            FROM bus_tracking_status
+            WHERE is_active IS NOT FALSE
+            ORDER BY bus_id, last_updated DESC NULLS LAST, id DESC
+        """)).mappings().all()
+        with self._lock:
+            for row in rows:
+                state = BusState(**{
+                    key: float(value) if key in _NUMERIC_FIELDS and value is not None else value
+                    for key, value in row.items()
+                })
+                self._states.setdefault(state.bus_id, state)
+
+    def is_known_bus(self, bus_id: str) -> bool:
+        """True if bus_id is in the cached fleet (or the fleet has not been loaded yet)."""
+        fleet = self._fleet
+        return fleet is None or bus_id in fleet
+
+    def set_fleet(self, bus_ids: Iterable[str]):
+        with self._lock:
+            self._fleet = frozenset(bus_ids)
+            self._fleet_loaded_at = time.monotonic()
+            # forget buses accepted before the fleet was known (or since removed from it)
+            for bus_id in [b for b in self._states if b not in self._fleet]:
+                del self._states[bus_id]
+                self._dirty.pop(bus_id, None)
+                self._version += 1
+
+    # ---------- ingestion ----------
+
+    def ingest(self, pings: list) -> dict:
+        """
+        Apply a batch of pings (dicts with bus_id, recorded_at and state fields).
+        Pings for unknown buses and pings older than the current state are skipped.
+        """
+        accepted, rejected, stale = 0, [], 0
+        changed = []
+        now = datetime.utcnow()
+        with self._lock:
+            fleet = self._fleet
+            for ping in pings:
+                bus_id = ping["bus_id"]
+                if fleet is not None and bus_id not in fleet:
+                    rejected.append(bus_id)
+                    continue
+                recorded_at = _utc_naive(ping.get("recorded_at"), now)
+                state = self._states.get(bus_id)
+                if state is None:
+                    state = self._states[bus_id] = BusState(bus_id=bus_id)
+                elif state.last_updated and recorded_at < state.last_updated:
+                    stale += 1
+                    continue
+
+                moved = False
+                for field in _BROADCAST_FIELDS:
+                    value = ping.get(field)
+                    if value is not None and getattr(state, field) != value:
+                        setattr(state, field, value)
+                        moved = True
+                state.last_updated = recorded_at
+                self._dirty[bus_id] = state
+                accepted += 1
+                if moved:
+                    targets = self._watchers.get(bus_id)
+                    if targets or self._firehose:
+                        changed.append((state.as_dict(), (targets or set()) | self._firehose))
+
+            if accepted:
+                self._version += 1
+            self.metrics["pings"] += len(pings)
+            self.metrics["accepted"] += accepted
+            self.metrics["rejected"] += len(rejected)
+
+        broadcasts, dead = 0, set()
+        for event, targets in changed:
+            for subscriber in targets:
+                if subscriber.offer(event):
+                    broadcasts += 1
+                else:
+                    dead.add(subscriber)
+        for subscriber in dead:
+            self.unsubscribe(subscriber)
+        with self._lock:
+            self.metrics["broadcasts"] += broadcasts
+        return {"accepted": accepted, "stale": stale, "rejected": sorted(set(rejected))}
+
+    # ---------- reads ----------
+
+    def get(self, bus_id: str) -> Optional[dict]:
+        with self._lock:
+            state = self._states.get(bus_id)
+            return state.as_dict() if state else None
+
+    def overview(self, bus_ids: Optional[set] = None) -> list:
+        with self._lock:
+            if bus_ids is not None:
+                return [self._states[b].as_dict() for b in sorted(bus_ids) if b in self._states]
+            # the full list is rebuilt at most once per ingested batch, however many readers ask
+            version, cached = self._overview_cache
+            if version != self._version:
+                cached = [self._states[b].as_dict() for b in sorted(self._states)]
+                self._overview_cache = (self._version, cached)
+            return cached
+
+    def summary(self) -> dict:
+        cutoff = datetime.utcnow().timestamp() - self.stale_seconds
+        by_status: dict = {}
+        moving = offline = 0
+        with self._lock:
+            total = len(self._states)
+            for state in self._states.values():
+                by_status[state.status or "unknown"] = by_status.get(state.status or "unknown", 0) + 1
+                if not state.last_updated or state.last_updated.timestamp() < cutoff:
+                    offline += 1
+                elif state.current_speed:
+                    moving += 1
+        return {"total_buses": total, "moving": moving, "offline": offline, "by_status": by_status}
+
+    # ---------- subscribers ----------
+
+    def subscribe(self, bus_ids: Optional[set] = None) -> EventSubscriber:
+        subscriber = EventSubscriber(asyncio.get_running_loop(), bus_ids, self.subscriber_queue)
+        with self._lock:
+            if bus_ids is None:
+                self._firehose.add(subscriber)
+            else:
+                for bus_id in bus_ids:
+                    self._watchers.setdefault(bus_id, set()).add(subscriber)
+        return subscriber
+
+    def unsubscribe(self, subscriber: EventSubscriber):
+        with self._lock:
+            self._firehose.discard(subscriber)
+            for bus_id in subscriber.bus_ids or ():
+                watchers = self._watchers.get(bus_id)
+                if watchers:
+                    watchers.discard(subscriber)
+                    if not watchers:
+                        del self._watchers[bus_id]
+
+    @property
+    def subscriber_count(self) -> int:
+        with self._lock:
+            return len(self._firehose) + len({s for group in self._watchers.values() for s in group})
+
+    # ---------- persistence ----------
+
+    def flush(self, db) -> int:
+        """Append one bus_tracking_status row per bus that changed since the last flush."""
+        with self._lock:
+            dirty, self._dirty = self._dirty, {}
+            rows = [
+                {**asdict(state), "created_date": datetime.utcnow()}
+                for state in dirty.values()
+            ]
+        if not rows:
+            return 0
+        try:
+            db.execute(insert(BusTrackingStatus), rows)
+            db.commit()
+        except Exception:
+            db.rollback()
+            with self._lock:
+                self.metrics["flush_errors"] += 1
+            flushed = self._flush_one_by_one(db, rows)
+        else:
+            flushed = len(rows)
+        with self._lock:
+            self.metrics["flushed_rows"] += flushed
+        return flushed
+
+    def _flush_one_by_one(self, db, rows: list) -> int:
+        # isolate the rows that broke the batch (e.g. a bus accepted before the
+        # fleet was loaded, or deleted since); those are dropped, not retried forever
+        flushed = 0
+        for row in rows:
+            try:
+                db.execute(insert(BusTrackingStatus), [row])
+                db.commit()
+                flushed += 1
+            except Exception as e:
+                db.rollback()
+                with self._lock:
+                    self.metrics["dropped"] += 1
+                print("BUS TRACKING ROW DROPPED:", row["bus_id"], repr(e))
+        return flushed
+
+    def _run(self):
+        while not self._stop.wait(self.flush_seconds):
+            db = SessionLocal()
+            try:
+                if time.monotonic() - self._fleet_loaded_at >= self.fleet_refresh_seconds:
+                    self._refresh_fleet(db)
+                self.flush(db)
+            except Exception as e:
+                print("BUS TRACKING FLUSH FAILED:", repr(e))
+            finally:
+                db.close()
+
+    def start(self):
+        if self._thread and self._thread.is_alive():
+            return
+        db = SessionLocal()
+        try:
+            self.load(db)
+        except Exception as e:
+            # tracking still works; unknown-bus filtering starts with the first fleet refresh
+            print("BUS TRACKING WARM-UP FAILED:", repr(e))
+        finally:
+            db.close()
+        self._stop.clear()
+        self._thread = threading.Thread(target=self._run, name="bus-tracking-flush", daemon=True)
+        self._thread.start()
+
+    def stop(self):
+        self._stop.set()
+        if self._thread:
+            self._thread.join(timeout=self.flush_seconds + 5)
+        db = SessionLocal()
+        try:
+            self.flush(db)
+        except Exception as e:
+            print("BUS TRACKING FINAL FLUSH FAILED:", repr(e))
+        finally:
+            db.close()
+
+
+bus_tracker = BusTracker(
+    flush_seconds=settings.BUS_TRACKING_FLUSH_SECONDS,
+    fleet_refresh_seconds=settings.BUS_FLEET_REFRESH_SECONDS,
+    stale_seconds=settings.BUS_TRACKING_STALE_SECONDS,
+    subscriber_queue=settings.BUS_SUBSCRIBER_QUEUE
+)
@@ -1,95 +1,109 @@
 # services/companies_service.py
 
-from sqlalchemy import text
+from datetime import datetime
+
+from fastapi import HTTPException
+from sqlalchemy import and_, func, literal, or_, select, tuple_
 from sqlalchemy.orm import Session
 
+from core.pagination import Page, PageParams, decode_cursor, encode_cursor
+from models.generated_models import CompanySummary, MasterCompanySize, MasterIndustry
+
+# sort_by -> summary column; each has a partial (column DESC, id DESC) index
+SORT_COLUMNS = {
+    "latest": CompanySummary.last_active_time,
+    "jobs": CompanySummary.jobs_count,
+    "internships": CompanySummary.internships_count,
+}
+
 
 def get_all_companies(
     db: Session,
+    page: PageParams,
     industry_id: int | None = None,
     company_size_id: int | None = None,
     location: str | None = None,
     sort_by: str | None = None,
-):
+) -> Page:
     """
-    Returns company list with job & internship counts.
-    Default: returns ALL companies (no filters).
-    """
-
-    query = """
-        SELECT
-            ROW_NUMBER() OVER (ORDER BY MAX(jo.created_date) DESC) AS company_id,
-            jo.company_name,
-            jo.company_address AS location,
-
-            jo.industry_id,
-            mi.industry_name,
-
-            jo.company_size_id,
-            mcs.size_range AS company_size,
-
-            COUNT(*) FILTER (
-                WHERE jo.is_active = TRUE
-                  AND jo.sub_module_id = 1
-            ) AS jobs_count,
-
-            COUNT(*) FILTER (
-                WHERE jo.is_active = TRUE
-                  AND jo.sub_module_id = 2
-            ) AS internships_count,
-
-            'Active' AS hiring_status,
-            MAX(jo.created_date) AS last_active_time
-
-        FROM job_openings jo
-        LEFT JOIN master_industry mi
-               ON mi.id = jo.industry_id
-        LEFT JOIN master_company_size mcs
-               ON mcs.id = jo.company_size_id
-        WHERE jo.is_active = TRUE
+    Returns companies with active openings and their job & internship counts,
+    read from company_summary (kept current by company_summary_service).
+    Default: all companies, most recently active first.
     """
-
-    params = {}
+    sort_column = SORT_COLUMNS.get(sort_by, SORT_COLUMNS["latest"])
+    nullable = sort_column is CompanySummary.last_active_time
+
+    query = (
+        select(
+            CompanySummary.id.label("company_id"),
+            CompanySummary.company_name,
+            CompanySummary.company_address.label("location"),
+            CompanySummary.industry_id,
+            MasterIndustry.industry_name,
+            CompanySummary.company_size_id,
+            MasterCompanySize.size_range.label("company_size"),
+            CompanySummary.jobs_count,
+            CompanySummary.internships_count,
+            literal("Active").label("hiring_status"),
+            CompanySummary.last_active_time,
+            sort_column.label("sort_value")
+        )
+        .outerjoin(MasterIndustry, MasterIndustry.id == CompanySummary.industry_id)
+        .outerjoin(MasterCompanySize, MasterCompanySize.id == CompanySummary.company_size_id)
+        .where(CompanySummary.active_openings > 0)
+    )
 
     # -------------------------
     # OPTIONAL FILTERS
     # -------------------------
     if industry_id:
-        query += " AND jo.industry_id = :industry_id"
-        params["industry_id"] = industry_id
+        query = query.where(CompanySummary.industry_id == industry_id)
 
     if company_size_id:
-        query += " AND jo.company_size_id = :company_size_id"
-        params["company_size_id"] = company_size_id
+        query = query.where(CompanySummary.company_size_id == company_size_id)
 
     if location:
-        query += " AND LOWER(jo.company_address) LIKE :location"
-        params["location"] = f"%{location.lower()}%"
+        query = query.where(CompanySummary.company_address.ilike(f"%{location}%"))
 
-    # -------------------------
-    # GROUP BY
-    # -------------------------
-    query += """
-        GROUP BY
-            jo.company_name,
-            jo.company_address,
-            jo.industry_id,
-            mi.industry_name,
-            jo.company_size_id,
-            mcs.size_range
-    """
+    total = None
+    if page.include_total:
+        total = db.execute(select(func.count()).select_from(query.subquery())).scalar()
 
     # -------------------------
-    # SORTING
+    # KEYSET (sort_value DESC, id DESC)
     # -------------------------
-    if sort_by == "latest":
-        query += " ORDER BY last_active_time DESC"
-    elif sort_by == "jobs":
-        query += " ORDER BY jobs_count DESC"
-    elif sort_by == "internships":
-        query += " ORDER BY internships_count DESC"
-    else:
-        # DEFAULT (important)
-        query += " ORDER BY last_active_time DESC"
-
-    return db.execute(text(query), params).mappings().all()
+    if page.cursor:
+        query = query.where(_after_cursor(sort_column, page.cursor, nullable))
+
+    order = sort_column.desc().nulls_last() if nullable else sort_column.desc()
+    rows = db.execute(
+        query.order_by(order, CompanySummary.id.desc()).limit(page.limit + 1)
+    ).mappings().all()
+
+    next_cursor = None
+    if len(rows) > page.limit:
+        rows = rows[:page.limit]
+        last = rows[-1]
+        next_cursor = encode_cursor(last["sort_value"], last["company_id"])
+    items = [{k: v for k, v in row.items() if k != "sort_value"} for row in rows]
+    return Page(items, next_cursor, total)
+
+
+def _after_cursor(sort_column, cursor: str, nullable: bool):
+    values = decode_cursor(cursor)
+    if not isinstance(values, list) or len(values) != 2:
+        raise HTTPException(status_code=400, detail="Invalid cursor")
+    last_value, last_id = values
+    try:
+        last_id = int(last_id)
+        if last_value is not None:
+            last_value = datetime.fromisoformat(last_value) if nullable else int(last_value)
+    except (ValueError, TypeError):
+        raise HTTPException(status_code=400, detail="Invalid cursor")
+
+    if last_value is None:
+        if not nullable:
+            raise HTTPException(status_code=400, detail="Invalid cursor")
+        return and_(sort_column.is_(None), CompanySummary.id < last_id)
+    after = tuple_(sort_column, CompanySummary.id) < (last_value, last_id)
+    return or_(after, sort_column.is_(None)) if nullable else after
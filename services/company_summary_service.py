@@ -0,0 +1,113 @@
+from sqlalchemy import func, select, text
+from sqlalchemy.orm import Session
+
+# refresh_company only stages statements on the caller's session; it runs in
+# the same transaction as the job_openings change and commits with it.
+
+_REFRESH_SQL = text("""
+    INSERT INTO company_summary AS s (
+        company_name, company_address, industry_id, company_size_id,
+        jobs_count, internships_count, active_openings, last_active_time, modified_date
+    )
+    SELECT
+        :company_name,
+        :company_address,
+        (ARRAY_AGG(jo.industry_id ORDER BY jo.created_date DESC NULLS LAST, jo.id DESC))[1],
+        (ARRAY_AGG(jo.company_size_id ORDER BY jo.created_date DESC NULLS LAST, jo.id DESC))[1],
+        COUNT(*) FILTER (WHERE jo.sub_module_id = 1),
+        COUNT(*) FILTER (WHERE jo.sub_module_id = 2),
+        COUNT(*),
+        MAX(jo.created_date),
+        now()
+    FROM job_openings jo
+    WHERE jo.company_name = :company_name
+      AND jo.company_address = :company_address
+      AND jo.is_active = TRUE
+    ON CONFLICT (company_name, company_address) DO UPDATE SET
+        industry_id = COALESCE(EXCLUDED.industry_id, s.industry_id),
+        company_size_id = COALESCE(EXCLUDED.company_size_id, s.company_size_id),
+        jobs_count = EXCLUDED.jobs_count,
+        internships_count = EXCLUDED.internships_count,
+        active_openings = EXCLUDED.active_openings,
+        last_active_time = EXCLUDED.last_active_time,
+        modified_date = now()
+""")
+
+
+def refresh_company(db: Session, company_name: str, company_address: str):
+    """
+    Recompute one company's summary row from its active job openings.
+
+    Call after the job opening change is flushed. The advisory lock
+    serialises refreshes of the same company, so the second of two concurrent
+    writers recomputes after the first has committed and sees both openings.
+    """
+    db.flush()
+    db.execute(
+        select(func.pg_advisory_xact_lock(func.hashtext(company_name + "\x1f" + company_address)))
+    )
+    db.execute(_REFRESH_SQL, {"company_name": company_name, "company_address": company_address})
+
+
+# Recomputes every company from job_openings; companies whose openings have
+# all been closed are zeroed rather than deleted so their ids stay stable.
+REBUILD_SQL = text("""
+    WITH agg AS (
+        SELECT
+            jo.company_name,
+            jo.company_address,
+            (ARRAY_AGG(jo.industry_id ORDER BY jo.created_date DESC NULLS LAST, jo.id DESC)
+                FILTER (WHERE jo.is_active))[1] AS industry_id,
+            (ARRAY_AGG(jo.company_size_id ORDER BY jo.created_date DESC NULLS LAST, jo.id DESC)
+                FILTER (WHERE jo.is_active))[1] AS company_size_id,
+            COUNT(*) FILTER (WHERE jo.is_active AND jo.sub_module_id = 1) AS jobs_count,
+            COUNT(*) FILTER (WHERE jo.is_active AND jo.sub_module_id = 2) AS internships_count,
+            COUNT(*) FILTER (WHERE jo.is_active) AS active_openings,
+            MAX(jo.created_date) FILTER (WHERE jo.is_active) AS last_active_time
+        FROM job_openings jo
+        GROUP BY jo.company_name, jo.company_address
+    ),
+    upserted AS (
+        INSERT INTO company_summary AS s (
+            company_name, company_address, industry_id, company_size_id,
+            jobs_count, internships_count, active_openings, last_active_time, modified_date
+        )
+        SELECT
+            company_name, company_address, industry_id, company_size_id,
+            jobs_count, internships_count, active_openings, last_active_time, now()
+        FROM agg
+        ON CONFLICT (company_name, company_address) DO UPDATE SET
+            industry_id = COALESCE(EXCLUDED.industry_id, s.industry_id),
+            company_size_id = COALESCE(EXCLUDED.company_size_id, s.company_size_id),
+            jobs_count = EXCLUDED.jobs_count,
+            internships_count = EXCLUDED.internships_count,
+            active_openings = EXCLUDED.active_openings,
+            last_active_time = EXCLUDED.last_active_time,
+            modified_date = now()
+        WHERE (s.jobs_count, s.internships_count, s.active_openings, s.last_active_time)
+              IS DISTINCT FROM
+              (EXCLUDED.jobs_count, EXCLUDED.internships_count, EXCLUDED.active_openings, EXCLUDED.last_active_time)
+        RETURNING 1
+    ),
+    orphaned AS (
+        UPDATE company_summary s SET
+            jobs_count = 0, internships_count = 0, active_openings = 0, last_active_time = NULL, modified_date = now()
+        WHERE s.active_openings > 0
+          AND NOT EXISTS (
+              SELECT 1 FROM agg
+              WHERE agg.company_name = s.company_name AND agg.company_address = s.company_address
+          )
+        RETURNING 1
+    )
+    SELECT (SELECT COUNT(*) FROM upserted) + (SELECT COUNT(*) FROM orphaned)
+""")
+
+
+def rebuild_company_summary(db: Session) -> int:
+    """
+    Repair company_summary from job_openings.
+    Returns the number of rows that were inserted or corrected.
+    """
+    changed = db.execute(REBUILD_SQL).scalar()
+    db.commit()
+    return changed
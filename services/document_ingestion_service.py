@@ -0,0 +1,230 @@
+import hashlib
+import json
+import re
+import time
+from dataclasses import dataclass
+from typing import Iterable, Optional
+from sqlalchemy import text
+from sqlalchemy.orm import Session
+
+from services.vector_search_service import copy_chunks
+from utils.embedding_utils import Embedder, get_embedder
+
+DEFAULT_CHUNK_CHARS = 1000
+DEFAULT_OVERLAP_CHARS = 100
+DEFAULT_BATCH_CHUNKS = 256
+
+STAGING_COLUMNS = ("doc_id", "chunk_id", "content", "embedding", "language", "metadata", "content_hash")
+
+_SENTENCE_END = re.compile(r"(?<=[.!?])\s+")
+
+
+@dataclass
+class SourceDocument:
+    doc_id: str
+    content: str
+    language: Optional[str] = None
+    metadata: Optional[dict] = None
+
+
+@dataclass
+class IngestStats:
+    documents: int = 0
+    chunks: int = 0
+    skipped: int = 0
+    written: int = 0
+    removed: int = 0
+    seconds: float = 0.0
+
+    @property
+    def chunks_per_second(self) -> float:
+        return self.chunks / self.seconds if self.seconds else 0.0
+
+    def as_dict(self) -> dict:
+        return {
+            "documents": self.documents,
+            "chunks": self.chunks,
+            "skipped_unchanged": self.skipped,
+            "written": self.written,
+            "removed_stale": self.removed,
+            "seconds": round(self.seconds, 3),
+            "chunks_per_second": round(self.chunks_per_second, 1),
+        }
+
+
+def chunk_text(content: str, max_chars: int = DEFAULT_CHUNK_CHARS, overlap: int = DEFAULT_OVERLAP_CHARS) -> list:
+    """
+    Split text into chunks of at most `max_chars`, breaking on paragraph and
+    sentence boundaries where possible. Consecutive chunks share up to
+    `overlap` trailing characters so context is not cut mid-thought.
+    """
+    pieces = []
+    for paragraph in re.split(r"\n\s*\n", content.strip()):
+        paragraph = " ".join(paragraph.split())
+        if not paragraph:
+            continue
+        for sentence in _SENTENCE_END.split(paragraph):
+            # hard-wrap sentences that are longer than a chunk on their own
+            while len(sentence) > max_chars:
+                pieces.append(sentence[:max_chars])
+                sentence = sentence[max_chars:]
+            if sentence:
+                pieces.append(sentence)
+
+    chunks, current = [], ""
+    for piece in pieces:
+        if current and len(current) + 1 + len(piece) > max_chars:
+            chunks.append(current)
+            tail = current[-overlap:] if overlap else ""
+            current = (tail + " " + piece) if tail and len(tail) + 1 + len(piece) <= max_chars else piece
+        else:
+            current = f"{current} {piece}" if current else piece
+    if current:
+        chunks.append(current)
+    return chunks
+
+
+def content_hash(content: str) -> str:
+    return hashlib.sha256(content.encode("utf-8")).hexdigest()
+
+
+def _existing_chunks(db: Session, doc_ids: list) -> dict:
+    """(doc_id, chunk_id) -> (content_hash, language, metadata) of the stored rows."""
+    rows = db.execute(
+        text("SELECT doc_id, chunk_id, content_hash, language, metadata FROM ai_documents WHERE doc_id = ANY(:doc_ids)"),
+        {"doc_ids": doc_ids}
+    ).all()
+    return {(row.doc_id, row.chunk_id): (row.content_hash, row.language, row.metadata) for row in rows}
+
+
+_UPSERT_FROM_STAGING = text("""
+    INSERT INTO ai_documents (doc_id, chunk_id, content, embedding, language, metadata, content_hash)
+    SELECT doc_id, chunk_id, content, embedding, language, metadata, content_hash
+    FROM ai_documents_staging
+    ON CONFLICT (doc_id, chunk_id) DO UPDATE SET
+        content = EXCLUDED.content,
+        embedding = EXCLUDED.embedding,
+        language = EXCLUDED.language,
+        metadata = EXCLUDED.metadata,
+        content_hash = EXCLUDED.content_hash,
+        is_active = true,
+        modified_date = now()
+""")
+
+# same content, new language/metadata: the stored embedding is still valid
+_UPDATE_ATTRIBUTES = text("""
+    UPDATE ai_documents
+    SET language = :language, metadata = CAST(:metadata AS jsonb), is_active = true, modified_date = now()
+    WHERE doc_id = :doc_id AND chunk_id = :chunk_id
+""")
+
+_DELETE_STALE = text("""
+    DELETE FROM ai_documents d
+    USING unnest(CAST(:doc_ids AS varchar[]), CAST(:chunk_counts AS int[])) AS n(doc_id, chunk_count)
+    WHERE d.doc_id = n.doc_id AND d.chunk_id >= n.chunk_count
+""")
+
+
+def _write_batch(db: Session, rows: list, chunk_counts: dict, relabelled: list = ()) -> int:
+    """
+    Upsert one batch: COPY into a transaction-local staging table, then a single
+    INSERT ... ON CONFLICT (doc_id, chunk_id). Unchanged chunks whose language or
+    metadata changed are updated in place, and chunks past a document's new
+    chunk count (the document got shorter) are deleted, in the same transaction.
+    """
+    removed = 0
+    if relabelled:
+        db.execute(_UPDATE_ATTRIBUTES, list(relabelled))
+    if rows:
+        db.execute(text(
+            "CREATE TEMP TABLE IF NOT EXISTS ai_documents_staging "
+            "(LIKE ai_documents INCLUDING DEFAULTS) ON COMMIT DELETE ROWS"
+        ))
+        copy_chunks(db, rows, table="ai_documents_staging", columns=STAGING_COLUMNS)
+        db.execute(_UPSERT_FROM_STAGING)
+    if chunk_counts:
+        removed = db.execute(
+            _DELETE_STALE,
+            {"doc_ids": list(chunk_counts), "chunk_counts": list(chunk_counts.values())}
+        ).rowcount
+    db.commit()
+    return removed
+
+
+def ingest_documents(
+    db: Session,
+    documents: Iterable[SourceDocument],
+    embedder: Optional[Embedder] = None,
+    batch_chunks: int = DEFAULT_BATCH_CHUNKS,
+    max_chars: int = DEFAULT_CHUNK_CHARS,
+    overlap: int = DEFAULT_OVERLAP_CHARS
+) -> IngestStats:
+    """
+    Stream documents into ai_documents.
+
+    Documents are chunked and buffered until `batch_chunks` chunks are pending.
+    Chunks whose content hash, language and metadata match the stored row are
+    skipped; if only language or metadata changed the row is updated without
+    re-embedding. The rest are embedded in one call per batch and upserted by
+    (doc_id, chunk_id). Re-running with the same input writes nothing.
+    """
+    embedder = embedder or get_embedder()
+    stats = IngestStats()
+    start = time.perf_counter()
+
+    # doc_id -> (document, [(chunk_id, chunk, hash), ...]); a doc_id seen twice in
+    # one batch keeps its latest version, since ON CONFLICT cannot touch a row twice
+    pending = {}
+    pending_chunks = 0
+
+    def flush():
+        nonlocal pending, pending_chunks
+        if not pending:
+            return
+        existing = _existing_chunks(db, list(pending))
+        to_embed, relabelled = [], []
+        for doc, chunks in pending.values():
+            for chunk_id, chunk, digest in chunks:
+                stored = existing.get((doc.doc_id, chunk_id))
+                if stored is None or stored[0] != digest:
+                    to_embed.append((doc, chunk_id, chunk, digest))
+                elif stored[1:] != (doc.language, doc.metadata):
+                    relabelled.append({
+                        "doc_id": doc.doc_id,
+                        "chunk_id": chunk_id,
+                        "language": doc.language,
+                        "metadata": json.dumps(doc.metadata) if doc.metadata is not None else None,
+                    })
+                else:
+                    stats.skipped += 1
+
+        rows = []
+        if to_embed:
+            vectors = embedder.embed([chunk for _, _, chunk, _ in to_embed])
+            rows = [
+                (doc.doc_id, chunk_id, chunk, vector, doc.language, doc.metadata, digest)
+                for (doc, chunk_id, chunk, digest), vector in zip(to_embed, vectors)
+            ]
+        chunk_counts = {doc_id: len(chunks) for doc_id, (_, chunks) in pending.items()}
+        stats.removed += _write_batch(db, rows, chunk_counts, relabelled)
+        stats.written += len(rows) + len(relabelled)
+        pending, pending_chunks = {}, 0
+
+    for doc in documents:
+        chunks = [
+            (chunk_id, chunk, content_hash(chunk))
+            for chunk_id, chunk in enumerate(chunk_text(doc.content, max_chars, overlap))
+        ]
+        stats.documents += 1
+        stats.chunks += len(chunks)
+        replaced = pending.get(doc.doc_id)
+        if replaced:
+            pending_chunks -= len(replaced[1])
+        pending[doc.doc_id] = (doc, chunks)
+        pending_chunks += len(chunks)
+        if pending_chunks >= batch_chunks:
+            flush()
+    flush()
+
+    stats.seconds = time.perf_counter() - start
+    return stats
@@ -0,0 +1,111 @@
+import csv
+import io
+import json
+from datetime import date, datetime, time
+from decimal import Decimal
+from fastapi.responses import StreamingResponse
+from sqlalchemy import select, text
+from core.database import SessionLocal
+from models.generated_models import FoodOrder, HomeServicePayment
+
+EXPORT_BATCH_SIZE = 1000
+
+EXPORT_MEDIA_TYPES = {
+    "ndjson": "application/x-ndjson",
+    "csv": "text/csv",
+}
+
+
+def _json_default(value):
+    if isinstance(value, (datetime, date, time)):
+        return value.isoformat()
+    if isinstance(value, Decimal):
+        return str(value)
+    return str(value)
+
+
+def _csv_value(value):
+    if value is None:
+        return ""
+    if isinstance(value, (dict, list)):
+        return json.dumps(value, default=_json_default)
+    if isinstance(value, (datetime, date, time)):
+        return value.isoformat()
+    return value
+
+
+def _stream_batches(statement, params: dict | None = None):
+    """
+    Yield the column names, then lists of row mappings from a server-side cursor.
+
+    The export owns its session: FastAPI closes `get_db` sessions before a
+    StreamingResponse body is sent, so the request session cannot be reused.
+    """
+    db = SessionLocal()
+    try:
+        result = db.execute(
+            statement,
+            params or {},
+            execution_options={"stream_results": True, "yield_per": EXPORT_BATCH_SIZE},
+        )
+        yield list(result.keys())
+        for partition in result.mappings().partitions(EXPORT_BATCH_SIZE):
+            yield partition
+    finally:
+        db.close()
+
+
+def _ndjson_lines(batches):
+    next(batches, None)  # column names
+    for batch in batches:
+        yield "".join(json.dumps(dict(row), default=_json_default) + "\n" for row in batch)
+
+
+def _csv_lines(batches):
+    buffer = io.StringIO()
+    writer = csv.writer(buffer)
+    # the header comes from the result columns, so an empty export still has one
+    columns = next(batches, None)
+    if columns is not None:
+        writer.writerow(columns)
+    for batch in batches:
+        for row in batch:
+            writer.writerow([_csv_value(v) for v in row.values()])
+        yield buffer.getvalue()
+        buffer.seek(0)
+        buffer.truncate(0)
+    if buffer.tell():
+        yield buffer.getvalue()
+
+
+def stream_export(statement, export_format: str, params: dict | None = None):
+    batches = _stream_batches(statement, params)
+    if export_format == "csv":
+        return _csv_lines(batches)
+    return _ndjson_lines(batches)
+
+
+def export_response(lines, filename: str, export_format: str) -> StreamingResponse:
+    return StreamingResponse(
+        lines,
+        media_type=EXPORT_MEDIA_TYPES[export_format],
+        headers={"Content-Disposition": f'attachment; filename="{filename}.{export_format}"'},
+    )
+
+
+def export_home_service_bookings(export_format: str):
+    return stream_export(text("SELECT * FROM fn_get_all_home_service_bookings()"), export_format)
+
+
+def export_home_service_payments(export_format: str):
+    statement = (
+        select(*HomeServicePayment.__table__.columns)
+        .where(HomeServicePayment.is_active == True)
+        .order_by(HomeServicePayment.id)
+    )
+    return stream_export(statement, export_format)
+
+
+def export_food_orders(export_format: str):
+    statement = select(*FoodOrder.__table__.columns).order_by(FoodOrder.id)
+    return stream_export(statement, export_format)
@@ -1,15 +1,14 @@
-from datetime import datetime, timedelta, timezone
-from dataclasses import dataclass
-from typing import Dict
 from sqlalchemy.orm import Session
 from models.generated_models import UserRegistration
 from utils.hash_utils import hash_password
-from utils.otp_utils import generate_otp
 from utils.mail_agent import send_forgot_password_otp
 from utils.jwt_utils import create_reset_token, verify_token
+from core.auth_cache import invalidate_principal
+from services.otp_service import check_rate_limit, issue_otp, consume_otp
 
 OTP_EXP_MINUTES = 10
 RESET_TOKEN_EXP_MINUTES = 15
+OTP_PURPOSE = "password_reset"
 
 
 class UserNotFound(Exception):
@@ -24,34 +23,18 @@ class OtpExpired(Exception):
     pass
 
 
-@dataclass
-class OtpEntry:
-    user_id: int
-    expires_at: datetime
-    used: bool = False
-
-otp_store: Dict[str, OtpEntry] = {}
-
-
 async def request_password_reset(email: str, db: Session) -> None:
     """
     STEP 1: user submits email.
-    Check user exists, generate OTP, store in memory, send email with first name.
+    Check user exists, generate OTP, store in the KV store, send email with first name.
     """
+    check_rate_limit(OTP_PURPOSE, email)
+
     user = db.query(UserRegistration).filter(UserRegistration.email == email).first()
     if not user:
         raise UserNotFound("Email not registered")
-    otp = generate_otp()
-    while otp in otp_store:
-        otp = generate_otp()
 
-    expires_at = datetime.now(timezone.utc) + timedelta(minutes=OTP_EXP_MINUTES)
-
-    otp_store[otp] = OtpEntry(
-        user_id=user.id,
-        expires_at=expires_at,
-        used=False,
-    )
+    otp = issue_otp(OTP_PURPOSE, email, str(user.id), OTP_EXP_MINUTES * 60)
 
     first_name = getattr(user, "first_name", None) or "User"
 
@@ -61,27 +44,18 @@ async def request_password_reset(email: str, db: Session) -> None:
         print("ERROR SENDING RESET OTP EMAIL:", repr(e))
 
 
-def verify_otp(otp: str, db: Session) -> str:
+def verify_otp(email: str, otp: str, db: Session) -> str:
     """
-    STEP 2: user submits OTP ONCE (no email).
-    - Validate OTP
-    - Mark it as used
+    STEP 2: user submits the email and OTP.
+    - Validate the OTP issued to that email and consume it (expired or used OTPs are already gone)
+    - Wrong codes are rate limited per email; too many revoke the OTP
     - Create & return a short-lived reset token (JWT)
     """
-    entry = otp_store.get(otp)
-    if not entry:
-        raise InvalidOtp("Invalid OTP")
-
-    if entry.used:
-        raise InvalidOtp("OTP already used")
-
-    now = datetime.now(timezone.utc)
-    if entry.expires_at < now:
-        raise OtpExpired("OTP expired")
-
-    entry.used = True
+    user_id = consume_otp(OTP_PURPOSE, email, otp)
+    if user_id is None:
+        raise InvalidOtp("Invalid or expired OTP")
 
-    user = db.query(UserRegistration).filter(UserRegistration.id == entry.user_id).first()
+    user = db.query(UserRegistration).filter(UserRegistration.id == int(user_id)).first()
     if not user:
         raise UserNotFound("User not found")
 
@@ -110,3 +84,4 @@ def reset_password(reset_token: str, new_password: str, db: Session) -> None:
 
     user.password = hash_password(new_password)
     db.commit()
+    invalidate_principal(user_id)
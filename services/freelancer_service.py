@@ -1,3 +1,4 @@
+import asyncio
 import os
 import uuid
 import json
@@ -8,7 +9,9 @@ from datetime import datetime
 from services.role_service import validate_role
 from utils.jwt_utils import create_access_token, create_refresh_token
 from models.generated_models import UserRegistration,HomeServiceBooking,UserSkill,UserServices
-from utils.hash_utils import hash_password, verify_password
+from utils.hash_utils import hash_password, verify_and_rehash_async
+from core.auth_cache import invalidate_principal
+from services.freelancer_stats_service import record_completion
 from services.master_default_service import (
     fetch_default_skill,
     fetch_default_state,
@@ -25,7 +28,19 @@ from core.constants import (
 )
 
 
-def freelancer_login_service(db: Session, payload, response) -> dict:
+def _find_freelancer(db: Session, identifier: str):
+    query = db.query(UserRegistration).filter(
+        UserRegistration.role_id == FREELANCER_ROLE_ID, 
+        UserRegistration.is_active == True
+    )
+    return (
+        query.filter(UserRegistration.email == identifier).first()
+        if "@" in identifier else
+        query.filter(UserRegistration.mobile == identifier).first()
+    )
+
+
+async def freelancer_login_service(db: Session, payload, response) -> dict:
     """
     Authenticate freelancer and generate JWT tokens.
     Only allows login for APPROVED freelancers (status_id=1).
@@ -41,22 +56,19 @@ def freelancer_login_service(db: Session, payload, response) -> dict:
 
     identifier = payload.email_or_phone.strip()
 
-    query = db.query(UserRegistration).filter(
-        UserRegistration.role_id == FREELANCER_ROLE_ID, 
-        UserRegistration.is_active == True
-    )
-
-    freelancer = (
-        query.filter(UserRegistration.email == identifier).first()
-        if "@" in identifier else
-        query.filter(UserRegistration.mobile == identifier).first()
-    )
+    # DB work runs on a worker thread; the password check is awaited on the hashing pool
+    freelancer = await asyncio.to_thread(_find_freelancer, db, identifier)
 
     if not freelancer:
         raise HTTPException(404, "Freelancer not found")
 
-    if not verify_password(payload.password, freelancer.password):
+    is_valid, new_hash = await verify_and_rehash_async(payload.password, freelancer.password)
+    if not is_valid:
         raise HTTPException(status_code=400, detail="Invalid password")
+
+    if new_hash:
+        freelancer.password = new_hash
+        await asyncio.to_thread(db.commit)
     
     # Explicitly require APPROVED status (status_id=1)
     if freelancer.status_id == STATUS_PENDING:
@@ -202,6 +214,7 @@ def freelancer_update_service(db: Session, freelancer_id: int, payload) -> dict:
         freelancer.password = hash_password(payload.password)
 
     db.commit()
+    invalidate_principal(freelancer_id)
     db.refresh(freelancer)
 
     return {"message": "Freelancer updated successfully", "freelancer_id": freelancer.id}
@@ -236,6 +249,7 @@ def freelancer_delete_service(db: Session, freelancer_id: int) -> dict:
 
     db.delete(freelancer)
     db.commit()
+    invalidate_principal(freelancer_id)
 
     return {"message": "Freelancer deleted successfully"}
 
@@ -332,6 +346,7 @@ def freelancer_complete_job_service(
     # ✅ Valid completion - Update status and mark completion time
     service.work_status_id = WORK_STATUS_JOB_COMPLETED
     service.modified_date = datetime.utcnow()
+    record_completion(db, freelancer_id)
 
     db.commit()
     db.refresh(service)
@@ -0,0 +1,160 @@
+from datetime import datetime
+from typing import Optional
+from sqlalchemy import case, func, select, text, update
+from sqlalchemy.dialects.postgresql import insert
+from sqlalchemy.orm import Session
+
+from models.generated_models import FreelancerStats
+from core.constants import FREELANCER_ROLE_ID, BOOKING_STATUS_ASSIGNED, WORK_STATUS_JOB_COMPLETED
+
+# These helpers only stage statements on the caller's session; they run in the
+# same transaction as the booking change and are committed (or rolled back) with it.
+
+
+def _avg(rating_sum, rating_count):
+    return case((rating_count > 0, func.round(rating_sum * 1.0 / rating_count, 2)), else_=0)
+
+
+def ensure_stats_row(db: Session, freelancer_id: int):
+    db.execute(
+        insert(FreelancerStats)
+        .values(freelancer_id=freelancer_id)
+        .on_conflict_do_nothing(index_elements=[FreelancerStats.freelancer_id])
+    )
+
+
+def reserve_assignment(
+    db: Session,
+    freelancer_id: int,
+    max_active_jobs: int,
+    wait: bool = False,
+    assigned_at: Optional[datetime] = None
+) -> bool:
+    """
+    Take one open-job slot for `freelancer_id` if they are below max_active_jobs.
+
+    The stats row stays locked until the caller commits, so concurrent
+    allocations can never push a freelancer over capacity. With wait=False a
+    row locked by another allocation is skipped (returns False) instead of
+    waited on; allocations that try several candidates use this so they
+    never block each other or deadlock.
+    """
+    query = db.query(FreelancerStats).filter(FreelancerStats.freelancer_id == freelancer_id)
+    query = query.with_for_update() if wait else query.with_for_update(skip_locked=True)
+    stats = query.first()
+    if stats is None:
+        ensure_stats_row(db, freelancer_id)
+        stats = query.first()
+    if stats is None or stats.active_jobs >= max_active_jobs:
+        return False
+
+    assigned_at = assigned_at or datetime.utcnow()
+    stats.total_jobs += 1
+    stats.active_jobs += 1
+    stats.last_job_at = max(stats.last_job_at or assigned_at, assigned_at)
+    stats.modified_date = assigned_at
+    return True
+
+
+def record_completion(db: Session, freelancer_id: int):
+    db.execute(
+        update(FreelancerStats)
+        .where(FreelancerStats.freelancer_id == freelancer_id)
+        .values(
+            active_jobs=func.greatest(FreelancerStats.active_jobs - 1, 0),
+            modified_date=func.now()
+        )
+    )
+
+
+def record_rating(db: Session, freelancer_id: int, old_rating: Optional[int], new_rating: Optional[int]):
+    """Apply a booking rating change (set, changed or cleared) to the summary."""
+    if old_rating == new_rating:
+        return
+    sum_delta = (new_rating or 0) - (old_rating or 0)
+    count_delta = (new_rating is not None) - (old_rating is not None)
+    rating_sum = FreelancerStats.rating_sum + sum_delta
+    rating_count = FreelancerStats.rating_count + count_delta
+
+    ensure_stats_row(db, freelancer_id)
+    db.execute(
+        update(FreelancerStats)
+        .where(FreelancerStats.freelancer_id == freelancer_id)
+        .values(
+            rating_sum=rating_sum,
+            rating_count=rating_count,
+            avg_rating=_avg(rating_sum, rating_count),
+            modified_date=func.now()
+        )
+    )
+
+
+# Recomputes rows from home_service_booking. Freelancers without bookings get
+# a zero row so candidate listings can scan freelancer_stats alone.
+REBUILD_SQL = text("""
+    WITH agg AS (
+        SELECT
+            u.id AS freelancer_id,
+            COUNT(b.id) AS total_jobs,
+            COUNT(b.id) FILTER (
+                WHERE b.status_id = :assigned_status
+                  AND COALESCE(b.work_status_id, 0) <> :completed_work_status
+            ) AS active_jobs,
+            COUNT(b.rating) AS rating_count,
+            COALESCE(SUM(b.rating), 0) AS rating_sum,
+            MAX(b.modified_date) AS last_job_at
+        FROM user_registration u
+        LEFT JOIN home_service_booking b
+               ON b.assigned_to = u.id AND b.is_active = true
+        WHERE u.role_id = :freelancer_role
+          AND (CAST(:freelancer_id AS bigint) IS NULL OR u.id = :freelancer_id)
+        GROUP BY u.id
+    )
+    INSERT INTO freelancer_stats AS s
+        (freelancer_id, total_jobs, active_jobs, rating_count, rating_sum, avg_rating, last_job_at, modified_date)
+    SELECT
+        freelancer_id, total_jobs, active_jobs, rating_count, rating_sum,
+        CASE WHEN rating_count > 0 THEN ROUND(rating_sum::numeric / rating_count, 2) ELSE 0 END,
+        last_job_at, now()
+    FROM agg
+    ON CONFLICT (freelancer_id) DO UPDATE SET
+        total_jobs = EXCLUDED.total_jobs,
+        active_jobs = EXCLUDED.active_jobs,
+        rating_count = EXCLUDED.rating_count,
+        rating_sum = EXCLUDED.rating_sum,
+        avg_rating = EXCLUDED.avg_rating,
+        last_job_at = EXCLUDED.last_job_at,
+        modified_date = now()
+    WHERE (s.total_jobs, s.active_jobs, s.rating_count, s.rating_sum)
+          IS DISTINCT FROM
+          (EXCLUDED.total_jobs, EXCLUDED.active_jobs, EXCLUDED.rating_count, EXCLUDED.rating_sum)
+""")
+
+
+def rebuild_freelancer_stats(db: Session, freelancer_id: Optional[int] = None) -> int:
+    """
+    Repair freelancer_stats from the booking table (all freelancers, or one).
+    Returns the number of rows that were inserted or corrected.
+    """
+    result = db.execute(
+        REBUILD_SQL,
+        {
+            "assigned_status": BOOKING_STATUS_ASSIGNED,
+            "completed_work_status": WORK_STATUS_JOB_COMPLETED,
+            "freelancer_role": FREELANCER_ROLE_ID,
+            "freelancer_id": freelancer_id,
+        }
+    )
+    db.commit()
+    return result.rowcount
+
+
+def get_stats(db: Session, freelancer_ids) -> dict:
+    """freelancer_id -> (active_jobs, avg_rating) for the given ids (primary key lookups)."""
+    if not freelancer_ids:
+        return {}
+    rows = db.execute(
+        select(FreelancerStats.freelancer_id, FreelancerStats.active_jobs, FreelancerStats.avg_rating)
+        .where(FreelancerStats.freelancer_id.in_(list(freelancer_ids)))
+    ).all()
+    return {row[0]: (row[1], float(row[2])) for row in rows}
@@ -1,8 +1,10 @@
 from sqlalchemy.orm import Session,joinedload
+from sqlalchemy.ext.asyncio import AsyncSession
 from fastapi import HTTPException,status
 from datetime import datetime
 
 from sqlalchemy import text
+from core.master_cache import master_registry
 from models.generated_models import (
     AmbulanceBooking,
     Appointments,
@@ -180,32 +182,17 @@ def create_doctor_profile(
         )
 
     # 3️⃣ Validate specialization
-    specialization = db.query(MasterDoctorSpecialization).filter(
-        MasterDoctorSpecialization.id == data.specialization_id,
-        MasterDoctorSpecialization.is_active == True
-    ).first()
-
-    if not specialization:
+    if not master_registry.exists(db, MasterDoctorSpecialization, data.specialization_id, active_only=True):
         raise HTTPException(status_code=400, detail="Invalid specialization")
 
     # 4️⃣ Validate hospital (optional)
     if data.hospital_id:
-        hospital = db.query(MasterHospital).filter(
-            MasterHospital.id == data.hospital_id,
-            MasterHospital.is_active == True
-        ).first()
-
-        if not hospital:
+        if not master_registry.exists(db, MasterHospital, data.hospital_id, active_only=True):
             raise HTTPException(status_code=400, detail="Invalid hospital")
 
     # 5️⃣ Validate consultation type (optional)
     if data.consultation_type_id:
-        consultation_type = db.query(MasterConsultationType).filter(
-            MasterConsultationType.id == data.consultation_type_id,
-            MasterConsultationType.is_active == True
-        ).first()
-
-        if not consultation_type:
+        if not master_registry.exists(db, MasterConsultationType, data.consultation_type_id, active_only=True):
             raise HTTPException(status_code=400, detail="Invalid consultation type")
 
     # 6️⃣ Validate availability time
@@ -408,13 +395,14 @@ def release_ambulance_booking(
 
 
 
-def get_available_hospitals(db: Session):
+async def get_available_hospitals(db: AsyncSession):
     query = text("""
         SELECT *
         FROM fn_get_available_hospitals()
     """)
 
-    return db.execute(query).mappings().all()
+    result = await db.execute(query)
+    return result.mappings().all()
 
 def get_available_labs(db: Session):
     query = text("""
@@ -3,6 +3,7 @@ from sqlalchemy.orm import Session
 from fastapi import HTTPException, status
 from typing import Optional
 
+from core.master_cache import master_registry
 from models.generated_models import HomeService
 from schemas.home_schema import HomeServiceCreate, HomeServiceUpdate
 from core.constants import (
@@ -32,7 +33,10 @@ def validate_fk(db: Session, model, value: Optional[int], field_name: str):
     """
     if value is None:
         return
-    exists = db.query(model.id).filter(model.id == value).first()
+    if master_registry.is_cached(model):
+        exists = master_registry.exists(db, model, value)
+    else:
+        exists = db.query(model.id).filter(model.id == value).first()
     if not exists:
         raise HTTPException(
             status_code=status.HTTP_400_BAD_REQUEST, detail=f"Invalid {field_name}"
@@ -1,5 +1,7 @@
 from sqlalchemy import text
 from sqlalchemy.orm import Session
+from core.pagination import PageParams, paginate
+from services.bus_alert_service import bus_alert_pipeline
 from datetime import datetime
 from fastapi import HTTPException,status
 
@@ -63,8 +65,8 @@ def create_institution(db: Session,payload: InstitutionRegistrationCreate):
     db.refresh(institution)
     return institution
 
-def get_all_branches(db: Session):
-    return db.query(InstitutionBranch).all()
+def get_all_branches(db: Session, page: PageParams):
+    return paginate(db.query(InstitutionBranch), InstitutionBranch, page)
 
 def get_institution_by_id(db: Session,institution_id: int):
     institution = db.query(InstitutionRegistration).filter(
@@ -162,10 +164,11 @@ def create_student_profile(db: Session, payload: StudentProfileCreate):
     return student
 
 
-def get_all_students(db: Session):
-    return db.query(StudentProfile).filter(
+def get_all_students(db: Session, page: PageParams):
+    query = db.query(StudentProfile).filter(
         StudentProfile.is_active == True
-    ).all()
+    )
+    return paginate(query, StudentProfile, page)
 
 
 def get_active_branch_directory(db: Session, branch_id: int):
@@ -312,19 +315,31 @@ def create_bus(db:Session,payload):
     return bus
 
 def create_bus_alert(db: Session, payload: BusAlertCreate):
-    alert = BusAlertLog(
-        **payload.dict(exclude_unset=True),
-        created_date=datetime.utcnow()
+    # deduplicated against the open alerts in bus_alert_log, committed, then pushed to subscribers
+    return bus_alert_pipeline.submit(
+        db,
+        bus_id=str(payload.bus_id),
+        alert_type=payload.alert_type,
+        alert_message=payload.alert_message,
+        created_by=payload.created_by,
+        is_active=payload.is_active is not False
     )
-    db.add(alert)
-    db.commit()
-    db.refresh(alert)
-    return alert
 
-def get_all_alerts(db: Session):
-    return db.query(BusAlertLog).filter(
+def get_all_alerts(db: Session, page: PageParams, resolved: bool | None = None):
+    query = db.query(BusAlertLog).filter(BusAlertLog.is_active == True)
+    if resolved is not None:
+        query = query.filter(BusAlertLog.resolved == resolved)
+    return paginate(query, BusAlertLog, page)
+
+def get_open_alerts(db: Session, page: PageParams, bus_id: str | None = None):
+    # matches the partial index idx_bus_alert_log_unresolved
+    query = db.query(BusAlertLog).filter(
+        BusAlertLog.resolved == False,
         BusAlertLog.is_active == True
-    ).order_by(BusAlertLog.alert_time.desc()).all()
+    )
+    if bus_id:
+        query = query.filter(BusAlertLog.bus_id == bus_id)
+    return paginate(query, BusAlertLog, page)
 
 def update_bus_alert(db: Session,alert_id: int,payload: BusAlertUpdate):
     alert = db.query(BusAlertLog).filter(
@@ -341,6 +356,8 @@ def update_bus_alert(db: Session,alert_id: int,payload: BusAlertUpdate):
     alert.modified_date = datetime.utcnow()
     db.commit()
     db.refresh(alert)
+    if alert.resolved or alert.is_active is False:
+        bus_alert_pipeline.resolved(alert)
     return alert
 
 def get_bus_tracking_overview(db:Session):
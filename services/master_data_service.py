@@ -1,12 +1,24 @@
 from sqlalchemy.orm import Session
-from models.generated_models import MasterModule,MasterSubModule,MasterService,MasterSubService,MasterSubGroup,MasterServiceType
+from core.master_cache import master_registry
+from models.generated_models import MasterModule,MasterSubModule,MasterService,MasterSubService,MasterSubGroup,MasterTimeSlot
+
+# master_service_type is no longer part of the generated models, so it is not served here
+MASTER_DATA_MODELS = (MasterModule,MasterSubModule,MasterService,MasterSubService,MasterSubGroup)
+
+def get_master_data_version(db: Session):
+    return tuple(master_registry.get_version(db, model) for model in MASTER_DATA_MODELS)
 
 def get_master_data(db: Session):
     return {
-    "modules": db.query(MasterModule).all(),
-    "sub_modules": db.query(MasterSubModule).all(),
-    "services": db.query(MasterService).all(),
-    "sub_services": db.query(MasterSubService).all(),
-    "sub_groups": db.query(MasterSubGroup).all(),
-    "service_types": db.query(MasterServiceType).all(),
-    }
\ No newline at end of file
+    "modules": master_registry.get_rows(db, MasterModule),
+    "sub_modules": master_registry.get_rows(db, MasterSubModule),
+    "services": master_registry.get_rows(db, MasterService),
+    "sub_services": master_registry.get_rows(db, MasterSubService),
+    "sub_groups": master_registry.get_rows(db, MasterSubGroup),
+    }
+
+def get_time_slot_version(db: Session):
+    return master_registry.get_version(db, MasterTimeSlot)
+
+def get_active_time_slots(db: Session):
+    return master_registry.get_rows(db, MasterTimeSlot, active_only=True)
\ No newline at end of file
@@ -1,11 +1,14 @@
+from datetime import datetime
 from sqlalchemy import text
 from sqlalchemy.orm import Session
+from sqlalchemy.ext.asyncio import AsyncSession
 from fastapi import HTTPException
 from models.generated_models import HomeServiceBooking, HomeServiceBookingServiceMap, MasterGarage, MasterGarageService, MasterMechanic, UserRegistration
 from schemas.home_schema import HomeServiceBookingCreateSchema, HomeServiceBookingMapCreateSchema, MasterMechanicCreateSchema
 from fastapi import HTTPException, Query
 from models.generated_models import HomeServiceBooking, HomeServiceBookingAddOn, HomeServicePayment, MasterGarage, MasterMechanic, UserRegistration
 from schemas.home_schema import HomeServiceBookingAddOnCreate, HomeServiceBookingCreateSchema, HomeServicePaymentCreate, MasterMechanicCreateSchema
+from services.freelancer_stats_service import record_rating
 
 
 def create_home_service_booking(db: Session,data: HomeServiceBookingCreateSchema):
@@ -54,15 +57,25 @@ def create_home_service_booking(db: Session,data: HomeServiceBookingCreateSchema
     db.refresh(booking)
     return booking
 
-def get_all_home_service_bookings(db: Session):
-    query = text("""
-        SELECT *
-        FROM fn_get_all_home_service_bookings()
-    """)
-
-    result = db.execute(query).mappings().all()
-
-    return result
+def rate_home_service_booking(db: Session, booking_id: int, rating: int, user_id: int):
+    # the row lock keeps the old rating stable while freelancer_stats is adjusted by the difference
+    booking = db.query(HomeServiceBooking).filter(
+        HomeServiceBooking.id == booking_id,
+        HomeServiceBooking.is_active == True
+    ).with_for_update().first()
+    if not booking:
+        raise HTTPException(status_code=404, detail="Booking not found")
+    if booking.created_by != user_id:
+        raise HTTPException(status_code=403, detail="Only the customer who booked can rate it")
+    if not booking.assigned_to:
+        raise HTTPException(status_code=400, detail="Booking has no assigned freelancer to rate")
+
+    record_rating(db, booking.assigned_to, booking.rating, rating)
+    booking.rating = rating
+    booking.modified_by = user_id
+    booking.modified_date = datetime.utcnow()
+    db.commit()
+    return {"message": "Rating updated successfully", "booking_id": booking.id, "rating": booking.rating}
 
 def create_master_mechanic(db: Session,data: MasterMechanicCreateSchema):
     garage = db.query(MasterGarage).filter(
@@ -130,15 +143,15 @@ def get_all_home_service_booking_add_ons(db: Session):
              .filter(HomeServiceBookingAddOn.is_active == True)\
              .all()
 
-def get_all_home_service_bookings(db: Session):
+async def get_all_home_service_bookings(db: AsyncSession):
     query = text("""
         SELECT *
         FROM fn_get_all_home_service_bookings()
     """)
 
     try:
-        result = db.execute(query).mappings().all()
-        return result
+        result = await db.execute(query)
+        return result.mappings().all()
     except Exception as e:
         raise Exception(f"Database function error: {str(e)}")
 
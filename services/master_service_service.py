@@ -1,4 +1,5 @@
 from sqlalchemy.orm import Session
+from core.master_cache import master_registry
 from fastapi import HTTPException
 from models.generated_models import MasterService
 from schemas.master_service_schema import (
@@ -22,6 +23,7 @@ def create_service_service(db: Session, data: MasterServiceCreate):
     obj = MasterService(**data.model_dump())
     db.add(obj)
     db.commit()
+    master_registry.bump_version(MasterService)
     db.refresh(obj)
     return obj
 
@@ -38,6 +40,7 @@ def update_service_service(db: Session,service_id: int,data: MasterServiceUpdate
         setattr(obj, key, value)
 
     db.commit()
+    master_registry.bump_version(MasterService)
     db.refresh(obj)
     return obj
 
@@ -53,5 +56,6 @@ def delete_service_service(db: Session, service_id: int):
 
     obj.is_active = False
     db.commit()
+    master_registry.bump_version(MasterService)
 
     return {"message": "Service deleted successfully"}
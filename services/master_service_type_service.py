@@ -1,4 +1,5 @@
 from sqlalchemy.orm import Session
+from core.master_cache import master_registry
 from fastapi import HTTPException
 from models.generated_models import MasterServiceType
 from schemas.master_service_type_schema import (
@@ -28,6 +29,7 @@ def create_service_type(db: Session, data: ServiceTypeCreate):
     obj = MasterServiceType(**data.model_dump())
     db.add(obj)
     db.commit()
+    master_registry.bump_version(MasterServiceType)
     db.refresh(obj)
     return obj
 
@@ -42,6 +44,7 @@ def update_service_type(db: Session, service_type_id: int, data: ServiceTypeUpda
         setattr(obj, key, value)
 
     db.commit()
+    master_registry.bump_version(MasterServiceType)
     db.refresh(obj)
     return obj
 
@@ -57,4 +60,5 @@ def delete_service_type(db: Session, service_type_id: int):
 
     obj.is_active = False
     db.commit()
+    master_registry.bump_version(MasterServiceType)
     return {"message": "Service type deleted successfully"}
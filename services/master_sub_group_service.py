@@ -1,4 +1,5 @@
 from sqlalchemy.orm import Session
+from core.master_cache import master_registry
 from fastapi import HTTPException
 from models.generated_models import MasterSubGroup
 from schemas.master_sub_group_schema import (SubGroupCreate,SubGroupUpdate)
@@ -19,6 +20,7 @@ def create_sub_group(db: Session, data: SubGroupCreate):
     obj = MasterSubGroup(**data.model_dump())
     db.add(obj)
     db.commit()
+    master_registry.bump_version(MasterSubGroup)
     db.refresh(obj)
     return obj
 def update_sub_group(
@@ -37,6 +39,7 @@ def update_sub_group(
         setattr(obj, key, value)
 
     db.commit()
+    master_registry.bump_version(MasterSubGroup)
     db.refresh(obj)
     return obj
 def delete_sub_group(db: Session, sub_group_id: int):
@@ -50,4 +53,5 @@ def delete_sub_group(db: Session, sub_group_id: int):
 
     obj.is_active = False
     db.commit()
+    master_registry.bump_version(MasterSubGroup)
     return {"message": "Sub group deleted successfully"}
@@ -1,4 +1,5 @@
 from sqlalchemy.orm import Session
+from core.master_cache import master_registry
 from fastapi import HTTPException
 from models.generated_models import MasterSubModule
 from schemas.sub_module_schema import (
@@ -22,6 +23,7 @@ def create_sub_module_service(db: Session, data: SubModuleCreate):
     obj = MasterSubModule(**data.model_dump())
     db.add(obj)
     db.commit()
+    master_registry.bump_version(MasterSubModule)
     db.refresh(obj)
     return obj
 
@@ -42,6 +44,7 @@ def update_sub_module_service(
         setattr(obj, key, value)
 
     db.commit()
+    master_registry.bump_version(MasterSubModule)
     db.refresh(obj)
     return obj
 
@@ -57,5 +60,6 @@ def delete_sub_module_service(db: Session, sub_module_id: int):
 
     obj.is_active = False
     db.commit()
+    master_registry.bump_version(MasterSubModule)
 
     return {"message": "Sub module deleted successfully"}
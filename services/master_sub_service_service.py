@@ -1,4 +1,5 @@
 from sqlalchemy.orm import Session
+from core.master_cache import master_registry
 from fastapi import HTTPException
 from models.generated_models import MasterSubService
 from schemas.master_sub_service_schema import (SubServiceCreate,SubServiceUpdate)
@@ -17,6 +18,7 @@ def create_sub_service(db: Session, data: SubServiceCreate):
     obj = MasterSubService(**data.model_dump())
     db.add(obj)
     db.commit()
+    master_registry.bump_version(MasterSubService)
     db.refresh(obj)
     return obj
 
@@ -33,6 +35,7 @@ def update_sub_service(db: Session,sub_service_id: int,data: SubServiceUpdate):
         setattr(obj, key, value)
 
     db.commit()
+    master_registry.bump_version(MasterSubService)
     db.refresh(obj)
     return obj
 
@@ -47,4 +50,5 @@ def delete_sub_service(db: Session, sub_service_id: int):
 
     obj.is_active = False
     db.commit()
+    master_registry.bump_version(MasterSubService)
     return {"message": "Sub-service deleted successfully"}
@@ -1,4 +1,5 @@
 from sqlalchemy.orm import Session
+from core.master_cache import master_registry
 from models.generated_models import MasterTimeSlot
 from schemas.master_time_slot_schema import TimeSlotCreate, TimeSlotUpdate
 
@@ -17,6 +18,7 @@ def create_time_slot(db: Session, data: TimeSlotCreate):
     record = MasterTimeSlot(**data.dict())
     db.add(record)
     db.commit()
+    master_registry.bump_version(MasterTimeSlot)
     db.refresh(record)
     return build_timeslot_response(record)
 
@@ -39,6 +41,7 @@ def update_time_slot(db: Session, id: int, data: TimeSlotUpdate):
         setattr(record, k, v)
 
     db.commit()
+    master_registry.bump_version(MasterTimeSlot)
     db.refresh(record)
     return build_timeslot_response(record)
 
@@ -48,4 +51,5 @@ def delete_time_slot(db: Session, id: int):
         return None
     db.delete(record)
     db.commit()
+    master_registry.bump_version(MasterTimeSlot)
     return True
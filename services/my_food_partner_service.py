@@ -1,17 +1,19 @@
 from requests import session
 from sqlalchemy.orm import Session
+from sqlalchemy.ext.asyncio import AsyncSession
 from sqlalchemy import text
+from core.http_cache import bump_data_version
 
 
 # 1 Get items by restaurant and category
-def get_items_by_restaurant_and_category_service(restaurant_id:int, category_id:int, db:Session):
+async def get_items_by_restaurant_and_category_service(restaurant_id:int, category_id:int, db:AsyncSession):
 
     query = text("""
         SELECT *
         FROM fn_get_items_by_restaurant_and_category(:restaurant_id,:category_id)
     """)
 
-    result = db.execute(query,{
+    result = await db.execute(query,{
         "restaurant_id":restaurant_id,
         "category_id":category_id
     })
@@ -20,14 +22,14 @@ def get_items_by_restaurant_and_category_service(restaurant_id:int, category_id:
 
 
 # 2 Restaurant view data
-def get_restaurant_view_data_service(partner_id:int,module_id:int,db:Session):
+async def get_restaurant_view_data_service(partner_id:int,module_id:int,db:AsyncSession):
 
     query = text("""
         SELECT *
         FROM fn_get_restaurant_view_data(:partner_id,:module_id)
     """)
 
-    result = db.execute(query,{
+    result = await db.execute(query,{
         "partner_id":partner_id,
         "module_id":module_id
     })
@@ -36,14 +38,14 @@ def get_restaurant_view_data_service(partner_id:int,module_id:int,db:Session):
 
 
 # 3 Partner location
-def get_partner_location_service(partner_id:int,db:Session):
+async def get_partner_location_service(partner_id:int,db:AsyncSession):
 
     query = text("""
         SELECT *
         FROM fn_manage_partner_location(:partner_id)
     """)
 
-    result = db.execute(query,{
+    result = await db.execute(query,{
         "partner_id":partner_id
     })
 
@@ -51,14 +53,14 @@ def get_partner_location_service(partner_id:int,db:Session):
 
 
 # 4 Partner order counts
-def get_partner_order_counts_service(partner_id:int,db:Session):
+async def get_partner_order_counts_service(partner_id:int,db:AsyncSession):
 
     query = text("""
         SELECT *
         FROM fn_get_partner_order_counts(:partner_id)
     """)
 
-    result = db.execute(query,{
+    result = await db.execute(query,{
         "partner_id":partner_id
     })
 
@@ -66,14 +68,14 @@ def get_partner_order_counts_service(partner_id:int,db:Session):
 
 
 # 5 Partner revenue by day
-def get_partner_revenue_by_day_service(partner_id:int,date:str,db:Session):
+async def get_partner_revenue_by_day_service(partner_id:int,date:str,db:AsyncSession):
 
     query = text("""
         SELECT *
         FROM fn_get_partner_revenue_by_day(:partner_id,:date)
     """)
 
-    result = db.execute(query,{
+    result = await db.execute(query,{
         "partner_id":partner_id,
         "date":date
     })
@@ -82,14 +84,14 @@ def get_partner_revenue_by_day_service(partner_id:int,date:str,db:Session):
 
 
 # 6 Partner reviews
-def get_partner_reviews_service(partner_id:int,db:Session):
+async def get_partner_reviews_service(partner_id:int,db:AsyncSession):
 
     query = text("""
         SELECT *
         FROM fn_get_partner_reviews(:partner_id)
     """)
 
-    result = db.execute(query,{
+    result = await db.execute(query,{
         "partner_id":partner_id
     })
 
@@ -97,14 +99,14 @@ def get_partner_reviews_service(partner_id:int,db:Session):
 
 
 # 7 Popular items this week
-def get_popular_items_this_week_service(partner_id:int,db:Session):
+async def get_popular_items_this_week_service(partner_id:int,db:AsyncSession):
 
     query = text("""
         SELECT *
         FROM fn_get_popular_items_this_week(:partner_id)
     """)
 
-    result = db.execute(query,{
+    result = await db.execute(query,{
         "partner_id":partner_id
     })
 
@@ -112,14 +114,14 @@ def get_popular_items_this_week_service(partner_id:int,db:Session):
 
 
 # 8 Menu items by meal id
-def get_partner_menu_items_by_meal_id_service(partner_id:int,meal_id:int,db:Session):
+async def get_partner_menu_items_by_meal_id_service(partner_id:int,meal_id:int,db:AsyncSession):
 
     query = text("""
         SELECT *
         FROM fn_get_partner_menu_items_by_meal_id(:partner_id,:meal_id)
     """)
 
-    result = db.execute(query,{
+    result = await db.execute(query,{
         "partner_id":partner_id,
         "meal_id":meal_id
     })
@@ -136,28 +138,29 @@ def add_full_menu_item_service(data:dict,db:Session):
 
     db.execute(query,{"data":data})
     db.commit()
+    bump_data_version("food_menu")
 
     return {"message":"Menu item added successfully"}
 
 #get partner notification
-def get_partner_notifications_service(partner_id: int, db:Session):
+async def get_partner_notifications_service(partner_id: int, db:AsyncSession):
     
     query = text("""
         SELECT *
         FROM fn_get_partner_notifications(:partner_id)
     """)
     
-    result = db.execute(query, {
+    result = await db.execute(query, {
         "partner_id" : partner_id
     })
     
     return [dict(row._mapping) for row in result]
 
 #get partner messages
-def get_partner_messages_services(partner_id: int, db:Session):
+async def get_partner_messages_services(partner_id: int, db:AsyncSession):
     query = text("""
         SELECT *
         FROM fn_get_partner_messages(:partner_id)
     """)
-    result = db.execute(query,{"partner_id": partner_id})
+    result = await db.execute(query,{"partner_id": partner_id})
     return [dict(row._mapping) for row in result]
\ No newline at end of file
@@ -1,5 +1,6 @@
 from sqlalchemy import text
 from sqlalchemy.orm import Session
+from core.pagination import PageParams, paginate
 from models.generated_models import (
     FoodOrder,
     FoodOrderRefundRequest,
@@ -52,9 +53,9 @@ def create_food_order(db: Session, order: FoodOrderCreate):
     return db_order
 
 
-def get_food_orders(db: Session):
+def get_food_orders(db: Session, page: PageParams):
 
-    return db.query(FoodOrder).all()
+    return paginate(db.query(FoodOrder), FoodOrder, page)
 
 
 def get_food_order_by_id(db: Session, order_id: int):
@@ -108,8 +109,8 @@ def create_refund_request(db: Session, refund: FoodOrderRefundRequestCreate):
     return db_refund
 
 
-def get_all_refund_requests(db: Session):
-    return db.query(FoodOrderRefundRequest).all()
+def get_all_refund_requests(db: Session, page: PageParams):
+    return paginate(db.query(FoodOrderRefundRequest), FoodOrderRefundRequest, page)
 
 
 def get_refund_request_by_id(db: Session, refund_id: int):
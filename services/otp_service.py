@@ -0,0 +1,69 @@
+import secrets
+from typing import Optional
+from fastapi import HTTPException, status
+from app.config.settings import settings
+from core.kv_store import get_kv_store
+from utils.otp_utils import generate_otp
+
+
+def check_rate_limit(scope: str, identifier: str, limit: Optional[int] = None, window_seconds: Optional[int] = None):
+    """Fixed-window limit per (scope, identifier); raises 429 once `limit` is exceeded."""
+    limit = limit or settings.OTP_RATE_LIMIT
+    window_seconds = window_seconds or settings.OTP_RATE_LIMIT_WINDOW_SECONDS
+    count = get_kv_store().incr(f"ratelimit:{scope}:{identifier.lower()}", window_seconds)
+    if count > limit:
+        raise HTTPException(
+            status_code=status.HTTP_429_TOO_MANY_REQUESTS,
+            detail="Too many requests, please try again later"
+        )
+
+
+def _otp_key(purpose: str, identifier: str) -> str:
+    return f"otp:{purpose}:{identifier.lower()}"
+
+
+def issue_otp(purpose: str, identifier: str, value: str, ttl_seconds: int) -> str:
+    """
+    Store `value` under a fresh OTP for (`purpose`, `identifier`) and return the OTP.
+
+    One OTP is live per identifier: issuing a new one replaces the previous code.
+    """
+    otp = generate_otp()
+    get_kv_store().set(_otp_key(purpose, identifier), f"{otp}:{value}", ttl_seconds)
+    return otp
+
+
+def consume_otp(purpose: str, identifier: str, otp: str) -> Optional[str]:
+    """
+    Return the value stored for `identifier` if `otp` matches, and invalidate it;
+    None if unknown, expired or wrong.
+
+    Wrong codes count against OTP_VERIFY_ATTEMPTS per identifier; past the limit
+    the OTP is revoked and 429 is raised, so a 6-digit code cannot be guessed.
+    """
+    store = get_kv_store()
+    key = _otp_key(purpose, identifier)
+    stored = store.get(key)
+    code, _, value = (stored or "").partition(":")
+    if stored is None or not secrets.compare_digest(code, otp):
+        try:
+            check_rate_limit(f"{purpose}:verify", identifier, limit=settings.OTP_VERIFY_ATTEMPTS)
+        except HTTPException:
+            store.delete(key)
+            raise
+        return None
+    # pop, so two requests racing with the right code cannot both succeed
+    if store.pop(key) != stored:
+        return None
+    return value
+
+
+def issue_reset_token(user_id: int, ttl_seconds: int) -> str:
+    token = secrets.token_urlsafe(32)
+    get_kv_store().set(f"reset:{token}", str(user_id), ttl_seconds)
+    return token
+
+
+def consume_reset_token(token: str) -> Optional[int]:
+    user_id = get_kv_store().pop(f"reset:{token}")
+    return int(user_id) if user_id is not None else None
@@ -1,5 +1,6 @@
 from fastapi import HTTPException
 from sqlalchemy.orm import Session
+from core.pagination import PageParams, paginate
 from models.generated_models import (
     CompaniesRegistration,
     DoctorRegistration,
@@ -407,7 +408,7 @@ def create_my_food_registration(db: Session, payload: MyFoodRegistrationCreate):
 # GET FUNCTIONS (ALL OR BY ID)
 # ============================================================
 
-def get_companies(db: Session, company_id: int | None = None):
+def get_companies(db: Session, company_id: int | None = None, page: PageParams | None = None):
 
     if company_id:
         company = db.query(CompaniesRegistration).filter(
@@ -419,7 +420,7 @@ def get_companies(db: Session, company_id: int | None = None):
 
         return company
 
-    return db.query(CompaniesRegistration).all()
+    return paginate(db.query(CompaniesRegistration), CompaniesRegistration, page)
 
 
 def get_training(db: Session, training_id: int | None = None):
@@ -437,7 +438,7 @@ def get_training(db: Session, training_id: int | None = None):
     return db.query(TrainingRegistration).all()
 
 
-def get_hospitals(db: Session, hospital_id: int | None = None):
+def get_hospitals(db: Session, hospital_id: int | None = None, page: PageParams | None = None):
 
     if hospital_id:
         hospital = db.query(HospitalRegistration).filter(
@@ -449,10 +450,10 @@ def get_hospitals(db: Session, hospital_id: int | None = None):
 
         return hospital
 
-    return db.query(HospitalRegistration).all()
+    return paginate(db.query(HospitalRegistration), HospitalRegistration, page)
 
 
-def get_labs(db: Session, lab_id: int | None = None):
+def get_labs(db: Session, lab_id: int | None = None, page: PageParams | None = None):
 
     if lab_id:
         lab = db.query(LabRegistration).filter(
@@ -464,7 +465,7 @@ def get_labs(db: Session, lab_id: int | None = None):
 
         return lab
 
-    return db.query(LabRegistration).all()
+    return paginate(db.query(LabRegistration), LabRegistration, page)
 
 
 def get_medical_stores(db: Session, store_id: int | None = None):
@@ -482,7 +483,7 @@ def get_medical_stores(db: Session, store_id: int | None = None):
     return db.query(MedicalStoreRegistration).all()
 
 
-def get_doctors(db: Session, doctor_id: int | None = None):
+def get_doctors(db: Session, doctor_id: int | None = None, page: PageParams | None = None):
 
     if doctor_id:
         doctor = db.query(DoctorRegistration).filter(
@@ -494,10 +495,10 @@ def get_doctors(db: Session, doctor_id: int | None = None):
 
         return doctor
 
-    return db.query(DoctorRegistration).all()
+    return paginate(db.query(DoctorRegistration), DoctorRegistration, page)
 
 
-def get_students(db: Session, student_id: int | None = None):
+def get_students(db: Session, student_id: int | None = None, page: PageParams | None = None):
 
     if student_id:
         student = db.query(StudentRegistration).filter(
@@ -509,7 +510,7 @@ def get_students(db: Session, student_id: int | None = None):
 
         return student
 
-    return db.query(StudentRegistration).all()
+    return paginate(db.query(StudentRegistration), StudentRegistration, page)
 
 
 def get_general_education(db: Session, edu_id: int | None = None):
@@ -527,7 +528,7 @@ def get_general_education(db: Session, edu_id: int | None = None):
     return db.query(GeneralEducationRegistration).all()
 
 
-def get_my_food(db: Session, food_id: int | None = None):
+def get_my_food(db: Session, food_id: int | None = None, page: PageParams | None = None):
 
     if food_id:
         food = db.query(MyFoodRegistration).filter(
@@ -539,4 +540,4 @@ def get_my_food(db: Session, food_id: int | None = None):
 
         return food
 
-    return db.query(MyFoodRegistration).all()
\ No newline at end of file
+    return paginate(db.query(MyFoodRegistration), MyFoodRegistration, page)
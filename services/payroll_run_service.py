@@ -0,0 +1,296 @@
+from datetime import datetime
+from typing import Callable, Optional
+from fastapi import HTTPException
+from sqlalchemy import text
+from sqlalchemy.orm import Session
+
+from app.config.settings import settings
+from models.generated_models import PayrollPeriod, PayrollRun
+
+RUNNING = "RUNNING"
+COMPLETED = "COMPLETED"
+FAILED = "FAILED"
+
+PAYSLIP_STATUS = "DISBURSED"
+
+# Each active staff member gets this month's payslip from their latest earlier
+# payslip: the fixed components are carried forward, the one-off performance
+# bonus is not, and gross/deductions/net are recomputed from the components.
+# Staff with no earlier payslip have no pay structure yet and are skipped;
+# existing payslips for the month (e.g. entered by hand) are left untouched.
+_CHUNK_SQL = text("""
+    WITH chunk AS (
+        SELECT sp.staff_id
+        FROM staff_profile sp
+        WHERE sp.is_active = true
+          AND (CAST(:after AS varchar) IS NULL OR sp.staff_id > CAST(:after AS varchar))
+        ORDER BY sp.staff_id
+        LIMIT :chunk_size
+    ),
+    source AS (
+        SELECT
+            c.staff_id,
+            prev.found,
+            COALESCE(prev.basic_pay, 0) AS basic_pay,
+            COALESCE(prev.hra, 0) AS hra,
+            COALESCE(prev.medical_allowance, 0) AS medical_allowance,
+            COALESCE(prev.conveyance, 0) AS conveyance,
+            COALESCE(prev.pf_deduction, 0) AS pf_deduction,
+            COALESCE(prev.income_tax, 0) AS income_tax,
+            COALESCE(prev.professional_tax, 0) AS professional_tax,
+            COALESCE(prev.health_insurance, 0) AS health_insurance
+        FROM chunk c
+        LEFT JOIN LATERAL (
+            SELECT
+                true AS found, p.basic_pay, p.hra, p.medical_allowance, p.conveyance,
+                p.pf_deduction, p.income_tax, p.professional_tax, p.health_insurance
+            FROM staff_payslip p
+            WHERE p.staff_id = c.staff_id
+              AND p.is_active = true
+              AND p.payroll_month <> :payroll_month
+            ORDER BY p.created_date DESC NULLS LAST, p.id DESC
+            LIMIT 1
+        ) prev ON true
+    ),
+    inserted AS (
+        INSERT INTO staff_payslip (
+            staff_id, payroll_month, payment_date,
+            basic_pay, hra, medical_allowance, conveyance, performance_bonus, gross_earnings,
+            pf_deduction, income_tax, professional_tax, health_insurance, total_deductions, net_salary,
+            status, created_by, created_date
+        )
+        SELECT
+            s.staff_id, :payroll_month, :payment_date,
+            s.basic_pay, s.hra, s.medical_allowance, s.conveyance, 0, t.gross,
+            s.pf_deduction, s.income_tax, s.professional_tax, s.health_insurance, t.deductions, t.gross - t.deductions,
+            :status, :created_by, now()
+        FROM source s
+        CROSS JOIN LATERAL (
+            SELECT
+                s.basic_pay + s.hra + s.medical_allowance + s.conveyance AS gross,
+                s.pf_deduction + s.income_tax + s.professional_tax + s.health_insurance AS deductions
+        ) t
+        WHERE s.found
+        ON CONFLICT (staff_id, payroll_month) DO NOTHING
+        RETURNING 1
+    )
+    SELECT
+        (SELECT COUNT(*) FROM chunk) AS staff,
+        (SELECT MAX(staff_id) FROM chunk) AS last_staff_id,
+        (SELECT COUNT(*) FROM inserted) AS generated,
+        (SELECT COUNT(*) FROM source s
+         WHERE s.found IS NULL
+           AND NOT EXISTS (
+               SELECT 1 FROM staff_payslip p
+               WHERE p.staff_id = s.staff_id AND p.payroll_month = :payroll_month
+           )) AS skipped
+""")
+
+# Month totals are taken from every active payslip of the month, so hand-made
+# payslips count too and a rerun converges on the same figures.
+_TOTALS_SQL = text("""
+    WITH totals AS (
+        SELECT
+            COUNT(*) AS staff_count,
+            COALESCE(SUM(net_salary), 0) AS net,
+            COALESCE(SUM(total_deductions), 0) AS deductions,
+            COALESCE(SUM(basic_pay), 0) AS basic_pay,
+            COALESCE(SUM(hra), 0) AS hra,
+            COALESCE(SUM(medical_allowance), 0) AS medical,
+            COALESCE(SUM(conveyance), 0) AS conveyance,
+            COALESCE(SUM(gross_earnings), 0) AS gross,
+            COALESCE(SUM(pf_deduction), 0) AS pf,
+            COALESCE(SUM(professional_tax), 0) AS professional_tax,
+            COALESCE(SUM(health_insurance), 0) AS insurance
+        FROM staff_payslip
+        WHERE payroll_month = :payroll_month
+          AND is_active = true
+    ),
+    earnings_updated AS (
+        UPDATE salary_earnings e SET
+            total_net_disbursement = t.net,
+            total_deduction = t.deductions,
+            staff_count = t.staff_count,
+            status = :status,
+            basic_salary = t.basic_pay,
+            hra = t.hra,
+            medical = t.medical,
+            conveyance = t.conveyance,
+            gross_earnings = t.gross,
+            pf = t.pf,
+            professional_tax = t.professional_tax,
+            insurance = t.insurance,
+            modified_by = :created_by,
+            modified_date = now()
+        FROM totals t
+        WHERE e.payroll_period_id = :payroll_period_id
+          AND e.is_active = true
+        RETURNING e.id
+    ),
+    earnings_inserted AS (
+        INSERT INTO salary_earnings (
+            payroll_period_id, total_net_disbursement, total_deduction, staff_count, status,
+            basic_salary, hra, medical, conveyance, gross_earnings, pf, professional_tax, insurance,
+            created_by, is_active
+        )
+        SELECT
+            :payroll_period_id, t.net, t.deductions, t.staff_count, :status,
+            t.basic_pay, t.hra, t.medical, t.conveyance, t.gross, t.pf, t.professional_tax, t.insurance,
+            :created_by, true
+        FROM totals t
+        WHERE NOT EXISTS (SELECT 1 FROM earnings_updated)
+    ),
+    summary AS (
+        INSERT INTO payroll_summary (payroll_month, total_net_disbursement, staff_count, status, created_by, created_date)
+        SELECT :payroll_month, t.net, t.staff_count, :status, :created_by, now()
+        FROM totals t
+        ON CONFLICT (payroll_month) DO UPDATE SET
+            total_net_disbursement = EXCLUDED.total_net_disbursement,
+            staff_count = EXCLUDED.staff_count,
+            status = EXCLUDED.status,
+            is_active = true,
+            modified_by = EXCLUDED.created_by,
+            modified_date = now()
+    )
+    SELECT staff_count FROM totals
+""")
+
+# A completed run is started again from the first staff member (new staff are
+# picked up, existing payslips are kept); an interrupted one resumes after
+# last_staff_id.
+_START_SQL = text("""
+    INSERT INTO payroll_run AS r (payroll_period_id, payroll_month, status, total_staff, created_by)
+    VALUES (:payroll_period_id, :payroll_month, 'RUNNING', :total_staff, :created_by)
+    ON CONFLICT (payroll_period_id) DO UPDATE SET
+        status = 'RUNNING',
+        total_staff = EXCLUDED.total_staff,
+        processed_staff = CASE WHEN r.status = 'COMPLETED' THEN 0 ELSE r.processed_staff END,
+        generated_payslips = CASE WHEN r.status = 'COMPLETED' THEN 0 ELSE r.generated_payslips END,
+        skipped_staff = CASE WHEN r.status = 'COMPLETED' THEN 0 ELSE r.skipped_staff END,
+        last_staff_id = CASE WHEN r.status = 'COMPLETED' THEN NULL ELSE r.last_staff_id END,
+        error = NULL,
+        started_at = CASE WHEN r.status = 'COMPLETED' THEN now() ELSE r.started_at END,
+        finished_at = NULL,
+        modified_date = now()
+    RETURNING r.id, r.payroll_month
+""")
+
+
+def default_payroll_month(period: PayrollPeriod) -> str:
+    return f"{period.month} {period.year}"
+
+
+def get_payroll_run(db: Session, payroll_period_id: int) -> PayrollRun:
+    run = db.query(PayrollRun).filter(PayrollRun.payroll_period_id == payroll_period_id).first()
+    if not run:
+        raise HTTPException(status_code=404, detail="Payroll run not found")
+    return run
+
+
+def _start_run(db: Session, period: PayrollPeriod, payroll_month: str, created_by: Optional[int]) -> int:
+    total_staff = db.execute(
+        text("SELECT COUNT(*) FROM staff_profile WHERE is_active = true")
+    ).scalar()
+    row = db.execute(_START_SQL, {
+        "payroll_period_id": period.id,
+        "payroll_month": payroll_month,
+        "total_staff": total_staff,
+        "created_by": created_by,
+    }).one()
+    if row.payroll_month != payroll_month:
+        db.rollback()
+        raise HTTPException(
+            status_code=409,
+            detail=f"Payroll period {period.id} was already run as '{row.payroll_month}'"
+        )
+    db.commit()
+    return row.id
+
+
+def _lock_run(db: Session, run_id: int) -> PayrollRun:
+    # concurrent runs of the same period queue here and continue from the committed position
+    return db.query(PayrollRun).filter(PayrollRun.id == run_id).with_for_update().populate_existing().one()
+
+
+def run_payroll(
+    db: Session,
+    payroll_period_id: int,
+    payroll_month: Optional[str] = None,
+    created_by: Optional[int] = None,
+    chunk_size: Optional[int] = None,
+    progress: Optional[Callable[[PayrollRun], None]] = None
+) -> PayrollRun:
+    """
+    Generate every active staff member's payslip for a payroll period, then
+    write the period's salary_earnings row and the month's payroll_summary.
+
+    Staff are processed in staff_id order, `chunk_size` at a time; each chunk
+    is one INSERT ... SELECT committed together with the run's progress, so a
+    crash loses at most one chunk and the next call resumes after it. With a
+    chunk size at least the staff count the whole month is one transaction.
+
+    Reruns are idempotent: uk_staff_payslip (staff_id, payroll_month) turns
+    existing payslips into no-ops and the totals are recomputed, not added.
+    """
+    chunk_size = chunk_size or settings.PAYROLL_RUN_CHUNK_SIZE
+    period = db.query(PayrollPeriod).filter(
+        PayrollPeriod.id == payroll_period_id,
+        PayrollPeriod.is_active == True
+    ).first()
+    if not period:
+        raise HTTPException(status_code=404, detail="Payroll period not found")
+
+    payroll_month = payroll_month or default_payroll_month(period)
+    payment_date = period.end_date.date() if period.end_date else None
+    run_id = _start_run(db, period, payroll_month, created_by)
+
+    try:
+        while True:
+            run = _lock_run(db, run_id)
+            if run.status == COMPLETED:
+                db.commit()
+                return run
+
+            result = db.execute(_CHUNK_SQL, {
+                "after": run.last_staff_id,
+                "chunk_size": chunk_size,
+                "payroll_month": payroll_month,
+                "payment_date": payment_date,
+                "status": PAYSLIP_STATUS,
+                "created_by": created_by,
+            }).one()
+            if result.staff:
+                run.processed_staff += result.staff
+                run.generated_payslips += result.generated
+                run.skipped_staff += result.skipped
+                run.last_staff_id = result.last_staff_id
+                run.modified_date = datetime.utcnow()
+            if result.staff < chunk_size:
+                break
+            db.commit()
+            if progress:
+                progress(run)
+
+        # the run row is still locked from the last chunk
+        db.execute(_TOTALS_SQL, {
+            "payroll_period_id": period.id,
+            "payroll_month": payroll_month,
+            "status": PAYSLIP_STATUS,
+            "created_by": created_by,
+        })
+        run.status = COMPLETED
+        run.finished_at = datetime.utcnow()
+        run.modified_date = run.finished_at
+        db.commit()
+    except Exception as e:
+        db.rollback()
+        run = _lock_run(db, run_id)
+        run.status = FAILED
+        run.error = repr(e)
+        run.modified_date = datetime.utcnow()
+        db.commit()
+        raise
+
+    if progress:
+        progress(run)
+    return run
@@ -1,5 +1,6 @@
 from sqlalchemy import text
 from sqlalchemy.orm import Session
+from core.pagination import PageParams, paginate
 from datetime import datetime
 from fastapi import HTTPException
 from models.generated_models import PropertySellListing
@@ -141,13 +142,9 @@ def get_property_listing_by_id(
 
     return listing
 
-def get_all_property_listings(db: Session):
-    return (
-        db.query(PropertyListing)
-        .filter(PropertyListing.is_active == True)
-        .order_by(PropertyListing.created_date.desc())
-        .all()
-    )
+def get_all_property_listings(db: Session, page: PageParams):
+    query = db.query(PropertyListing).filter(PropertyListing.is_active == True)
+    return paginate(query, PropertyListing, page)
 
 def update_property_listing(db: Session,listing_id: int,payload: PropertyListingUpdate):
     listing = get_property_listing_by_id(db, listing_id)
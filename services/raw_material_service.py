@@ -1,5 +1,6 @@
 from sqlalchemy.orm import Session
 from fastapi import HTTPException, status
+from core.http_cache import bump_data_version
 from models.generated_models import RawMaterialDetails
 from schemas.raw_material_schema import RawMaterialCreate
 
@@ -17,6 +18,7 @@ def create_raw_material(db: Session,data: RawMaterialCreate,user_id: int | None
 
     db.add(raw_material)
     db.commit()
+    bump_data_version("raw_materials")
     db.refresh(raw_material)
 
     return raw_material
@@ -1,3 +1,4 @@
+from sqlalchemy import text
 from sqlalchemy.orm import Session
 from fastapi import HTTPException, status
 from models.generated_models import (
@@ -5,6 +6,9 @@ from models.generated_models import (
     UserRegistration
 )
 
+# namespace for pg_advisory_xact_lock(int, int) keys held while a student's days are changed
+ATTENDANCE_LOCK_NAMESPACE = 4101
+
 
 def upsert_student_attendance(db: Session,user_id: int,attendance_percentage) -> StudentAttendance:
     student = (
@@ -41,3 +45,108 @@ def upsert_student_attendance(db: Session,user_id: int,attendance_percentage) ->
     db.commit()
     db.refresh(record)
     return record
+
+
+_LOCK_STUDENTS_SQL = text("""
+    SELECT pg_advisory_xact_lock(:namespace, CAST(u AS integer))
+    FROM unnest(CAST(:user_ids AS bigint[])) AS u
+    ORDER BY u
+""")
+
+# One statement per batch: upsert the days, diff them against what was stored
+# before, and fold the per-student differences into the student_attendance
+# counters. Days whose value did not change produce no delta.
+_BATCH_SQL = text("""
+    WITH input AS (
+        SELECT *
+        FROM unnest(CAST(:user_ids AS bigint[]), CAST(:dates AS date[]), CAST(:present AS boolean[]))
+            AS i(user_id, attendance_date, present)
+    ),
+    prev AS (
+        SELECT d.user_id, d.attendance_date, d.present
+        FROM student_attendance_day d
+        JOIN input i ON i.user_id = d.user_id AND i.attendance_date = d.attendance_date
+    ),
+    upserted AS (
+        INSERT INTO student_attendance_day AS d (user_id, attendance_date, present)
+        SELECT user_id, attendance_date, present FROM input
+        ON CONFLICT (user_id, attendance_date) DO UPDATE SET
+            present = EXCLUDED.present,
+            modified_date = now()
+        WHERE d.present IS DISTINCT FROM EXCLUDED.present
+        RETURNING d.user_id, d.attendance_date, d.present
+    ),
+    delta AS (
+        SELECT
+            u.user_id,
+            COUNT(*) FILTER (WHERE p.user_id IS NULL) AS days,
+            SUM(CAST(u.present AS integer) - COALESCE(CAST(p.present AS integer), 0)) AS present_days
+        FROM upserted u
+        LEFT JOIN prev p ON p.user_id = u.user_id AND p.attendance_date = u.attendance_date
+        GROUP BY u.user_id
+    )
+    INSERT INTO student_attendance AS a (user_id, days_total, days_present, attendance_percentage, is_active, modified_date)
+    SELECT
+        user_id, days, present_days,
+        ROUND(100.0 * present_days / NULLIF(days, 0), 2),
+        true, now()
+    FROM delta
+    ON CONFLICT (user_id) WHERE is_active = true DO UPDATE SET
+        days_total = a.days_total + EXCLUDED.days_total,
+        days_present = a.days_present + EXCLUDED.days_present,
+        attendance_percentage = ROUND(
+            100.0 * (a.days_present + EXCLUDED.days_present) / NULLIF(a.days_total + EXCLUDED.days_total, 0), 2
+        ),
+        modified_date = now()
+    RETURNING a.user_id, a.attendance_percentage, a.days_total, a.days_present
+""")
+
+
+def record_attendance_batch(db: Session, records: list) -> dict:
+    """
+    Apply many (user_id, attendance_date, present) records in one transaction.
+
+    A later record for the same student and date wins. Only the students in
+    the batch are touched: their days are upserted with a single
+    INSERT ... ON CONFLICT and their counters in student_attendance move by
+    the difference, so attendance_percentage (and the rankings reading it)
+    stays current without recounting history. Resending a batch changes
+    nothing. Records for unknown or inactive students are returned, not applied.
+
+    Percentages set by hand through upsert_student_attendance are replaced by
+    the day-based figure the next time that student's attendance is recorded.
+    """
+    latest = {}
+    for user_id, attendance_date, present in records:
+        latest[(user_id, attendance_date)] = present
+
+    user_ids = sorted({user_id for user_id, _ in latest})
+    known = set(db.execute(
+        text("SELECT id FROM user_registration WHERE id = ANY(:ids) AND is_active = true"),
+        {"ids": user_ids}
+    ).scalars().all()) if user_ids else set()
+    rejected = [user_id for user_id in user_ids if user_id not in known]
+
+    rows = sorted(
+        (user_id, attendance_date, present)
+        for (user_id, attendance_date), present in latest.items()
+        if user_id in known
+    )
+    students = []
+    if rows:
+        # serialises batches that share students, so each one diffs against committed days
+        db.execute(_LOCK_STUDENTS_SQL, {"namespace": ATTENDANCE_LOCK_NAMESPACE, "user_ids": sorted(known)})
+        students = [dict(row) for row in db.execute(_BATCH_SQL, {
+            "user_ids": [r[0] for r in rows],
+            "dates": [r[1] for r in rows],
+            "present": [r[2] for r in rows],
+        }).mappings().all()]
+    db.commit()
+
+    return {
+        "received": len(records),
+        "applied": len(rows),
+        "changed_students": len(students),
+        "rejected_user_ids": rejected,
+        "students": students,
+    }
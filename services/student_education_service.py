@@ -18,10 +18,13 @@ from schemas.student_education_schema import (
     StudentEducationCreate
 )
 from schemas.task_schema import TaskHistoryCreate
+from services.company_summary_service import refresh_company
+from services.student_listing_service import list_students
 
 def create_job_openings(db: Session, data: JobOpeningCreate, user_id: int) -> JobOpenings:
     job = JobOpenings(**data.model_dump(), created_by=user_id)
     db.add(job)
+    refresh_company(db, job.company_name, job.company_address)
     db.commit()
     db.refresh(job)
     return job
@@ -50,6 +53,7 @@ def delete_job_opening_service(db: Session, opening_id: int, user_id: int) -> di
 
     job_opening.is_active = False
     job_opening.modified_by = user_id
+    refresh_company(db, job_opening.company_name, job_opening.company_address)
     db.commit()
 
     return {"message": "Job opening deleted successfully"}
@@ -170,160 +174,45 @@ def get_students_list_service(
     skill_id: int | None = None,
     aggregate: str | None = None,
     internship_status: str | None = None,
-    sort_by: str | None = None, 
+    sort_by: str | None = None,
+    limit: int = 50,
+    cursor: str | None = None,
 ):
-    rows = db.execute(
-        text("""
-            SELECT *
-            FROM vw_students_get_list
-            WHERE
-              (:skill_id IS NULL OR skill_id = :skill_id)
-            AND (:aggregate IS NULL OR aggregate = :aggregate)
-            AND (:internship_status IS NULL OR internship_status = :internship_status)
-        """),
-        {
-            "skill_id": skill_id,
-            "aggregate": aggregate,
-            "internship_status": internship_status,
-        },
-    ).mappings().all()
-
-    students: dict[int, dict] = {}
-
-    for row in rows:
-        user_id = row["user_id"]
-
-        if user_id not in students:
-            students[user_id] = {
-                "user_id": user_id,
-                "student_name": row["student_name"],
-                "joined_date": row["joined_date"],
-                "skill_id": row["skill_id"],
-                "skill": row["skill"],
-                "attendance_percentage": row["attendance_percentage"],
-                "aggregate": row["aggregate"],
-                "internship_status": row["internship_status"],
-                "rating": row["rating"],
-                "education": [],
-                "certificates": [],
-                "_edu_keys": set(),
-                "_cert_keys": set(),
-            }
-
-    if not students:
-        return []
-
-    user_ids = list(students.keys())
-    educations = (
-        db.query(StudentQualification)
-        .filter(
-            StudentQualification.user_id.in_(user_ids),
-            StudentQualification.is_active == True
-        )
-        .all()
-    )
-
-    for edu in educations:
-        key = (edu.degree, edu.institute, edu.percentage)
-
-        if key not in students[edu.user_id]["_edu_keys"]:
-            students[edu.user_id]["_edu_keys"].add(key)
-            students[edu.user_id]["education"].append({
-                "degree": edu.degree,
-                "institute": edu.institute,
-                "percentage": edu.percentage,
-            })
-
-    certificates = (
-        db.query(StudentCertificate)
-        .filter(
-            StudentCertificate.user_id.in_(user_ids),
-            StudentCertificate.is_active == True
-        )
-        .all()
+    return list_students(
+        db,
+        limit=limit,
+        cursor=cursor,
+        sort_by=sort_by,
+        skill_id=skill_id,
+        aggregate=aggregate,
+        internship_status=internship_status,
     )
 
-    for cert in certificates:
-        key = (
-            cert.certificate_name,
-            cert.issued_by,
-            cert.year,
-            cert.upload_certificate
-        )
-
-        if key not in students[cert.user_id]["_cert_keys"]:
-            students[cert.user_id]["_cert_keys"].add(key)
-            students[cert.user_id]["certificates"].append({
-                "id": cert.id,
-                "certificate_name": cert.certificate_name,
-                "issued_by": cert.issued_by,
-                "year": cert.year,
-                "upload_certificate": cert.upload_certificate,
-                "is_active": cert.is_active,
-            })
-
-    for s in students.values():
-        s.pop("_edu_keys")
-        s.pop("_cert_keys")
-
-    students_list = list(students.values())
-
-    if sort_by == "both":
-        students_list.sort(
-            key=lambda s: (
-                float(s["rating"] or 0),
-                float(s["attendance_percentage"] or 0)
-            ),
-            reverse=True
-        )
-
-    return students_list
-
 def get_top_performers_service(
     db: Session,
     limit: int = 10,
     min_attendance: float = 80.0
 ):
-    students = get_students_list_service(
-        db=db,
-        sort_by="both"   
+    students, _ = list_students(
+        db,
+        limit=limit,
+        sort_by="rating",
+        min_attendance=min_attendance,
     )
-
-    filtered_students = [
-        s for s in students
-        if s["attendance_percentage"] is not None
-        and float(s["attendance_percentage"]) >= min_attendance
-    ]
-
-    filtered_students.sort(
-        key=lambda s: (
-            float(s["rating"] or 0),
-            float(s["attendance_percentage"] or 0)
-        ),
-        reverse=True
-    )
-
-    return filtered_students[:limit]
+    return students
 
 def get_recent_joiners_service(
     db: Session,
     limit: int = 10,
     min_rating: float | None = None,
 ):
-    students = get_students_list_service(db=db)
-
-    if min_rating is not None:
-        students = [
-            s for s in students
-            if s["rating"] is not None and float(s["rating"]) >= min_rating
-        ]
-
-    students.sort(
-        key=lambda s: s["joined_date"] or 0,
-        reverse=True
+    students, _ = list_students(
+        db,
+        limit=limit,
+        sort_by="joined_date",
+        min_rating=min_rating,
     )
-
-    return students[:limit]
+    return students
 
 
 def get_active_job_openings(db: Session, category_id: int = -1):
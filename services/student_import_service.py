@@ -0,0 +1,319 @@
+import csv
+import io
+import time
+from dataclasses import dataclass, field
+from typing import BinaryIO, Iterator, Optional
+from fastapi import HTTPException
+from sqlalchemy import select
+from sqlalchemy.dialects.postgresql import insert
+from sqlalchemy.orm import Session
+
+from app.config.settings import settings
+from core.master_cache import master_registry
+from models.generated_models import InstitutionBranch, MasterDistrict, MasterGender, MasterState, StudentProfile
+
+FORMATS = ("csv", "xlsx")
+
+REQUIRED_COLUMNS = ("student_id", "student_name", "academic_year")
+
+# column -> max length in student_profile
+MAX_LENGTHS = {
+    "student_id": 150,
+    "student_name": 255,
+    "academic_year": 100,
+    "parent_mobile": 100,
+    "profile_image_url": 500,
+}
+
+
+@dataclass
+class ImportReport:
+    rows: int = 0
+    inserted: int = 0
+    duplicates: int = 0
+    invalid: int = 0
+    errors: list = field(default_factory=list)
+    errors_omitted: int = 0
+    seconds: float = 0.0
+
+    def add_error(self, row: int, student_id: Optional[str], errors: list):
+        # the report is capped so a file that is wrong on every row stays small
+        if len(self.errors) < settings.STUDENT_IMPORT_MAX_ERRORS:
+            self.errors.append({"row": row, "student_id": student_id or None, "errors": errors})
+        else:
+            self.errors_omitted += 1
+
+    def as_dict(self) -> dict:
+        return {
+            "rows": self.rows,
+            "inserted": self.inserted,
+            "duplicates": self.duplicates,
+            "invalid": self.invalid,
+            "errors": self.errors,
+            "errors_omitted": self.errors_omitted,
+            "seconds": round(self.seconds, 3),
+        }
+
+
+# =====================================================
+# READERS
+# =====================================================
+
+
+def _column_name(header) -> str:
+    return "_".join(str(header or "").strip().lower().replace("-", " ").split())
+
+
+def _cell(value) -> str:
+    # spreadsheets hand back numbers for id-like columns; 1001.0 should read as "1001"
+    if value is None:
+        return ""
+    if isinstance(value, float) and value.is_integer():
+        return str(int(value))
+    return str(value).strip()
+
+
+def iter_csv_rows(fileobj: BinaryIO) -> Iterator[tuple]:
+    """Yields (row_number, {column: value}); row 1 is the header."""
+    reader = csv.reader(io.TextIOWrapper(fileobj, encoding="utf-8-sig", newline=""))
+    columns = [_column_name(h) for h in next(reader, [])]
+    for row_number, values in enumerate(reader, start=2):
+        if any(v.strip() for v in values):
+            yield row_number, {c: _cell(v) for c, v in zip(columns, values) if c}
+
+
+def iter_xlsx_rows(fileobj: BinaryIO) -> Iterator[tuple]:
+    """First worksheet, read row by row in openpyxl's read-only mode (optional dependency)."""
+    try:
+        from openpyxl import load_workbook
+    except ImportError:
+        raise HTTPException(status_code=400, detail="XLSX import needs the openpyxl package; upload CSV instead")
+
+    try:
+        workbook = load_workbook(fileobj, read_only=True, data_only=True)
+    except Exception:
+        raise HTTPException(status_code=400, detail="File is not a valid XLSX workbook")
+    try:
+        rows = workbook.worksheets[0].iter_rows(values_only=True)
+        columns = [_column_name(h) for h in next(rows, ())]
+        for row_number, values in enumerate(rows, start=2):
+            if any(v is not None and str(v).strip() for v in values):
+                yield row_number, {c: _cell(v) for c, v in zip(columns, values) if c}
+    finally:
+        workbook.close()
+
+
+def detect_format(filename: Optional[str]) -> str:
+    extension = (filename or "").rsplit(".", 1)[-1].lower()
+    if extension not in FORMATS:
+        raise HTTPException(status_code=400, detail=f"File must be one of: {', '.join(FORMATS)}")
+    return extension
+
+
+# =====================================================
+# VALIDATION
+# =====================================================
+
+
+class _Lookups:
+    """
+    Master data for one import, loaded once: branches from institution_branch,
+    gender/state/district from the in-process master cache. Values in the file
+    may be ids or names (branches: id or branch_code), matched case-insensitively.
+    Branch codes are only unique within an institution, so without
+    `institution_id` a code used by several institutions is ambiguous.
+    """
+
+    def __init__(self, db: Session, institution_id: Optional[int]):
+        query = select(
+            InstitutionBranch.id, InstitutionBranch.branch_code, InstitutionBranch.branch_name,
+            InstitutionBranch.institution_id
+        ).where(InstitutionBranch.is_active == True)
+        if institution_id:
+            query = query.where(InstitutionBranch.institution_id == institution_id)
+        branches = db.execute(query).all()
+        self.branches = {str(b.id): b for b in branches}
+        self.branch_codes = {}
+        self.ambiguous_codes = set()
+        for b in branches:
+            code = b.branch_code.lower()
+            other = self.branch_codes.setdefault(code, b)
+            if other.institution_id != b.institution_id:
+                self.ambiguous_codes.add(code)
+
+        self.genders = self._index(master_registry.get_rows(db, MasterGender, active_only=True), "gender_name")
+        self.states = self._index(master_registry.get_rows(db, MasterState, active_only=True), "state_name")
+        districts = master_registry.get_rows(db, MasterDistrict, active_only=True)
+        self.districts = {str(d["id"]): d for d in districts}
+        self.district_names = {(d["state_id"], d["district_name"].lower()): d for d in districts}
+
+    @staticmethod
+    def _index(rows: list, name_key: str) -> dict:
+        index = {str(row["id"]): row for row in rows}
+        index.update({row[name_key].lower(): row for row in rows})
+        return index
+
+    def branch(self, value: str):
+        if value in self.branches:
+            return self.branches[value]
+        if value.lower() in self.ambiguous_codes:
+            return None
+        return self.branch_codes.get(value.lower())
+
+    def district(self, value: str, state_id: Optional[int]):
+        if value.isdigit():
+            return self.districts.get(value)
+        if state_id is None:
+            return None
+        return self.district_names.get((state_id, value.lower()))
+
+
+def validate_row(raw: dict, lookups: _Lookups, default_branch_id: Optional[int]):
+    """Returns (values for student_profile, list of error messages)."""
+    errors = []
+    record = {}
+
+    for column in REQUIRED_COLUMNS:
+        if not raw.get(column):
+            errors.append(f"{column} is required")
+    for column, limit in MAX_LENGTHS.items():
+        value = raw.get(column) or None
+        if value and len(value) > limit:
+            errors.append(f"{column} is longer than {limit} characters")
+        record[column] = value
+
+    branch_value = raw.get("branch_id") or raw.get("branch_code") or (str(default_branch_id) if default_branch_id else "")
+    branch = lookups.branch(branch_value) if branch_value else None
+    if not branch_value:
+        errors.append("branch_id or branch_code is required")
+    elif branch is None and branch_value.lower() in lookups.ambiguous_codes:
+        errors.append(f"branch_code '{branch_value}' is used by several institutions; give institution_id or branch_id")
+    elif branch is None:
+        errors.append(f"unknown or inactive branch '{branch_value}'")
+    else:
+        record["branch_id"] = branch.id
+        record["branch_name"] = branch.branch_name
+
+    record["gender_id"] = record["state_id"] = record["district_id"] = None
+    if raw.get("gender"):
+        gender = lookups.genders.get(raw["gender"].lower())
+        if gender is None:
+            errors.append(f"unknown gender '{raw['gender']}'")
+        else:
+            record["gender_id"] = gender["id"]
+    if raw.get("state"):
+        state = lookups.states.get(raw["state"].lower())
+        if state is None:
+            errors.append(f"unknown state '{raw['state']}'")
+        else:
+            record["state_id"] = state["id"]
+    if raw.get("district"):
+        district = lookups.district(raw["district"], record["state_id"])
+        if district is None:
+            errors.append(f"unknown district '{raw['district']}'" + ("" if record["state_id"] else " (give the state to match by name)"))
+        elif record["state_id"] and district["state_id"] != record["state_id"]:
+            errors.append(f"district '{raw['district']}' is not in state '{raw['state']}'")
+        else:
+            record["district_id"] = district["id"]
+            record["state_id"] = record["state_id"] or district["state_id"]
+
+    return record, errors
+
+
+# =====================================================
+# IMPORT
+# =====================================================
+
+
+def _insert_batch(db: Session, records: list, dry_run: bool) -> set:
+    """Writes the batch and returns the student_ids that were new."""
+    student_ids = [r["student_id"] for r in records]
+    if dry_run:
+        existing = db.execute(
+            select(StudentProfile.student_id).where(StudentProfile.student_id.in_(student_ids))
+        ).scalars().all()
+        return set(student_ids) - set(existing)
+
+    # one multi-row INSERT per page of rows (SQLAlchemy insertmanyvalues); rows whose
+    # student_id already exists are left as they are, like create_student_profile
+    inserted = db.execute(
+        insert(StudentProfile)
+        .on_conflict_do_nothing(index_elements=[StudentProfile.student_id])
+        .returning(StudentProfile.student_id),
+        records
+    ).scalars().all()
+    db.commit()
+    return set(inserted)
+
+
+def import_students(
+    db: Session,
+    fileobj: BinaryIO,
+    filename: Optional[str],
+    institution_id: Optional[int] = None,
+    branch_id: Optional[int] = None,
+    created_by: Optional[int] = None,
+    dry_run: bool = False,
+    batch_size: Optional[int] = None
+) -> ImportReport:
+    """
+    Stream a CSV/XLSX roster into student_profile.
+
+    Rows are read one at a time, validated against the master data and
+    buffered until `batch_size` valid rows are pending; each batch is one
+    INSERT ... ON CONFLICT (student_id) DO NOTHING and its own transaction, so
+    memory stays at one batch (plus the student_ids seen so far) whatever the
+    file size and a failure part way keeps the batches already written. Invalid
+    rows, student_ids repeated anywhere in the file and students that already
+    exist are listed in the report with their row number.
+
+    `branch_id` is used for rows without a branch column; `institution_id`
+    restricts the branches rows may name. With `dry_run` nothing is written.
+    """
+    batch_size = batch_size or settings.STUDENT_IMPORT_BATCH_SIZE
+    rows = iter_xlsx_rows(fileobj) if detect_format(filename) == "xlsx" else iter_csv_rows(fileobj)
+    lookups = _Lookups(db, institution_id)
+    if branch_id and lookups.branch(str(branch_id)) is None:
+        raise HTTPException(status_code=404, detail="Branch not found")
+
+    report = ImportReport()
+    start = time.perf_counter()
+    pending = {}  # student_id -> (row_number, record)
+    seen = {}  # student_id -> first row_number, across the whole file
+
+    def flush():
+        if not pending:
+            return
+        inserted = _insert_batch(db, [record for _, record in pending.values()], dry_run)
+        report.inserted += len(inserted)
+        for student_id, (row_number, _) in pending.items():
+            if student_id not in inserted:
+                report.duplicates += 1
+                report.add_error(row_number, student_id, ["student_id already exists"])
+        pending.clear()
+
+    try:
+        for row_number, raw in rows:
+            report.rows += 1
+            record, errors = validate_row(raw, lookups, branch_id)
+            student_id = record["student_id"]
+            if not errors and student_id in seen:
+                report.duplicates += 1
+                report.add_error(row_number, student_id, [f"student_id repeats row {seen[student_id]}"])
+                continue
+            if errors:
+                report.invalid += 1
+                report.add_error(row_number, student_id, errors)
+                continue
+            record["created_by"] = created_by
+            seen[student_id] = row_number
+            pending[student_id] = (row_number, record)
+            if len(pending) >= batch_size:
+                flush()
+        flush()
+    except (csv.Error, UnicodeDecodeError) as e:
+        db.rollback()
+        raise HTTPException(status_code=400, detail=f"Could not read the file after {report.rows} rows: {e}")
+
+    report.seconds = time.perf_counter() - start
+    return report
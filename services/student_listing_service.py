@@ -0,0 +1,156 @@
+from typing import Optional
+from fastapi import HTTPException
+from sqlalchemy import text
+from sqlalchemy.exc import DataError
+from sqlalchemy.orm import Session
+
+from core.pagination import decode_cursor, encode_cursor
+
+# sort_by -> ((key expression, SQL type), ...), all DESC. Keys are COALESCEd the
+# same way the old Python sorts treated NULLs, so every key is non-null and a
+# plain row comparison works as the keyset predicate. user_id breaks ties.
+SORTS = {
+    "rating": (
+        ("COALESCE(rating, 0)", "numeric"),
+        ("COALESCE(attendance_percentage, 0)", "numeric"),
+    ),
+    "attendance": (
+        ("COALESCE(attendance_percentage, 0)", "numeric"),
+        ("COALESCE(rating, 0)", "numeric"),
+    ),
+    "joined_date": (
+        ("COALESCE(joined_date, '-infinity'::timestamp)", "timestamp"),
+    ),
+}
+SORTS["both"] = SORTS["rating"]
+DEFAULT_SORT = "joined_date"
+
+# vw_students_get_list returns one row per student x certificate x degree; the
+# page is picked from one row per student, and only the students on the page
+# get their education and certificates aggregated. The view's definition lives
+# in the database, not in this repo, so it stays opaque here: every call still
+# reads and de-duplicates the whole (filtered) view and sorts it before the
+# LIMIT. Only the json_agg work is bounded by the page size.
+_LIST_SQL = """
+    WITH students AS (
+        SELECT DISTINCT ON (user_id)
+            user_id, student_name, joined_date, skill_id, skill,
+            attendance_percentage, aggregate, internship_status, rating
+        FROM vw_students_get_list
+        WHERE (CAST(:skill_id AS integer) IS NULL OR skill_id = :skill_id)
+          AND (CAST(:aggregate AS text) IS NULL OR aggregate = :aggregate)
+          AND (CAST(:internship_status AS text) IS NULL OR internship_status = :internship_status)
+        ORDER BY user_id
+    ),
+    page AS (
+        SELECT students.*, {sort_keys}
+        FROM students
+        WHERE (CAST(:min_attendance AS numeric) IS NULL OR attendance_percentage >= :min_attendance)
+          AND (CAST(:min_rating AS numeric) IS NULL OR rating >= :min_rating)
+          {keyset}
+        ORDER BY {order_by}
+        LIMIT :limit
+    )
+    SELECT
+        page.*,
+        COALESCE(edu.education, '[]'::json) AS education,
+        COALESCE(cert.certificates, '[]'::json) AS certificates
+    FROM page
+    LEFT JOIN LATERAL (
+        SELECT json_agg(json_build_object(
+            'degree', q.degree,
+            'institute', q.institute,
+            'percentage', q.percentage
+        ) ORDER BY q.id) AS education
+        FROM (
+            SELECT DISTINCT ON (degree, institute, percentage) id, degree, institute, percentage
+            FROM student_qualification
+            WHERE user_id = page.user_id AND is_active = TRUE
+            ORDER BY degree, institute, percentage, id
+        ) q
+    ) edu ON TRUE
+    LEFT JOIN LATERAL (
+        SELECT json_agg(json_build_object(
+            'id', c.id,
+            'certificate_name', c.certificate_name,
+            'issued_by', c.issued_by,
+            'year', c.year,
+            'upload_certificate', c.upload_certificate,
+            'is_active', c.is_active
+        ) ORDER BY c.id) AS certificates
+        FROM (
+            SELECT DISTINCT ON (certificate_name, issued_by, year, upload_certificate)
+                id, certificate_name, issued_by, year, upload_certificate, is_active
+            FROM student_certificate
+            WHERE user_id = page.user_id AND is_active = TRUE
+            ORDER BY certificate_name, issued_by, year, upload_certificate, id
+        ) c
+    ) cert ON TRUE
+    ORDER BY {order_by}
+"""
+
+
+def list_students(
+    db: Session,
+    limit: int,
+    cursor: Optional[str] = None,
+    sort_by: Optional[str] = None,
+    skill_id: Optional[int] = None,
+    aggregate: Optional[str] = None,
+    internship_status: Optional[str] = None,
+    min_attendance: Optional[float] = None,
+    min_rating: Optional[float] = None,
+):
+    """
+    One page of the student list with education and certificates, in one query.
+
+    Returns (students, next_cursor). Keyset pagination on the sort keys plus
+    user_id. A top-N request aggregates education and certificates for N
+    students only, but the view itself is still scanned and sorted in full.
+    """
+    keys = SORTS.get(sort_by or DEFAULT_SORT)
+    if keys is None:
+        raise HTTPException(status_code=400, detail=f"sort_by must be one of {sorted(SORTS)}")
+    keys = keys + (("user_id", "bigint"),)
+
+    params = {
+        "skill_id": skill_id,
+        "aggregate": aggregate,
+        "internship_status": internship_status,
+        "min_attendance": min_attendance,
+        "min_rating": min_rating,
+        "limit": limit + 1,
+    }
+
+    keyset = ""
+    if cursor:
+        values = decode_cursor(cursor)
+        if not isinstance(values, list) or len(values) != len(keys):
+            raise HTTPException(status_code=400, detail="Invalid cursor")
+        placeholders = []
+        for i, ((_, sql_type), value) in enumerate(zip(keys, values)):
+            params[f"cursor_{i}"] = str(value)
+            placeholders.append(f"CAST(:cursor_{i} AS {sql_type})")
+        keyset = f"AND ({', '.join(expr for expr, _ in keys)}) < ({', '.join(placeholders)})"
+
+    sql = _LIST_SQL.format(
+        # keys are returned as text so the cursor round-trips exactly (numeric, -infinity)
+        sort_keys=", ".join(f"CAST({expr} AS text) AS sort_{i}" for i, (expr, _) in enumerate(keys)),
+        keyset=keyset,
+        order_by=", ".join(f"{expr} DESC" for expr, _ in keys),
+    )
+    try:
+        rows = db.execute(text(sql), params).mappings().all()
+    except DataError:
+        # a tampered cursor value fails the CAST
+        db.rollback()
+        if cursor:
+            raise HTTPException(status_code=400, detail="Invalid cursor")
+        raise
+
+    next_cursor = None
+    if len(rows) > limit:
+        rows = rows[:limit]
+        next_cursor = encode_cursor(*(rows[-1][f"sort_{i}"] for i in range(len(keys))))
+    students = [{k: v for k, v in row.items() if not k.startswith("sort_")} for row in rows]
+    return students, next_cursor
@@ -1,4 +1,5 @@
 from sqlalchemy.orm import Session
+from core.pagination import PageParams, paginate
 from typing import Optional
 from datetime import datetime
 from fastapi import HTTPException,status
@@ -46,10 +47,11 @@ def get_product_registration_by_id(db: Session,product_id: int):
 
     return product
 
-def get_all_product_registrations(db: Session):
-    return db.query(ProductRegistration).filter(
+def get_all_product_registrations(db: Session, page: PageParams):
+    query = db.query(ProductRegistration).filter(
         ProductRegistration.is_active == True
-    ).all()
+    )
+    return paginate(query, ProductRegistration, page)
 
 def update_product_registration(db: Session,product_id: int,payload: ProductRegistrationUpdate):
     product = get_product_registration_by_id(db, product_id)
@@ -0,0 +1,163 @@
+# services/text_search_service.py
+
+from fastapi import HTTPException
+from sqlalchemy import func, select, text
+from sqlalchemy.orm import Session
+
+from app.config.settings import settings
+
+# must match the config of the generated search_vector columns (migrations/008)
+TS_CONFIG = "english"
+
+MIN_QUERY_CHARS = 2
+
+
+def _prepare(db: Session, q: str) -> str:
+    q = " ".join((q or "").split())
+    if len(q) < MIN_QUERY_CHARS:
+        raise HTTPException(status_code=400, detail=f"q must be at least {MIN_QUERY_CHARS} characters")
+    # SET LOCAL equivalents: only last for the current transaction
+    threshold = str(settings.SEARCH_TRGM_THRESHOLD)
+    db.execute(select(func.set_config("pg_trgm.similarity_threshold", threshold, True)))
+    db.execute(select(func.set_config("pg_trgm.word_similarity_threshold", threshold, True)))
+    return q
+
+
+# Each branch of the UNION is answered by its own GIN index (tsvector or
+# trigram); a single OR across the join would force a scan of job_openings.
+_JOB_MATCHES = f"""
+    query AS (
+        SELECT websearch_to_tsquery('{TS_CONFIG}', :q) AS tsq
+    ),
+    matches AS (
+        SELECT jo.id
+        FROM job_openings jo, query
+        WHERE jo.search_vector @@ query.tsq
+           OR jo.company_name % :q
+           OR :q <% jo.company_address
+        UNION
+        SELECT jo.id
+        FROM master_job mj
+        JOIN job_openings jo ON jo.job_id = mj.id, query
+        WHERE mj.search_vector @@ query.tsq
+           OR mj.job_name % :q
+    )
+"""
+
+_JOB_RANK = """
+    ts_rank_cd(jo.search_vector, query.tsq)
+    + coalesce(ts_rank_cd(mj.search_vector, query.tsq), 0) * 2
+    + greatest(
+        similarity(jo.company_name, :q),
+        similarity(coalesce(mj.job_name, ''), :q),
+        word_similarity(:q, jo.company_address)
+    )
+"""
+
+
+def search_job_openings(db: Session, q: str, limit: int = 20, offset: int = 0):
+    """
+    Ranked keyword search over job titles, company names, role text and
+    locations. Full-text matches rank first (job title weighted highest);
+    trigram similarity catches misspellings.
+
+    Returns (rows, total).
+    """
+    params = {"q": _prepare(db, q), "limit": limit, "offset": offset}
+    rows = db.execute(text(f"""
+        WITH {_JOB_MATCHES}
+        SELECT
+            jo.id,
+            jo.job_id,
+            mj.job_name AS job_title,
+            jo.company_name,
+            jo.company_address AS location,
+            jo.role_description,
+            jo.sub_module_id,
+            jo.category_id,
+            jo.location_type_id,
+            jo.work_type_id,
+            jo.created_date,
+            {_JOB_RANK} AS rank,
+            COUNT(*) OVER () AS total_count
+        FROM matches
+        JOIN job_openings jo ON jo.id = matches.id
+        LEFT JOIN master_job mj ON mj.id = jo.job_id
+        CROSS JOIN query
+        WHERE jo.is_active = TRUE
+        ORDER BY rank DESC, jo.id DESC
+        LIMIT :limit OFFSET :offset
+    """), params).mappings().all()
+    return _split_total(rows)
+
+
+def search_companies(db: Session, q: str, limit: int = 20, offset: int = 0):
+    """
+    Companies (grouped from active job_openings, as in company_summary)
+    whose name, location or open roles match `q`, best match first.
+
+    Returns (rows, total).
+    """
+    params = {"q": _prepare(db, q), "limit": limit, "offset": offset}
+    rows = db.execute(text(f"""
+        WITH {_JOB_MATCHES}
+        SELECT
+            jo.company_name,
+            jo.company_address AS location,
+            COUNT(*) FILTER (WHERE jo.sub_module_id = 1) AS jobs_count,
+            COUNT(*) FILTER (WHERE jo.sub_module_id = 2) AS internships_count,
+            MAX(jo.created_date) AS last_active_time,
+            MAX({_JOB_RANK}) AS rank,
+            COUNT(*) OVER () AS total_count
+        FROM matches
+        JOIN job_openings jo ON jo.id = matches.id
+        LEFT JOIN master_job mj ON mj.id = jo.job_id
+        CROSS JOIN query
+        WHERE jo.is_active = TRUE
+        GROUP BY jo.company_name, jo.company_address
+        ORDER BY rank DESC, last_active_time DESC NULLS LAST
+        LIMIT :limit OFFSET :offset
+    """), params).mappings().all()
+    return _split_total(rows)
+
+
+def search_property_sell_listings(db: Session, q: str, limit: int = 20, offset: int = 0):
+    """
+    Ranked keyword search over property locality and description, with
+    trigram matching on the locality for misspelled area names.
+
+    Returns (rows, total).
+    """
+    params = {"q": _prepare(db, q), "limit": limit, "offset": offset}
+    rows = db.execute(text(f"""
+        WITH query AS (
+            SELECT websearch_to_tsquery('{TS_CONFIG}', :q) AS tsq
+        )
+        SELECT
+            psl.id,
+            psl.module_id,
+            psl.sub_module_id,
+            psl.property_type_id,
+            psl.expected_price,
+            psl.monthly_rent,
+            psl.bhk_type_id,
+            psl.furnishing_id,
+            psl.locality_area,
+            psl.property_description,
+            psl.upload_photos,
+            psl.created_date,
+            ts_rank_cd(psl.search_vector, query.tsq)
+                + word_similarity(:q, coalesce(psl.locality_area, '')) AS rank,
+            COUNT(*) OVER () AS total_count
+        FROM property_sell_listing psl, query
+        WHERE psl.is_active = TRUE
+          AND (psl.search_vector @@ query.tsq OR :q <% psl.locality_area)
+        ORDER BY rank DESC, psl.id DESC
+        LIMIT :limit OFFSET :offset
+    """), params).mappings().all()
+    return _split_total(rows)
+
+
+def _split_total(rows):
+    total = rows[0]["total_count"] if rows else 0
+    return [{k: v for k, v in row.items() if k != "total_count"} for row in rows], total
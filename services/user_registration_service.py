@@ -856,8 +856,10 @@
 #     )
 
 
+import asyncio
 import uuid
 from datetime import date
+from sqlalchemy import func, select
 from sqlalchemy.orm import Session
 from fastapi import HTTPException, status
 
@@ -869,9 +871,10 @@ from models.generated_models import (
 )
 
 from schemas.user_schema import ForgotPasswordRequest, RegisterUser, LoginRequest, LoginResponse, ResetPasswordRequest
-from utils.hash_utils import hash_password, verify_password
+from utils.hash_utils import hash_password, verify_and_rehash_async
 from utils.jwt_utils import create_access_token, create_refresh_token
-from datetime import datetime, timedelta
+from core.auth_cache import invalidate_principal
+from services.otp_service import check_rate_limit, issue_reset_token, consume_reset_token
 
 from core.constants import (
     CUSTOMER_ROLE_ID,
@@ -881,6 +884,8 @@ from core.constants import (
     STATUS_PENDING
 )
 
+RESET_TOKEN_TTL_SECONDS = 900
+
 
 def calculate_age(dob: date | None) -> int | None:
     if not dob:
@@ -994,24 +999,50 @@ def register_user(db: Session, payload: RegisterUser):
         "refresh_expires_in": 86400
     }
 
-def login_user(db: Session, payload: LoginRequest) -> LoginResponse:
+def _find_login_user(db: Session, identifier: str):
+    # Email and mobile each have their own unique index; filtering on one of
+    # them (instead of email OR mobile) keeps the lookup to a single index probe.
+    lookup = (
+        UserRegistration.email == identifier if "@" in identifier
+        else UserRegistration.mobile == identifier
+    )
 
-    user = db.query(UserRegistration).filter(
-        (UserRegistration.email == payload.email_or_phone) |
-        (UserRegistration.mobile == payload.email_or_phone),
+    service_ids_sq = (
+        select(func.array_agg(UserServices.module_id))
+        .where(UserServices.user_id == UserRegistration.id)
+        .correlate(UserRegistration)
+        .scalar_subquery()
+    )
+    skill_ids_sq = (
+        select(func.array_agg(UserSkill.skill_id))
+        .where(UserSkill.user_id == UserRegistration.id)
+        .correlate(UserRegistration)
+        .scalar_subquery()
+    )
+
+    return db.query(
+        UserRegistration,
+        service_ids_sq.label("service_ids"),
+        skill_ids_sq.label("skill_ids")
+    ).filter(
+        lookup,
         UserRegistration.status_id == STATUS_APPROVED
     ).first()
 
-    if not user or not verify_password(payload.password, user.password):
-        raise HTTPException(status.HTTP_401_UNAUTHORIZED, "Invalid credentials")
 
-    service_ids = [
-        s.module_id for s in db.query(UserServices).filter_by(user_id=user.id)
-    ]
+async def login_user(db: Session, payload: LoginRequest) -> LoginResponse:
+    # DB work runs on a worker thread; the password check is awaited on the hashing pool
+    row = await asyncio.to_thread(_find_login_user, db, payload.email_or_phone)
 
-    skill_ids = [
-        s.skill_id for s in db.query(UserSkill).filter_by(user_id=user.id)
-    ]
+    user, service_ids, skill_ids = row if row else (None, None, None)
+
+    is_valid, new_hash = await verify_and_rehash_async(payload.password, user.password) if user else (False, None)
+    if not is_valid:
+        raise HTTPException(status.HTTP_401_UNAUTHORIZED, "Invalid credentials")
+
+    if new_hash:
+        user.password = new_hash
+        await asyncio.to_thread(db.commit)
 
     role = (
         "customer" if user.role_id == CUSTOMER_ROLE_ID
@@ -1029,8 +1060,8 @@ def login_user(db: Session, payload: LoginRequest) -> LoginResponse:
         message=f"User logged in as {role}",
         user_id=user.id,
         email_or_phone=payload.email_or_phone,
-        service_ids=service_ids,
-        skill_ids=skill_ids,
+        service_ids=service_ids or [],
+        skill_ids=skill_ids or [],
         latitude=user.latitude,
         longitude=user.longitude,
         access_token=create_access_token(token_payload),
@@ -1043,6 +1074,8 @@ def login_user(db: Session, payload: LoginRequest) -> LoginResponse:
 
 def forgot_password_service(db: Session, payload: ForgotPasswordRequest):
 
+    check_rate_limit("forgot_password", payload.email_or_phone)
+
     user = db.query(UserRegistration).filter(
         (UserRegistration.email == payload.email_or_phone) |
         (UserRegistration.mobile == payload.email_or_phone)
@@ -1051,13 +1084,8 @@ def forgot_password_service(db: Session, payload: ForgotPasswordRequest):
     if not user:
         raise HTTPException(status_code=404, detail="User not found")
 
-    reset_token = str(uuid.uuid4())
-    reset_expiry = datetime.utcnow() + timedelta(minutes=15)
-
-    user.reset_token = reset_token
-    user.reset_token_expiry = reset_expiry
+    reset_token = issue_reset_token(user.id, RESET_TOKEN_TTL_SECONDS)
 
-    db.commit()
     return {
         "message": "Password reset token sent",
         "reset_token": reset_token,  
@@ -1067,19 +1095,19 @@ def forgot_password_service(db: Session, payload: ForgotPasswordRequest):
 
 def reset_password_service(db: Session, payload: ResetPasswordRequest):
 
-    user = db.query(UserRegistration).filter(
-        UserRegistration.reset_token == payload.reset_token,
-        UserRegistration.reset_token_expiry > datetime.utcnow()
-    ).first()
+    user_id = consume_reset_token(payload.reset_token)
+    user = (
+        db.query(UserRegistration).filter(UserRegistration.id == user_id).first()
+        if user_id is not None else None
+    )
 
     if not user:
         raise HTTPException(status_code=400, detail="Invalid or expired reset token")
 
     user.password = hash_password(payload.new_password)
-    user.reset_token = None
-    user.reset_token_expiry = None
 
     db.commit()
+    invalidate_principal(user.id)
 
     return {
         "message": "Password reset successful"
@@ -0,0 +1,217 @@
+import io
+import json
+import threading
+from typing import Optional
+import numpy as np
+from fastapi import HTTPException, status
+from sqlalchemy import func, select
+from sqlalchemy.orm import Session
+
+from app.config.settings import settings
+from models.generated_models import AiDocuments
+from utils.embedding_utils import EMBEDDING_DIM
+
+METRICS = ("cosine", "l2")
+
+COPY_COLUMNS = ("doc_id", "chunk_id", "content", "embedding", "language", "metadata")
+
+
+def _check_vector(vector) -> list:
+    if len(vector) != EMBEDDING_DIM:
+        raise HTTPException(
+            status_code=status.HTTP_400_BAD_REQUEST,
+            detail=f"Embedding must have {EMBEDDING_DIM} dimensions"
+        )
+    return [float(v) for v in vector]
+
+
+def vector_literal(vector) -> str:
+    """pgvector text form, used for COPY."""
+    return "[" + ",".join(repr(float(v)) for v in vector) + "]"
+
+
+# =====================================================
+# PGVECTOR SEARCH
+# =====================================================
+
+
+def _set_search_params(db: Session, ef_search: Optional[int], probes: Optional[int]):
+    # set_config(..., true) is SET LOCAL: it only lasts until the request's transaction ends
+    ef_search = ef_search or settings.VECTOR_HNSW_EF_SEARCH
+    probes = probes or settings.VECTOR_IVFFLAT_PROBES
+    db.execute(select(func.set_config("hnsw.ef_search", str(ef_search), True)))
+    db.execute(select(func.set_config("ivfflat.probes", str(probes), True)))
+
+
+def search_documents(
+    db: Session,
+    embedding,
+    k: int = 10,
+    metric: str = "cosine",
+    language: Optional[str] = None,
+    metadata: Optional[dict] = None,
+    ef_search: Optional[int] = None,
+    probes: Optional[int] = None
+) -> list:
+    """
+    Top-k nearest chunks by cosine or L2 distance.
+
+    `metadata` filters with JSONB containment (metadata @> filter). Filters are
+    applied during the index scan, so a very selective filter can return fewer
+    than k rows unless ef_search/probes is raised.
+    """
+    vector = _check_vector(embedding)
+    if metric not in METRICS:
+        raise HTTPException(status_code=400, detail=f"metric must be one of {METRICS}")
+
+    distance = (
+        AiDocuments.embedding.cosine_distance(vector) if metric == "cosine"
+        else AiDocuments.embedding.l2_distance(vector)
+    )
+
+    query = (
+        select(
+            AiDocuments.id,
+            AiDocuments.doc_id,
+            AiDocuments.chunk_id,
+            AiDocuments.content,
+            AiDocuments.language,
+            AiDocuments.metadata_.label("metadata"),
+            distance.label("distance")
+        )
+        .where(AiDocuments.is_active.isnot(False))
+        .order_by(distance)
+        .limit(k)
+    )
+    if language:
+        query = query.where(AiDocuments.language == language)
+    if metadata:
+        query = query.where(AiDocuments.metadata_.contains(metadata))
+
+    _set_search_params(db, ef_search, probes)
+    rows = db.execute(query).mappings().all()
+    return [dict(row) for row in rows]
+
+
+def copy_chunks(db: Session, rows, table: str = "ai_documents", columns=COPY_COLUMNS) -> int:
+    """
+    Bulk-load chunk rows with COPY.
+
+    Each row is a tuple in `columns` order (by default doc_id, chunk_id,
+    content, embedding, language, metadata). COPY does not upsert, so this is
+    for first loads and staging tables; the caller commits.
+    """
+    embedding_at = columns.index("embedding")
+    metadata_at = columns.index("metadata") if "metadata" in columns else None
+
+    buffer = io.StringIO()
+    count = 0
+    for row in rows:
+        fields = list(row)
+        fields[embedding_at] = vector_literal(_check_vector(fields[embedding_at]))
+        if metadata_at is not None and fields[metadata_at] is not None:
+            fields[metadata_at] = json.dumps(fields[metadata_at])
+        buffer.write("\t".join(_copy_escape(f) for f in fields) + "\n")
+        count += 1
+    buffer.seek(0)
+
+    raw = db.connection().connection
+    with raw.cursor() as cursor:
+        cursor.copy_expert(
+            f"COPY {table} ({', '.join(columns)}) FROM STDIN WITH (FORMAT text)",
+            buffer
+        )
+    return count
+
+
+def _copy_escape(value) -> str:
+    if value is None:
+        return "\\N"
+    return (
+        str(value)
+        .replace("\\", "\\\\")
+        .replace("\t", "\\t")
+        .replace("\n", "\\n")
+        .replace("\r", "\\r")
+    )
+
+
+# =====================================================
+# IN-PROCESS FALLBACK
+# =====================================================
+
+
+class NumpyVectorIndex:
+    """
+    Exact brute-force index with the same search semantics as search_documents.
+
+    Used for tests and environments without pgvector, and as ground truth when
+    measuring the recall of the approximate pgvector indexes.
+    """
+
+    def __init__(self, dim: int = EMBEDDING_DIM):
+        self.dim = dim
+        self._lock = threading.Lock()
+        self._vectors = np.empty((0, dim), dtype=np.float32)
+        self._norms = np.empty((0,), dtype=np.float32)
+        self._rows = []
+
+    def __len__(self):
+        return len(self._rows)
+
+    def add(self, rows: list, embeddings):
+        """`rows` are dicts (doc_id, chunk_id, content, language, metadata); one embedding per row."""
+        vectors = np.asarray(embeddings, dtype=np.float32).reshape(-1, self.dim)
+        with self._lock:
+            self._vectors = np.vstack([self._vectors, vectors])
+            self._norms = np.concatenate([self._norms, np.linalg.norm(vectors, axis=1)])
+            self._rows.extend(rows)
+
+    def _mask(self, language: Optional[str], metadata: Optional[dict]):
+        if not language and not metadata:
+            return None
+        keep = np.ones(len(self._rows), dtype=bool)
+        for i, row in enumerate(self._rows):
+            if language and row.get("language") != language:
+                keep[i] = False
+            elif metadata and not _contains(row.get("metadata") or {}, metadata):
+                keep[i] = False
+        return keep
+
+    def search(self, embedding, k: int = 10, metric: str = "cosine", language: Optional[str] = None, metadata: Optional[dict] = None) -> list:
+        query = np.asarray(embedding, dtype=np.float32)
+        with self._lock:
+            vectors, norms, rows = self._vectors, self._norms, self._rows
+        if not rows:
+            return []
+
+        if metric == "cosine":
+            denom = norms * (np.linalg.norm(query) or 1.0)
+            distances = 1.0 - (vectors @ query) / np.where(denom == 0, 1.0, denom)
+        else:
+            distances = np.linalg.norm(vectors - query, axis=1)
+
+        mask = self._mask(language, metadata)
+        if mask is not None:
+            distances = np.where(mask, distances, np.inf)
+
+        k = min(k, len(rows))
+        top = np.argpartition(distances, k - 1)[:k]
+        top = top[np.argsort(distances[top])]
+        return [
+            {**rows[i], "distance": float(distances[i])}
+            for i in top if np.isfinite(distances[i])
+        ]
+
+
+def _contains(document, fragment) -> bool:
+    """Python version of JSONB @> for dicts, lists and scalars."""
+    if isinstance(fragment, dict):
+        return isinstance(document, dict) and all(
+            key in document and _contains(document[key], value) for key, value in fragment.items()
+        )
+    if isinstance(fragment, list):
+        return isinstance(document, list) and all(
+            any(_contains(item, wanted) for item in document) for wanted in fragment
+        )
+    return document == fragment
@@ -5,7 +5,7 @@ from sqlalchemy.orm import Session
 from core.database import get_db
 from core.constants import FREELANCER_ROLE_ID, STATUS_APPROVED
 from utils.jwt_utils import verify_token
-from models.generated_models import UserRegistration
+from core.auth_cache import get_principal
 
 security = HTTPBearer()
 
@@ -26,13 +26,9 @@ def get_current_freelancer(credentials: HTTPAuthorizationCredentials = Depends(s
         )
 
     freelancer_id = int(freelancer_id)
-    freelancer = db.query(UserRegistration).filter(
-        UserRegistration.id == freelancer_id,
-        UserRegistration.role_id == FREELANCER_ROLE_ID,
-        UserRegistration.is_active == True
-    ).first()
+    freelancer = get_principal(db, freelancer_id)
 
-    if not freelancer:
+    if not freelancer or freelancer.role_id != FREELANCER_ROLE_ID or freelancer.is_active is not True:
         raise HTTPException(
             status_code=status.HTTP_401_UNAUTHORIZED,
             detail="Freelancer not found or inactive"
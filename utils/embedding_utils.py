@@ -0,0 +1,75 @@
+import hashlib
+import re
+import threading
+from abc import ABC, abstractmethod
+from typing import Optional
+import numpy as np
+from app.config.settings import settings
+
+EMBEDDING_DIM = 384
+
+_TOKEN_RE = re.compile(r"\w+", re.UNICODE)
+
+
+class Embedder(ABC):
+    """Turns a batch of texts into an (n, EMBEDDING_DIM) float32 array."""
+
+    dim = EMBEDDING_DIM
+
+    @abstractmethod
+    def embed(self, texts: list) -> np.ndarray:
+        ...
+
+
+class HashingEmbedder(Embedder):
+    """
+    Local, dependency-free embedder: signed feature hashing of word unigrams
+    and bigrams, L2-normalised. Deterministic across processes, so it works
+    for tests and for keyword-ish similarity without a model download.
+    """
+
+    def _features(self, text: str):
+        tokens = _TOKEN_RE.findall(text.lower())
+        yield from tokens
+        yield from (f"{a} {b}" for a, b in zip(tokens, tokens[1:]))
+
+    def embed(self, texts: list) -> np.ndarray:
+        out = np.zeros((len(texts), self.dim), dtype=np.float32)
+        for row, text in enumerate(texts):
+            for feature in self._features(text):
+                digest = hashlib.blake2b(feature.encode("utf-8"), digest_size=8).digest()
+                value = int.from_bytes(digest, "little")
+                out[row, value % self.dim] += 1.0 if (value >> 63) else -1.0
+        norms = np.linalg.norm(out, axis=1, keepdims=True)
+        return out / np.where(norms == 0, 1.0, norms)
+
+
+class SentenceTransformerEmbedder(Embedder):
+    """Runs a local sentence-transformers model (optional dependency)."""
+
+    def __init__(self, model_name: str):
+        from sentence_transformers import SentenceTransformer
+
+        self.model = SentenceTransformer(model_name)
+        self.dim = self.model.get_sentence_embedding_dimension()
+        if self.dim != EMBEDDING_DIM:
+            raise ValueError(f"{model_name} produces {self.dim}-dim vectors, ai_documents stores {EMBEDDING_DIM}")
+
+    def embed(self, texts: list) -> np.ndarray:
+        return self.model.encode(texts, batch_size=64, normalize_embeddings=True, convert_to_numpy=True).astype(np.float32)
+
+
+_embedder: Optional[Embedder] = None
+_embedder_lock = threading.Lock()
+
+
+def get_embedder() -> Embedder:
+    global _embedder
+    if _embedder is None:
+        with _embedder_lock:
+            if _embedder is None:
+                if settings.EMBEDDER == "sentence-transformers":
+                    _embedder = SentenceTransformerEmbedder(settings.EMBEDDING_MODEL)
+                else:
+                    _embedder = HashingEmbedder()
+    return _embedder
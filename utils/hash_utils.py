@@ -1,9 +1,69 @@
+import asyncio
+import threading
+from concurrent.futures import ThreadPoolExecutor
+from fastapi import HTTPException, status
 from passlib.context import CryptContext
+from app.config.settings import settings
+
+# New hashes use PASSWORD_HASH_SCHEME; every other scheme is deprecated so that
+# verify_and_rehash() upgrades legacy sha256_crypt hashes on the next login.
+_SCHEMES = ["argon2", "bcrypt", "sha256_crypt"]
+_default_scheme = settings.PASSWORD_HASH_SCHEME
+_password_context = CryptContext(
+    schemes=[_default_scheme] + [s for s in _SCHEMES if s != _default_scheme],
+    deprecated=[s for s in _SCHEMES if s != _default_scheme],
+    argon2__time_cost=settings.ARGON2_TIME_COST,
+    argon2__memory_cost=settings.ARGON2_MEMORY_COST,
+    argon2__parallelism=settings.ARGON2_PARALLELISM,
+    bcrypt__rounds=settings.BCRYPT_ROUNDS,
+)
+
+# Hashing is CPU bound, so async callers (the login routes) hand it to its own
+# small pool and await it instead of occupying a request thread. Admission is
+# capped at workers + queue: beyond that a login storm gets a fast 503.
+# Sync callers (registration, password changes) are already on a threadpool
+# thread, so they hash in place under the same cap rather than parking that
+# thread on another pool.
+_hash_executor = ThreadPoolExecutor(max_workers=settings.PASSWORD_HASH_WORKERS, thread_name_prefix="password-hash")
+_hash_slots = threading.BoundedSemaphore(settings.PASSWORD_HASH_WORKERS + settings.PASSWORD_HASH_QUEUE)
+
+
+def _overloaded():
+    return HTTPException(
+        status_code=status.HTTP_503_SERVICE_UNAVAILABLE,
+        detail="Too many sign-in attempts right now, please retry"
+    )
+
+
+def _run_hashing(fn, *args):
+    if not _hash_slots.acquire(timeout=settings.PASSWORD_HASH_WAIT_SECONDS):
+        raise _overloaded()
+    try:
+        return fn(*args)
+    finally:
+        _hash_slots.release()
+
+
+async def _run_hashing_async(fn, *args):
+    # never block the event loop waiting for a slot
+    if not _hash_slots.acquire(blocking=False):
+        raise _overloaded()
+    try:
+        return await asyncio.get_running_loop().run_in_executor(_hash_executor, fn, *args)
+    finally:
+        _hash_slots.release()
 
-_password_context = CryptContext(schemes=["sha256_crypt"],deprecated="auto",)
 
 def hash_password(password: str) -> str:
-    return _password_context.hash(password)
+    return _run_hashing(_password_context.hash, password)
 
 def verify_password(plain_password: str, hashed_password: str) -> bool:
-    return _password_context.verify(plain_password, hashed_password)
+    return _run_hashing(_password_context.verify, plain_password, hashed_password)
+
+def verify_and_rehash(plain_password: str, hashed_password: str):
+    """Returns (is_valid, new_hash); new_hash is set when the stored hash should be replaced."""
+    return _run_hashing(_password_context.verify_and_update, plain_password, hashed_password)
+
+async def verify_and_rehash_async(plain_password: str, hashed_password: str):
+    """verify_and_rehash for async routes: runs on the hashing pool and is awaited."""
+    return await _run_hashing_async(_password_context.verify_and_update, plain_password, hashed_password)
@@ -1,7 +1,9 @@
+import time
 from datetime import datetime, timedelta, timezone
 from jose import jwt, JWTError, ExpiredSignatureError
 from fastapi import HTTPException,Request
 from app.config.settings import settings
+from utils.ttl_cache import TTLCache
 
 SECRET_KEY = settings.JWT_SECRET
 ALGORITHM = settings.JWT_ALGORITHM
@@ -10,6 +12,10 @@ REFRESH_EXPIRE_DAYS = settings.REFRESH_EXPIRE_DAYS
 
 RESET_EXPIRE_MINUTES = 15 
 
+TOKEN_CACHE_TTL_SECONDS = settings.AUTH_TOKEN_CACHE_TTL_SECONDS
+# verified claims by raw token, so repeat calls skip the signature check
+_claims_cache = TTLCache(maxsize=settings.AUTH_TOKEN_CACHE_SIZE, ttl=TOKEN_CACHE_TTL_SECONDS)
+
 def create_access_token(subject: dict) -> str:
     now = datetime.now(timezone.utc)
     expire = now + timedelta(minutes=ACCESS_EXPIRE_MINUTES)
@@ -50,25 +56,23 @@ def create_reset_token(subject: dict, expires_minutes: int = RESET_EXPIRE_MINUTE
     return jwt.encode(payload, SECRET_KEY, algorithm=ALGORITHM)
 
 def verify_token(token: str) -> dict:
-    print("\n========== VERIFY TOKEN CALLED ==========")
-    print("TOKEN RECEIVED:", token)
-    print("TOKEN LENGTH:", len(token))
-    print("USING SECRET_KEY:", SECRET_KEY)
+    payload = _claims_cache.get(token)
+    if payload is not None:
+        return dict(payload)
 
     try:
         payload = jwt.decode(token, SECRET_KEY, algorithms=[ALGORITHM])
-        print("DECODE SUCCESS PAYLOAD:", payload)
-        return payload
-
-    except ExpiredSignatureError as e:
-        print("ERROR TYPE: ExpiredSignatureError")
-        print("ERROR MESSAGE:", str(e))
+    except ExpiredSignatureError:
         raise HTTPException(status_code=440, detail="Session expired. Please login again.")
-
-    except JWTError as e:
-        print("ERROR TYPE:", type(e).__name__)
-        print("ERROR MESSAGE:", str(e))
+    except JWTError:
         raise HTTPException(status_code=401, detail="Invalid token")
+
+    # never keep a token in the cache past its own expiry
+    ttl = TOKEN_CACHE_TTL_SECONDS
+    if payload.get("exp") is not None:
+        ttl = min(ttl, payload["exp"] - time.time())
+    _claims_cache.set(token, payload, ttl)
+    return dict(payload)
     
 def is_admin_already_logged_in(request: Request):
     from core.constants import ADMIN_ROLE_ID 
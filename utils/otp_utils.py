@@ -1,4 +1,4 @@
-import random
+import secrets
 
 def generate_otp(length: int = 6) -> str:
-    return "".join(str(random.randint(0, 9)) for _ in range(length))
+    return "".join(str(secrets.randbelow(10)) for _ in range(length))
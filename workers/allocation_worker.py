@@ -0,0 +1,139 @@
+"""
+Background auto-allocation of pending home-service bookings.
+
+Each round claims up to --batch-size pending bookings (oldest preferred date and
+time slot first), matches them to freelancers as one batch and writes every
+assignment in a single transaction. Several workers can run at once; SKIP
+LOCKED keeps them on disjoint bookings.
+
+Metrics are printed after every round that did work and, when --metrics-port
+is set, served as JSON on http://0.0.0.0:<port>/metrics:
+  bookings_per_second       allocations / busy time, since start
+  queue_depth               pending unassigned bookings after the last round
+  avg_wait_to_assign_s      booking created -> assigned, since start
+
+Usage:
+    python -m workers.allocation_worker --interval 5 --batch-size 200 --metrics-port 9105
+    python -m workers.allocation_worker --once
+"""
+import argparse
+import json
+import threading
+import time
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+
+from app.config.settings import settings
+from core.database import SessionLocal
+from services.batch_allocation_service import count_pending, run_allocation_round
+
+
+class WorkerMetrics:
+    def __init__(self):
+        self._lock = threading.Lock()
+        self.started_at = time.time()
+        self.rounds = 0
+        self.claimed = 0
+        self.allocated = 0
+        self.busy_seconds = 0.0
+        self.wait_total_seconds = 0.0
+        self.wait_samples = 0
+        self.queue_depth = None
+        self.last_round = None
+
+    def record(self, result: dict, elapsed: float, queue_depth: int):
+        with self._lock:
+            self.rounds += 1
+            self.claimed += result["claimed"]
+            self.allocated += len(result["allocated"])
+            self.busy_seconds += elapsed
+            self.wait_total_seconds += sum(result["wait_seconds"])
+            self.wait_samples += len(result["wait_seconds"])
+            self.queue_depth = queue_depth
+            self.last_round = {
+                "claimed": result["claimed"],
+                "allocated": len(result["allocated"]),
+                "seconds": round(elapsed, 3),
+            }
+
+    def snapshot(self) -> dict:
+        with self._lock:
+            return {
+                "uptime_s": round(time.time() - self.started_at, 1),
+                "rounds": self.rounds,
+                "claimed": self.claimed,
+                "allocated": self.allocated,
+                "bookings_per_second": round(self.allocated / self.busy_seconds, 2) if self.busy_seconds else 0.0,
+                "queue_depth": self.queue_depth,
+                "avg_wait_to_assign_s": round(self.wait_total_seconds / self.wait_samples, 1) if self.wait_samples else None,
+                "last_round": self.last_round,
+            }
+
+
+def serve_metrics(metrics: WorkerMetrics, port: int):
+    class Handler(BaseHTTPRequestHandler):
+        def do_GET(self):
+            if self.path != "/metrics":
+                self.send_response(404)
+                self.end_headers()
+                return
+            body = json.dumps(metrics.snapshot()).encode()
+            self.send_response(200)
+            self.send_header("Content-Type", "application/json")
+            self.send_header("Content-Length", str(len(body)))
+            self.end_headers()
+            self.wfile.write(body)
+
+        def log_message(self, format, *args):
+            pass
+
+    server = ThreadingHTTPServer(("0.0.0.0", port), Handler)
+    threading.Thread(target=server.serve_forever, name="allocation-metrics", daemon=True).start()
+    return server
+
+
+def run_round(metrics: WorkerMetrics, batch_size: int) -> dict:
+    db = SessionLocal()
+    try:
+        start = time.perf_counter()
+        result = run_allocation_round(db, batch_size)
+        elapsed = time.perf_counter() - start
+        queue_depth = count_pending(db)
+    except Exception:
+        db.rollback()
+        raise
+    finally:
+        db.close()
+    metrics.record(result, elapsed, queue_depth)
+    return result
+
+
+def main():
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--interval", type=float, default=settings.ALLOCATION_WORKER_INTERVAL_SECONDS)
+    parser.add_argument("--batch-size", type=int, default=settings.ALLOCATION_BATCH_MAX)
+    parser.add_argument("--metrics-port", type=int, default=settings.ALLOCATION_WORKER_METRICS_PORT)
+    parser.add_argument("--once", action="store_true", help="run a single round and exit")
+    args = parser.parse_args()
+
+    metrics = WorkerMetrics()
+    if args.metrics_port:
+        serve_metrics(metrics, args.metrics_port)
+
+    while True:
+        try:
+            result = run_round(metrics, args.batch_size)
+            if result["claimed"]:
+                print("allocation round:", json.dumps(metrics.snapshot()))
+        except Exception as e:
+            print("ALLOCATION ROUND FAILED:", repr(e))
+            result = {"claimed": 0}
+
+        if args.once:
+            break
+        # a full batch means there is likely more waiting, so go again straight away
+        if result["claimed"] < args.batch_size:
+            time.sleep(args.interval)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,81 @@
+"""
+Bulk ingestion of documents into ai_documents.
+
+Input is either a JSONL file (one {"doc_id", "content", "language",
+"metadata"} object per line) or a directory, in which case every *.txt / *.md
+file becomes one document keyed by its relative path. Documents are streamed,
+chunked, embedded in batches and upserted by (doc_id, chunk_id); chunks whose
+content hash is unchanged are not re-embedded, so re-runs are cheap.
+
+Usage:
+    python -m workers.ingest_documents --jsonl docs.jsonl --batch-chunks 256
+    python -m workers.ingest_documents --dir ./kb --language en
+"""
+import argparse
+import json
+from pathlib import Path
+
+from core.database import SessionLocal
+from services.document_ingestion_service import DEFAULT_BATCH_CHUNKS, DEFAULT_CHUNK_CHARS, DEFAULT_OVERLAP_CHARS, SourceDocument, ingest_documents
+
+TEXT_SUFFIXES = (".txt", ".md")
+
+
+def read_jsonl(path: str):
+    with open(path, encoding="utf-8") as handle:
+        for line in handle:
+            if not line.strip():
+                continue
+            record = json.loads(line)
+            yield SourceDocument(
+                doc_id=str(record["doc_id"]),
+                content=record["content"],
+                language=record.get("language"),
+                metadata=record.get("metadata")
+            )
+
+
+def read_directory(root: str, language: str = None):
+    base = Path(root)
+    for path in sorted(base.rglob("*")):
+        if path.is_file() and path.suffix.lower() in TEXT_SUFFIXES:
+            yield SourceDocument(
+                doc_id=path.relative_to(base).as_posix(),
+                content=path.read_text(encoding="utf-8", errors="replace"),
+                language=language,
+                metadata={"source": path.name}
+            )
+
+
+def main():
+    parser = argparse.ArgumentParser()
+    source = parser.add_mutually_exclusive_group(required=True)
+    source.add_argument("--jsonl")
+    source.add_argument("--dir")
+    parser.add_argument("--language", help="language for --dir documents")
+    parser.add_argument("--batch-chunks", type=int, default=DEFAULT_BATCH_CHUNKS)
+    parser.add_argument("--chunk-chars", type=int, default=DEFAULT_CHUNK_CHARS)
+    parser.add_argument("--overlap", type=int, default=DEFAULT_OVERLAP_CHARS)
+    args = parser.parse_args()
+
+    documents = read_jsonl(args.jsonl) if args.jsonl else read_directory(args.dir, args.language)
+
+    db = SessionLocal()
+    try:
+        stats = ingest_documents(
+            db,
+            documents,
+            batch_chunks=args.batch_chunks,
+            max_chars=args.chunk_chars,
+            overlap=args.overlap
+        )
+    except Exception:
+        db.rollback()
+        raise
+    finally:
+        db.close()
+    print("ingestion:", json.dumps(stats.as_dict()))
+
+
+if __name__ == "__main__":
+    main()
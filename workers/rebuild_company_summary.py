@@ -0,0 +1,27 @@
+"""
+Rebuild company_summary from job_openings.
+
+Run after migrations/009 to populate the table, and periodically (e.g. nightly
+cron) to repair any drift from writes that bypassed the service layer.
+
+Usage:
+    python -m workers.rebuild_company_summary
+"""
+import time
+
+from core.database import SessionLocal
+from services.company_summary_service import rebuild_company_summary
+
+
+def main():
+    db = SessionLocal()
+    try:
+        start = time.perf_counter()
+        changed = rebuild_company_summary(db)
+        print(f"company_summary rows inserted/corrected: {changed} in {time.perf_counter() - start:.2f}s")
+    finally:
+        db.close()
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,33 @@
+"""
+Rebuild freelancer_stats from home_service_booking.
+
+Run after migrations/004 to populate the table, and periodically (e.g. nightly
+cron) to repair any drift from writes that bypassed the service layer.
+
+Usage:
+    python -m workers.rebuild_freelancer_stats
+    python -m workers.rebuild_freelancer_stats --freelancer-id 42
+"""
+import argparse
+import time
+
+from core.database import SessionLocal
+from services.freelancer_stats_service import rebuild_freelancer_stats
+
+
+def main():
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--freelancer-id", type=int, default=None)
+    args = parser.parse_args()
+
+    db = SessionLocal()
+    try:
+        start = time.perf_counter()
+        changed = rebuild_freelancer_stats(db, args.freelancer_id)
+        print(f"freelancer_stats rows inserted/corrected: {changed} in {time.perf_counter() - start:.2f}s")
+    finally:
+        db.close()
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,49 @@
+"""
+Run (or resume) payroll for one payroll period outside the request cycle.
+
+Progress is committed after every chunk, so the command can be interrupted and
+started again; it continues after the last committed staff member. Running it
+for a completed period regenerates only missing payslips and refreshes the
+month totals.
+
+Usage:
+    python -m workers.run_payroll --period-id 12
+    python -m workers.run_payroll --period-id 12 --payroll-month "March 2025" --chunk-size 2000
+"""
+import argparse
+import time
+
+from app.config.settings import settings
+from core.database import SessionLocal
+from services.payroll_run_service import run_payroll
+
+
+def main():
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--period-id", type=int, required=True)
+    parser.add_argument("--payroll-month", default=None)
+    parser.add_argument("--chunk-size", type=int, default=settings.PAYROLL_RUN_CHUNK_SIZE)
+    parser.add_argument("--created-by", type=int, default=None)
+    args = parser.parse_args()
+
+    start = time.perf_counter()
+
+    def progress(run):
+        print(
+            f"{run.status}: {run.processed_staff}/{run.total_staff} staff, "
+            f"{run.generated_payslips} payslips, {run.skipped_staff} skipped, "
+            f"{time.perf_counter() - start:.1f}s"
+        )
+
+    db = SessionLocal()
+    try:
+        run_payroll(db, args.period_id, args.payroll_month, args.created_by, args.chunk_size, progress)
+    except Exception as e:
+        print("PAYROLL RUN FAILED:", repr(e))
+        raise SystemExit(1)
+    finally:
+        db.close()
+
+
+if __name__ == "__main__":
+    main()